@@ -0,0 +1,145 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from powerapi.report import HWPCReport
+
+CORE_EVENTS_NAME = [
+    'CPU_CLK_THREAD_UNHALTED:REF_P',
+    'CPU_CLK_THREAD_UNHALTED:THREAD_P',
+    'INSTRUCTIONS_RETIRED',
+    'LLC_MISSES',
+    'BRANCH_MISSES',
+    'CYCLE_ACTIVITY:STALLS_TOTAL',
+    'MEM_LOAD_RETIRED:L1_MISS',
+    'MEM_LOAD_RETIRED:L2_MISS',
+]
+
+
+@dataclass
+class SyntheticTraceConfig:
+    """
+    Parameters of a synthetic HWPC trace.
+    """
+    ticks: int = 600
+    sockets: int = 1
+    cpus_per_socket: int = 8
+    targets_per_tick: int = 10
+    events_count: int = 4
+    frequency_ratios: list[float] = field(default_factory=lambda: [0.8, 1.0, 1.2])
+    frequency_weights: list[float] | None = None
+    sensor_period_ms: int = 1000
+    seed: int = 0
+
+
+class SyntheticHWPCTraceGenerator:
+    """
+    Generate a reproducible trace of HWPC reports whose RAPL measurements follow a linear model of the core events.
+    """
+
+    def __init__(self, config: SyntheticTraceConfig):
+        """
+        Initialize a new synthetic trace generator.
+        :param config: Parameters of the trace
+        """
+        if not 0 < config.events_count <= len(CORE_EVENTS_NAME):
+            raise ValueError(f'Events count must be between 1 and {len(CORE_EVENTS_NAME)}')
+
+        self.config = config
+        self.events_name = CORE_EVENTS_NAME[:config.events_count]
+        self.events_weight = [1e-6 * (i + 1) for i in range(config.events_count)]
+
+    def _gen_core_group(self, rnd: random.Random, load: float) -> tuple[dict, list[float]]:
+        """
+        Generate the core events group of a target.
+        :param rnd: Random generator
+        :param load: Load of the target (between 0 and 1)
+        :return: Core events group of the target and the sum of its events value
+        """
+        events_sum = [0.0] * len(self.events_name)
+        group = {}
+        for socket in range(self.config.sockets):
+            cpus = {}
+            for cpu in range(self.config.cpus_per_socket):
+                events = {}
+                for i, event_name in enumerate(self.events_name):
+                    value = int(rnd.random() * load * 1e6 * (i + 1))
+                    events[event_name] = value
+                    events_sum[i] += value
+                events['time_enabled'] = 1000
+                events['time_running'] = 1000
+                cpus[str(socket * self.config.cpus_per_socket + cpu)] = events
+            group[str(socket)] = cpus
+        return group, events_sum
+
+    def _gen_global_report(self, rnd: random.Random, timestamp: datetime, events_sum: list[float]) -> HWPCReport:
+        """
+        Generate the global report of a tick containing the RAPL and MSR events.
+        :param rnd: Random generator
+        :param timestamp: Timestamp of the tick
+        :param events_sum: Sum of the core events value of all targets
+        :return: Global HWPC report of the tick
+        """
+        ratio = rnd.choices(self.config.frequency_ratios, self.config.frequency_weights)[0]
+        power = 20.0 + sum(w * v for w, v in zip(self.events_weight, events_sum, strict=True)) / self.config.sockets + rnd.random()
+        rapl = {}
+        msr = {}
+        for socket in range(self.config.sockets):
+            rapl[str(socket)] = {'0': {'RAPL_ENERGY_PKG': int(power * 2**32), 'RAPL_ENERGY_DRAM': int(power / 4 * 2**32)}}
+            msr[str(socket)] = {
+                str(socket * self.config.cpus_per_socket + cpu): {'APERF': int(1000 * ratio), 'MPERF': 1000, 'TSC': 1}
+                for cpu in range(self.config.cpus_per_socket)
+            }
+        return HWPCReport(timestamp, 'sensor', 'all', {'rapl': rapl, 'msr': msr}, {})
+
+    def __iter__(self) -> Iterator[HWPCReport]:
+        """
+        Generate the HWPC reports of the trace, the reports of a tick are shuffled.
+        :return: Iterator over the HWPC reports of the trace
+        """
+        rnd = random.Random(self.config.seed)
+        begin = datetime(2024, 1, 1)
+        for tick in range(self.config.ticks):
+            timestamp = begin + timedelta(milliseconds=tick * self.config.sensor_period_ms)
+            events_sum = [0.0] * len(self.events_name)
+            reports = []
+            for target in range(self.config.targets_per_tick):
+                group, target_events_sum = self._gen_core_group(rnd, rnd.random())
+                events_sum = [a + b for a, b in zip(events_sum, target_events_sum, strict=True)]
+                reports.append(HWPCReport(timestamp, 'sensor', f'/kubepods/pod{target % 4}/container{target}', {'core': group}, {}))
+
+            reports.append(self._gen_global_report(rnd, timestamp, events_sum))
+            rnd.shuffle(reports)
+            yield from reports
@@ -0,0 +1,210 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Throughput/latency benchmarks of the SmartWatts formula.
+The HwPC report handlers are driven directly (without the actor stack) with synthetic HWPC traces, and the results
+are written as JSON to be compared across commits:
+
+    PYTHONPATH=src python -m benchmarks.run_benchmarks --output results.json
+"""
+
+import argparse
+import functools
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import subprocess
+import time
+from dataclasses import asdict
+
+import numpy as np
+from powerapi.report import HWPCReport, PowerReport, FormulaReport
+
+from smartwatts.actor import SmartWattsFormulaConfig, SmartWattsFormulaScope
+from smartwatts.handler import HwPCReportHandler
+from smartwatts.model import CPUTopology, PowerModel
+from smartwatts.replay import SmartWattsReplayEngine, ReplayPusher
+
+from .hwpc_trace import SyntheticTraceConfig, SyntheticHWPCTraceGenerator
+
+SCENARIOS = {
+    'small': SyntheticTraceConfig(sockets=1, cpus_per_socket=4, targets_per_tick=5),
+    'default': SyntheticTraceConfig(),
+    'many-targets': SyntheticTraceConfig(targets_per_tick=200),
+    'many-cpus': SyntheticTraceConfig(sockets=2, cpus_per_socket=64, targets_per_tick=20),
+    'many-events': SyntheticTraceConfig(events_count=8, targets_per_tick=20),
+    'wide-frequencies': SyntheticTraceConfig(frequency_ratios=[0.4 + 0.1 * i for i in range(30)]),
+    'skewed-frequencies': SyntheticTraceConfig(frequency_ratios=[0.8, 1.0, 1.2, 1.4, 1.6], frequency_weights=[80, 10, 5, 3, 2]),
+}
+
+
+class NullDatabase:
+    """
+    Output database discarding the saved reports.
+    """
+
+    def __init__(self):
+        self.saved_reports_count = 0
+
+    def save_many(self, reports):
+        """
+        Discard the given reports.
+        :param reports: Reports to save
+        """
+        self.saved_reports_count += len(reports)
+
+
+def timed(function, durations: list[float]):
+    """
+    Wrap a function to record the duration of each of its calls.
+    :param function: Function to wrap
+    :param durations: List where the duration (in seconds) of the calls are appended
+    :return: Wrapped function
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        begin = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            durations.append(time.perf_counter() - begin)
+
+    return wrapper
+
+
+def run_scenario(trace_config: SyntheticTraceConfig, learn_method: str) -> dict:
+    """
+    Replay a synthetic trace through the CPU formula and measure its performance.
+    :param trace_config: Parameters of the synthetic trace
+    :param learn_method: Learner used to compute the power models
+    :return: Measurements of the scenario
+    """
+    # pylint: disable=protected-access
+    reports: list[HWPCReport] = list(SyntheticHWPCTraceGenerator(trace_config))
+
+    cpu_topology = CPUTopology(400, 100, 1, 42, 100)
+    formula_config = SmartWattsFormulaConfig(SmartWattsFormulaScope.CPU, trace_config.sensor_period_ms, 'RAPL_ENERGY_PKG', 2.0, cpu_topology, 10, 60, False, 60, 'median',
+                                             learn_method=learn_method)
+    power_database = NullDatabase()
+    pushers = {'power': ReplayPusher('power', PowerReport, power_database), 'formula': ReplayPusher('formula', FormulaReport, NullDatabase())}
+    engine = SmartWattsReplayEngine({'cpu_dispatcher': formula_config}, pushers)
+
+    ticks_latency = []
+    learning_time = []
+    process_tick = HwPCReportHandler._process_tick
+    learn_power_model = PowerModel.learn_power_model
+
+    HwPCReportHandler._process_tick = timed(process_tick, ticks_latency)
+    PowerModel.learn_power_model = timed(learn_power_model, learning_time)
+    try:
+        begin = time.perf_counter()
+        engine.process(reports)
+        engine.close()
+        elapsed = time.perf_counter() - begin
+    finally:
+        HwPCReportHandler._process_tick = process_tick
+        PowerModel.learn_power_model = learn_power_model
+
+    latency_ms = np.array(ticks_latency) * 1000.0
+    return {
+        'trace': asdict(trace_config),
+        'learn_method': learn_method,
+        'reports_count': len(reports),
+        'power_reports_count': power_database.saved_reports_count,
+        'elapsed_s': elapsed,
+        'ticks_per_s': trace_config.ticks / elapsed,
+        'reports_per_s': len(reports) / elapsed,
+        'tick_latency_p50_ms': float(np.percentile(latency_ms, 50)),
+        'tick_latency_p99_ms': float(np.percentile(latency_ms, 99)),
+        'learning_time_s': sum(learning_time),
+        'learning_count': len(learning_time),
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def get_git_revision() -> str | None:
+    """
+    Retrieve the current git revision of the repository.
+    :return: Hash of the current git commit, None if it cannot be retrieved
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, check=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """
+    Run the benchmark scenarios and write their results as JSON.
+    """
+    parser = argparse.ArgumentParser(description='SmartWatts formula benchmarks')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='Scenario to run (can be repeated, all by default)')
+    parser.add_argument('--ticks', type=int, default=None, help='Override the amount of ticks of the scenarios')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic traces')
+    parser.add_argument('--learn-method', default='elasticnet', choices=['elasticnet', 'rls'], help='Learner used to compute the power models')
+    parser.add_argument('--output', default='-', help='Path of the JSON results file (stdout by default)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = []
+    # Each scenario is run in its own process to get an accurate peak RSS.
+    ctx = multiprocessing.get_context('spawn')
+    for name in args.scenario or list(SCENARIOS):
+        trace_config = SCENARIOS[name]
+        trace_config.seed = args.seed
+        if args.ticks is not None:
+            trace_config.ticks = args.ticks
+
+        with ctx.Pool(1) as pool:
+            result = pool.apply(run_scenario, (trace_config, args.learn_method))
+        result['scenario'] = name
+        results.append(result)
+        logging.warning('%s: %.1f ticks/s, p50 %.3f ms, p99 %.3f ms', name, result['ticks_per_s'], result['tick_latency_p50_ms'], result['tick_latency_p99_ms'])
+
+    output = {
+        'git_revision': get_git_revision(),
+        'python_version': platform.python_version(),
+        'numpy_version': np.__version__,
+        'results': results,
+    }
+    if args.output == '-':
+        print(json.dumps(output, indent=2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(output, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -30,9 +30,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import os
 import signal
 import sys
 from collections import OrderedDict
+from collections.abc import Callable
 from importlib.metadata import version
 
 from powerapi.backend_supervisor import BackendSupervisor
@@ -44,11 +46,13 @@ from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
 from powerapi.dispatcher import DispatcherActor, RouteTable
 from powerapi.exception import PowerAPIException, MissingArgumentException, NotAllowedArgumentValueException, FileDoesNotExistException
 from powerapi.filter import Filter
-from powerapi.report import HWPCReport
+from powerapi.report import HWPCReport, Report
 
-from smartwatts.actor import SmartWattsFormulaScope, SmartWattsFormulaConfig, SmartWattsFormulaActorFactory
+from smartwatts.actor import SmartWattsFormulaScope, SmartWattsFormulaConfig, SmartWattsCombinedFormulaConfig, SmartWattsFormulaActorFactory
 from smartwatts.cli import SmartWattsConfigValidator
+from smartwatts.dispatch import PooledHWPCDispatchRule, SensorShardFilterRule
 from smartwatts.exceptions import InvalidConfigurationParameterException
+from smartwatts.handler import setup_pusher_report_batch_handler
 from smartwatts.model import CPUTopology
 
 
@@ -62,6 +66,15 @@ def generate_smartwatts_parser() -> CommonCLIParsingManager:
     # Formula control parameters
     pm.add_argument('disable-cpu-formula', help_text='Disable CPU formula', is_flag=True, argument_type=bool, default_value=False, action=store_true)
     pm.add_argument('disable-dram-formula', help_text='Disable DRAM formula', is_flag=True, argument_type=bool, default_value=False, action=store_true)
+    pm.add_argument('pooled-formula', help_text='Host the formula instances of all the sensors in a fixed pool of formula workers', is_flag=True, argument_type=bool,
+                    default_value=False, action=store_true)
+    pm.add_argument('pooled-formula-workers', help_text='Amount of formula workers per dispatcher in pooled mode (0 for the amount of CPU cores)', argument_type=int, default_value=0)
+    pm.add_argument('combined-formula', help_text='Compute the CPU and DRAM power models in a single formula actor per socket', is_flag=True, argument_type=bool,
+                    default_value=False, action=store_true)
+
+    # Sensors sharding
+    pm.add_argument('shard-index', help_text='Index of the shard of sensors processed by this instance (starting from 0)', argument_type=int, default_value=0)
+    pm.add_argument('shard-count', help_text='Total amount of shards the sensors are split into', argument_type=int, default_value=1)
 
     # Formula RAPL reference event
     pm.add_argument('cpu-rapl-ref-event', help_text='RAPL event used as reference for the CPU power models', default_value='RAPL_ENERGY_PKG')
@@ -84,10 +97,63 @@ def generate_smartwatts_parser() -> CommonCLIParsingManager:
     pm.add_argument('learn-history-window-size', help_text='Size of the history window used to keep samples to learn from', argument_type=int, default_value=60)
     pm.add_argument('learn-error-window-size', help_text='Size of the error window used to trigger the learning of a new power model', argument_type=int, default_value=60)
     pm.add_argument('learn-error-window-method', help_text='Method used to compute the error window (supported: median, mean)', default_value='median')
+    pm.add_argument('learn-history-dtype', help_text='Data type used to store the samples history (supported: float64, float32)', default_value='float64')
+    pm.add_argument('learn-max-resident-layers', help_text='Maximum amount of frequency layers keeping their samples history (0 for unlimited, at least 4 otherwise)', argument_type=int, default_value=0)
+    pm.add_argument('learn-method', help_text='Learner used to compute the power models (supported: elasticnet, rls)', default_value='elasticnet')
+    pm.add_argument('learn-rls-forgetting-factor', help_text='Forgetting factor of the online recursive least squares learner (between 0 and 1)', argument_type=float, default_value=0.99)
+    pm.add_argument('learn-async-workers', help_text='Amount of workers used to learn the power models off the processing loop (0 to learn synchronously)', argument_type=int, default_value=0)
+
+    # Power models persistence
+    pm.add_argument('model-store-dir', help_text='Directory where the power models are periodically saved and restored from at startup (disabled when empty)', default_value='')
+    pm.add_argument('model-store-interval', help_text='Interval between two saves of the power models (in seconds)', argument_type=int, default_value=60)
+    pm.add_argument('model-store-history', help_text='Save the samples history of the power models', is_flag=True, argument_type=bool, default_value=False, action=store_true)
+
+    # Ticks reordering
+    pm.add_argument('reorder-mode', help_text='Method used to decide when a tick is complete (supported: count, event-time, wall-clock)', default_value='event-time')
+    pm.add_argument('reorder-depth', help_text='Amount of ticks buffered before processing the oldest one (count mode)', argument_type=int, default_value=5)
+    pm.add_argument('reorder-lateness', help_text='Maximum lateness of the reports of a tick (in milliseconds, 0 for 5 times the sensor reports frequency)', argument_type=int, default_value=0)
+    pm.add_argument('reorder-max-ticks', help_text='Maximum amount of buffered ticks (0 for unlimited)', argument_type=int, default_value=100)
+    pm.add_argument('reorder-adaptive-percentile', help_text='Percentile of the observed reports lateness used to size the reorder window (0 to disable)', argument_type=float, default_value=0.0)
+    pm.add_argument('reorder-min-lateness', help_text='Minimum lateness of the adaptive reorder window (in milliseconds)', argument_type=int, default_value=0)
+    pm.add_argument('reorder-max-lateness', help_text='Maximum lateness of the adaptive reorder window (in milliseconds, 0 for unlimited)', argument_type=int, default_value=0)
+
+    add_output_arguments(pm)
 
     return pm
 
 
+def add_output_arguments(pm: CommonCLIParsingManager) -> None:
+    """
+    Add the parameters of the reports output and processing metrics to the SmartWatts cli parameters parser.
+    :param pm: SmartWatts cli parameters parser
+    """
+    # Reports output
+    pm.add_argument('report-batch', help_text='Send the reports of a tick to each pusher in batch messages', is_flag=True, argument_type=bool, default_value=False, action=store_true)
+    pm.add_argument('report-batch-format', help_text='Format of the reports batch messages (supported: reports, columnar)', default_value='reports')
+    pm.add_argument('output-top-k', help_text='Maximum amount of targets reported per tick, the others are folded into an "other" target (0 for unlimited)', argument_type=int, default_value=0)
+    pm.add_argument('output-min-power', help_text='Minimum power of the reported targets, the others are folded into an "other" target (in Watt)', argument_type=float, default_value=0.0)
+    pm.add_argument('output-min-ratio', help_text='Minimum ratio of the global power of the reported targets, the others are folded into an "other" target', argument_type=float,
+                    default_value=0.0)
+    pm.add_argument('output-period', help_text='Period of the emitted power reports, averaging the power of the targets over the period (in milliseconds, 0 to emit a report per tick)',
+                    argument_type=int, default_value=0)
+    pm.add_argument('energy-counters', help_text='Attach the cumulative energy consumed by the targets (in Joule) to their power reports', is_flag=True, argument_type=bool,
+                    default_value=False, action=store_true)
+    pm.add_argument('energy-counters-interval', help_text='Minimum interval between two power reports of a target carrying its energy counter (in milliseconds, 0 for every report)',
+                    argument_type=int, default_value=0)
+    pm.add_argument('formula-report-mode', help_text='When the formula reports are emitted (supported: always, on-change, interval)', default_value='always')
+    pm.add_argument('formula-report-interval', help_text='Amount of ticks between two formula reports (interval mode)', argument_type=int, default_value=10)
+    pm.add_argument('formula-report-lag', help_text='Add the processing lag of the tick (lag_ms) to the metadata of the formula reports', is_flag=True, argument_type=bool,
+                    default_value=False, action=store_true)
+    pm.add_argument('lag-naive-timestamps', help_text='Timezone of the naive timestamps of the reports used to compute the processing lag (supported: local, utc)',
+                    default_value='local')
+    pm.add_argument('rollup-depths', help_text='Comma separated depths of the targets hierarchy (cgroup path) at which their power is aggregated (disabled when empty)', default_value='')
+
+    # Processing metrics
+    pm.add_argument('metrics-output', help_text='Output of the processing metrics (supported: none, log, textfile)', default_value='none')
+    pm.add_argument('metrics-dir', help_text='Directory where the Prometheus textfiles of the metrics are written (textfile output)', default_value='')
+    pm.add_argument('metrics-interval', help_text='Interval between two exports of the metrics (in seconds)', argument_type=int, default_value=10)
+
+
 def generate_formula_configuration(config: dict, cpu_topology: CPUTopology, scope: SmartWattsFormulaScope) -> SmartWattsFormulaConfig:
     """
     Generate a SmartWatts actor configuration.
@@ -100,7 +166,75 @@ def generate_formula_configuration(config: dict, cpu_topology: CPUTopology, scop
     real_time_mode = config['stream']
     error_window_size = config['learn-error-window-size']
     error_window_method = config['learn-error-window-method']
-    return SmartWattsFormulaConfig(scope, reports_freq, rapl_event, error_threshold, cpu_topology, min_samples, history_window_size, real_time_mode, error_window_size, error_window_method)
+    history_dtype = config['learn-history-dtype']
+    max_resident_layers = config['learn-max-resident-layers']
+    learn_async_workers = config['learn-async-workers']
+    learn_method = config['learn-method']
+    learn_forgetting_factor = config['learn-rls-forgetting-factor']
+    model_store_dir = config['model-store-dir']
+    model_store_interval = config['model-store-interval']
+    model_store_history = config['model-store-history']
+    reorder_mode = config['reorder-mode']
+    reorder_depth = config['reorder-depth']
+    reorder_lateness = config['reorder-lateness']
+    reorder_max_ticks = config['reorder-max-ticks']
+    reorder_adaptive_percentile = config['reorder-adaptive-percentile']
+    reorder_min_lateness = config['reorder-min-lateness']
+    reorder_max_lateness = config['reorder-max-lateness']
+    report_batch = config['report-batch']
+    report_batch_format = config['report-batch-format']
+    output_top_k = config['output-top-k']
+    output_min_power = config['output-min-power']
+    output_min_ratio = config['output-min-ratio']
+    output_period = config['output-period']
+    energy_counters = config['energy-counters']
+    energy_counters_interval = config['energy-counters-interval']
+    rollup_depths = [int(depth) for depth in config['rollup-depths'].split(',') if depth]
+    formula_report_mode = config['formula-report-mode']
+    formula_report_interval = config['formula-report-interval']
+    metrics_output = config['metrics-output']
+    metrics_dir = config['metrics-dir']
+    metrics_interval = config['metrics-interval']
+    formula_report_lag = config['formula-report-lag']
+    lag_naive_timestamps = config['lag-naive-timestamps']
+    return SmartWattsFormulaConfig(scope, reports_freq, rapl_event, error_threshold, cpu_topology, min_samples, history_window_size, real_time_mode, error_window_size, error_window_method,
+                                   history_dtype, max_resident_layers, learn_async_workers, learn_method, learn_forgetting_factor,
+                                   model_store_dir, model_store_interval, model_store_history,
+                                   reorder_mode, reorder_depth, reorder_lateness, reorder_max_ticks,
+                                   reorder_adaptive_percentile, reorder_min_lateness, reorder_max_lateness, report_batch, report_batch_format,
+                                   output_top_k, output_min_power, output_min_ratio, output_period,
+                                   energy_counters, energy_counters_interval, rollup_depths,
+                                   formula_report_mode, formula_report_interval, metrics_output, metrics_dir, metrics_interval,
+                                   formula_report_lag, lag_naive_timestamps)
+
+
+def generate_route_table(config: dict) -> RouteTable:
+    """
+    Generate the table used by the dispatchers to route the reports to the formula actors.
+    :param config: Global configuration
+    :return: Reports routing table
+    """
+    route_table = RouteTable()
+    if config['pooled-formula']:
+        workers_count = config['pooled-formula-workers'] or os.cpu_count() or 1
+        logging.info('Formula instances are POOLED in %d workers per dispatcher', workers_count)
+        route_table.add_dispatch_rule(HWPCReport, PooledHWPCDispatchRule(workers_count, primary=True))
+    else:
+        route_table.add_dispatch_rule(HWPCReport, HWPCDispatchRule(HWPCDepthLevel.SOCKET, primary=True))
+
+    return route_table
+
+
+def generate_report_filter_rule(config: dict) -> Callable[[Report], bool]:
+    """
+    Generate the rule used to filter the reports sent to the formula dispatchers.
+    :param config: Global configuration
+    :return: Filter rule accepting the reports to process
+    """
+    if config['shard-count'] > 1:
+        return SensorShardFilterRule(config['shard-index'], config['shard-count'])
+
+    return lambda msg: True
 
 
 def setup_cpu_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers) -> DispatcherActor:
@@ -114,9 +248,9 @@ def setup_cpu_formula_dispatcher(config, route_table, report_filter, cpu_topolog
     :return: Initialized CPU dispatcher actor
     """
     formula_config = generate_formula_configuration(config, cpu_topology, SmartWattsFormulaScope.CPU)
-    formula_factory = SmartWattsFormulaActorFactory(formula_config)
+    formula_factory = SmartWattsFormulaActorFactory(formula_config, config['pooled-formula'])
     cpu_dispatcher = DispatcherActor('cpu_dispatcher', formula_factory, pushers, route_table)
-    report_filter.filter(lambda msg: True, cpu_dispatcher)
+    report_filter.filter(generate_report_filter_rule(config), cpu_dispatcher)
     return cpu_dispatcher
 
 
@@ -131,21 +265,40 @@ def setup_dram_formula_dispatcher(config, route_table, report_filter, cpu_topolo
     :return: Initialized DRAM dispatcher actor
     """
     formula_config = generate_formula_configuration(config, cpu_topology, SmartWattsFormulaScope.DRAM)
-    formula_factory = SmartWattsFormulaActorFactory(formula_config)
+    formula_factory = SmartWattsFormulaActorFactory(formula_config, config['pooled-formula'])
     dram_dispatcher = DispatcherActor('dram_dispatcher', formula_factory, pushers, route_table)
-    report_filter.filter(lambda msg: True, dram_dispatcher)
+    report_filter.filter(generate_report_filter_rule(config), dram_dispatcher)
     return dram_dispatcher
 
 
+def setup_combined_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers) -> DispatcherActor:
+    """
+    Setup combined CPU and DRAM formula actor.
+    :param config: Global configuration
+    :param route_table: Reports routing table
+    :param report_filter: Reports filter
+    :param cpu_topology: CPU topology information
+    :param pushers: Reports pushers
+    :return: Initialized combined dispatcher actor
+    """
+    cpu_formula_config = generate_formula_configuration(config, cpu_topology, SmartWattsFormulaScope.CPU)
+    dram_formula_config = generate_formula_configuration(config, cpu_topology, SmartWattsFormulaScope.DRAM)
+    formula_factory = SmartWattsFormulaActorFactory(SmartWattsCombinedFormulaConfig([cpu_formula_config, dram_formula_config]), config['pooled-formula'])
+    combined_dispatcher = DispatcherActor('combined_dispatcher', formula_factory, pushers, route_table)
+    report_filter.filter(generate_report_filter_rule(config), combined_dispatcher)
+    return combined_dispatcher
+
+
 def run_smartwatts(config) -> None:
     """
     Run PowerAPI with the SmartWatts formula.
     :param config: CLI arguments namespace
     """
     logging.info('SmartWatts version %s based on PowerAPI version %s', version('smartwatts'), version('powerapi'))
+    if config['shard-count'] > 1:
+        logging.info('Processing the sensors of shard %d/%d', config['shard-index'], config['shard-count'])
 
-    route_table = RouteTable()
-    route_table.add_dispatch_rule(HWPCReport, HWPCDispatchRule(HWPCDepthLevel.SOCKET, primary=True))
+    route_table = generate_route_table(config)
 
     cpu_topology = CPUTopology(config['cpu-tdp'], config['cpu-base-clock'], 1, int(config['cpu-base-freq'] / config['cpu-base-clock']), 100)
 
@@ -153,18 +306,29 @@ def run_smartwatts(config) -> None:
     pullers = PullerGenerator(report_filter).generate(config)
 
     pushers = PusherGenerator().generate(config)
+    if config['report-batch']:
+        for pusher in pushers.values():
+            setup_pusher_report_batch_handler(pusher)
 
     dispatchers = {}
 
+    combined_formula = config['combined-formula'] and not config['disable-cpu-formula'] and not config['disable-dram-formula']
+
     logging.info('CPU formula is %s', 'DISABLED' if config['disable-cpu-formula'] else 'ENABLED')
     if not config['disable-cpu-formula']:
         logging.info('CPU formula parameters: RAPL_REF=%s ERROR_THRESHOLD=%sW', config['cpu-rapl-ref-event'], config['cpu-error-threshold'])
-        dispatchers['cpu'] = setup_cpu_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers)
+        if not combined_formula:
+            dispatchers['cpu'] = setup_cpu_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers)
 
     logging.info('DRAM formula is %s', 'DISABLED' if config['disable-dram-formula'] else 'ENABLED')
     if not config['disable-dram-formula']:
         logging.info('DRAM formula parameters: RAPL_REF=%s ERROR_THRESHOLD=%sW', config['dram-rapl-ref-event'], config['dram-error-threshold'])
-        dispatchers['dram'] = setup_dram_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers)
+        if not combined_formula:
+            dispatchers['dram'] = setup_dram_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers)
+
+    if combined_formula:
+        logging.info('CPU and DRAM formulas are computed by a COMBINED formula')
+        dispatchers['combined'] = setup_combined_formula_dispatcher(config, route_table, report_filter, cpu_topology, pushers)
 
     if 'pre-processor' in config:
         pre_processors = PreProcessorGenerator().generate(config)
@@ -198,12 +362,13 @@ def run_smartwatts(config) -> None:
     logging.info('SmartWatts is shutting down...')
 
 
-if __name__ == "__main__":
-    args_parser = generate_smartwatts_parser()
-    args = args_parser.parse()
-
+def validate_smartwatts_configuration(config: dict) -> None:
+    """
+    Validate the SmartWatts configuration, exit when it is invalid.
+    :param config: CLI arguments namespace
+    """
     try:
-        SmartWattsConfigValidator().validate(args)
+        SmartWattsConfigValidator().validate(config)
     except InvalidConfigurationParameterException as exn:
         logging.error('Invalid configuration: %s', exn)
         sys.exit(1)
@@ -217,6 +382,13 @@ if __name__ == "__main__":
         logging.error('File does not exist: %s', exn)
         sys.exit(1)
 
+
+if __name__ == "__main__":
+    args_parser = generate_smartwatts_parser()
+    args = args_parser.parse()
+
+    validate_smartwatts_configuration(args)
+
     LOGGING_LEVEL = logging.DEBUG if args['verbose'] else logging.INFO
     LOGGING_FORMAT = '%(asctime)s - %(process)d - %(processName)s - %(name)s - %(levelname)s - %(message)s'
     logging.basicConfig(level=LOGGING_LEVEL, format=LOGGING_FORMAT)
@@ -29,14 +29,18 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .actor import SmartWattsFormulaActor, SmartWattsFormulaState
-from .config import SmartWattsFormulaConfig, SmartWattsFormulaScope
+from .actor import SmartWattsFormulaActor, SmartWattsFormulaState, SmartWattsPooledFormulaActor, SmartWattsPooledFormulaState, get_hwpc_report_handler_class
+from .config import SmartWattsFormulaConfig, SmartWattsCombinedFormulaConfig, SmartWattsFormulaScope
 from .factory import SmartWattsFormulaActorFactory
 
 __all__ = [
+    'SmartWattsCombinedFormulaConfig',
     'SmartWattsFormulaActor',
     'SmartWattsFormulaActorFactory',
     'SmartWattsFormulaConfig',
     'SmartWattsFormulaScope',
-    'SmartWattsFormulaState'
+    'SmartWattsFormulaState',
+    'SmartWattsPooledFormulaActor',
+    'SmartWattsPooledFormulaState',
+    'get_hwpc_report_handler_class'
 ]
@@ -33,13 +33,25 @@ import logging
 import re
 
 from powerapi.formula import FormulaActor, FormulaState
-from powerapi.handler import StartHandler, PoisonPillMessageHandler
+from powerapi.handler import StartHandler
 from powerapi.message import PoisonPillMessage, StartMessage
 from powerapi.pusher import PusherActor
 from powerapi.report import HWPCReport
 
-from smartwatts.handler import HwPCReportHandler
-from .config import SmartWattsFormulaConfig
+from smartwatts.handler import HwPCReportHandler, CombinedHwPCReportHandler, MultiplexedHwPCReportHandler, FormulaPoisonPillMessageHandler, TickHandler
+from .config import SmartWattsFormulaConfig, SmartWattsCombinedFormulaConfig
+
+
+def get_hwpc_report_handler_class(config: SmartWattsFormulaConfig | SmartWattsCombinedFormulaConfig) -> type[TickHandler]:
+    """
+    Get the class of the HwPC reports handler able to process the given formula configuration.
+    :param config: Configuration of the formula
+    :return: Class of the HwPC reports handler
+    """
+    if isinstance(config, SmartWattsCombinedFormulaConfig):
+        return CombinedHwPCReportHandler
+
+    return HwPCReportHandler
 
 
 class SmartWattsFormulaState(FormulaState):
@@ -68,7 +80,7 @@ class SmartWattsFormulaActor(FormulaActor):
     This actor handle the reports for the SmartWatts formula.
     """
 
-    def __init__(self, name, pushers: dict[str, PusherActor], config: SmartWattsFormulaConfig, level_logger=logging.WARNING, timeout=None):
+    def __init__(self, name, pushers: dict[str, PusherActor], config: SmartWattsFormulaConfig | SmartWattsCombinedFormulaConfig, level_logger=logging.WARNING, timeout=None):
         super().__init__(name, pushers, level_logger, timeout)
         self.state = SmartWattsFormulaState(self, pushers, self.formula_metadata, config)
 
@@ -78,6 +90,44 @@ class SmartWattsFormulaActor(FormulaActor):
 
     def setup(self):
         super().setup()
+        hwpc_report_handler = get_hwpc_report_handler_class(self.state.config)(self.state)
+        self.add_handler(StartMessage, StartHandler(self.state))
+        self.add_handler(PoisonPillMessage, FormulaPoisonPillMessageHandler(self.state, hwpc_report_handler))
+        self.add_handler(HWPCReport, hwpc_report_handler)
+
+
+class SmartWattsPooledFormulaState(FormulaState):
+    """
+    State of the SmartWatts pooled formula actor.
+    """
+
+    def __init__(self, actor, pushers, metadata, config):
+        """
+        Initialize a new pooled formula state object.
+        :param actor: Actor of the formula worker
+        :param pushers: Dictionary of available pushers
+        :param config: Configuration of the formula
+        """
+        FormulaState.__init__(self, actor, pushers, metadata)
+        self.config = config
+
+        m = re.search(r'^\(\'(.*)\', \'(.*)\'\)$', actor.name)
+        self.dispatcher = m.group(1)
+        self.worker = m.group(2)
+
+
+class SmartWattsPooledFormulaActor(FormulaActor):
+    """
+    This actor is a formula worker hosting the SmartWatts formula instances of many sensors and sockets.
+    """
+
+    def __init__(self, name, pushers: dict[str, PusherActor], config: SmartWattsFormulaConfig | SmartWattsCombinedFormulaConfig, level_logger=logging.WARNING, timeout=None):
+        super().__init__(name, pushers, level_logger, timeout)
+        self.state = SmartWattsPooledFormulaState(self, pushers, self.formula_metadata, config)
+
+    def setup(self):
+        super().setup()
+        hwpc_report_handler = MultiplexedHwPCReportHandler(self.state, get_hwpc_report_handler_class(self.state.config))
         self.add_handler(StartMessage, StartHandler(self.state))
-        self.add_handler(PoisonPillMessage, PoisonPillMessageHandler(self.state))
-        self.add_handler(HWPCReport, HwPCReportHandler(self.state))
+        self.add_handler(PoisonPillMessage, FormulaPoisonPillMessageHandler(self.state, hwpc_report_handler))
+        self.add_handler(HWPCReport, hwpc_report_handler)
@@ -46,7 +46,16 @@ class SmartWattsFormulaConfig:
     """
 
     def __init__(self, scope, reports_frequency, rapl_event, error_threshold, cpu_topology, min_samples_required,
-                 history_window_size, real_time_mode, error_window_size, error_window_method):
+                 history_window_size, real_time_mode, error_window_size, error_window_method, history_dtype='float64',
+                 max_resident_layers=0, learn_async_workers=0, learn_method='elasticnet', learn_forgetting_factor=0.99,
+                 model_store_dir='', model_store_interval=60, model_store_history=False,
+                 reorder_mode='event-time', reorder_depth=5, reorder_lateness=0, reorder_max_ticks=100,
+                 reorder_adaptive_percentile=0.0, reorder_min_lateness=0, reorder_max_lateness=0, report_batch=False,
+                 report_batch_format='reports', output_top_k=0, output_min_power=0.0, output_min_ratio=0.0,
+                 output_period=0, energy_counters=False, energy_counters_interval=0,
+                 rollup_depths=None, formula_report_mode='always', formula_report_interval=10,
+                 metrics_output='none', metrics_dir='', metrics_interval=10, formula_report_lag=False,
+                 lag_naive_timestamps='local'):
         """
         Initialize a new formula config object.
         :param scope: Scope of the formula
@@ -58,6 +67,37 @@ class SmartWattsFormulaConfig:
         :param history_window_size: Size of the history window used to keep samples to learn from
         :param real_time_mode: Enable real time mode
         :param error_window_method: Method used to compute the error value
+        :param history_dtype: Data type used to store the samples history (float64 or float32)
+        :param max_resident_layers: Maximum amount of frequency layers keeping their history (0 for unlimited)
+        :param learn_async_workers: Amount of workers used to learn the power models asynchronously (0 to learn synchronously)
+        :param learn_method: Learner used to compute the power models (elasticnet or rls)
+        :param learn_forgetting_factor: Forgetting factor of the online (rls) learner
+        :param model_store_dir: Directory where the power models snapshots are stored (empty to disable)
+        :param model_store_interval: Interval between two power models snapshots (in seconds)
+        :param model_store_history: Store the samples history of the layers in the power models snapshots
+        :param reorder_mode: Method used to decide when a tick is complete (count, event-time, wall-clock)
+        :param reorder_depth: Amount of ticks buffered before processing the oldest one (count mode)
+        :param reorder_lateness: Maximum lateness of the reports of a tick in milliseconds, 0 for 5 times the reports frequency (event-time and wall-clock modes)
+        :param reorder_max_ticks: Maximum amount of buffered ticks (0 for unlimited)
+        :param reorder_adaptive_percentile: Percentile of the observed reports lateness used to size the reorder window (0 to disable)
+        :param reorder_min_lateness: Minimum lateness of the adaptive reorder window (in milliseconds)
+        :param reorder_max_lateness: Maximum lateness of the adaptive reorder window (in milliseconds, 0 for unlimited)
+        :param report_batch: Send the reports of a tick to each pusher in batch messages
+        :param report_batch_format: Format of the batch messages (reports, or columnar to group the power reports values in arrays)
+        :param output_top_k: Maximum amount of targets reported per tick, the others are folded into an 'other' target (0 for unlimited)
+        :param output_min_power: Minimum power of the reported targets, the others are folded into an 'other' target (in Watt)
+        :param output_min_ratio: Minimum ratio of the global power of the reported targets, the others are folded into an 'other' target
+        :param output_period: Period of the emitted power reports, averaging the power of the targets over the period (in milliseconds, 0 to emit a report per tick)
+        :param energy_counters: Attach the cumulative energy consumed by the targets (in Joule) to their power reports
+        :param energy_counters_interval: Minimum interval between two power reports of a target carrying its energy counter (in milliseconds, 0 for every report)
+        :param rollup_depths: Depths of the hierarchy of the targets name (cgroup path) at which their power is aggregated (empty to disable)
+        :param formula_report_mode: When the formula reports are emitted (always, on-change of the power model used, or at a ticks interval)
+        :param formula_report_interval: Amount of ticks between two formula reports (interval mode)
+        :param metrics_output: Output of the processing metrics (none, log or textfile)
+        :param metrics_dir: Directory where the Prometheus textfiles of the metrics are written (textfile output)
+        :param metrics_interval: Interval between two exports of the metrics (in seconds)
+        :param formula_report_lag: Add the processing lag of the tick (lag_ms) to the metadata of the formula reports
+        :param lag_naive_timestamps: Timezone of the naive timestamps of the reports, used to compute the processing lag (local or utc)
         """
         self.scope = scope
         self.reports_frequency = reports_frequency
@@ -69,3 +109,47 @@ class SmartWattsFormulaConfig:
         self.real_time_mode = real_time_mode
         self.error_window_size = error_window_size
         self.error_window_method = error_window_method
+        self.history_dtype = history_dtype
+        self.max_resident_layers = max_resident_layers
+        self.learn_async_workers = learn_async_workers
+        self.learn_method = learn_method
+        self.learn_forgetting_factor = learn_forgetting_factor
+        self.model_store_dir = model_store_dir
+        self.model_store_interval = model_store_interval
+        self.model_store_history = model_store_history
+        self.reorder_mode = reorder_mode
+        self.reorder_depth = reorder_depth
+        self.reorder_lateness = reorder_lateness
+        self.reorder_max_ticks = reorder_max_ticks
+        self.reorder_adaptive_percentile = reorder_adaptive_percentile
+        self.reorder_min_lateness = reorder_min_lateness
+        self.reorder_max_lateness = reorder_max_lateness
+        self.report_batch = report_batch
+        self.report_batch_format = report_batch_format
+        self.output_top_k = output_top_k
+        self.output_min_power = output_min_power
+        self.output_min_ratio = output_min_ratio
+        self.output_period = output_period
+        self.energy_counters = energy_counters
+        self.energy_counters_interval = energy_counters_interval
+        self.rollup_depths = rollup_depths if rollup_depths is not None else []
+        self.formula_report_mode = formula_report_mode
+        self.formula_report_interval = formula_report_interval
+        self.metrics_output = metrics_output
+        self.metrics_dir = metrics_dir
+        self.metrics_interval = metrics_interval
+        self.formula_report_lag = formula_report_lag
+        self.lag_naive_timestamps = lag_naive_timestamps
+
+
+class SmartWattsCombinedFormulaConfig:
+    """
+    Config of the SmartWatts formula computing the power models of several scopes in a single actor.
+    """
+
+    def __init__(self, scopes_config: list[SmartWattsFormulaConfig]):
+        """
+        Initialize a new combined formula config object.
+        :param scopes_config: Config of each scope, the first one is used to reorder the ticks
+        """
+        self.scopes_config = scopes_config
@@ -31,8 +31,8 @@
 
 from powerapi.pusher import PusherActor
 
-from .actor import SmartWattsFormulaActor
-from .config import SmartWattsFormulaConfig
+from .actor import SmartWattsFormulaActor, SmartWattsPooledFormulaActor
+from .config import SmartWattsFormulaConfig, SmartWattsCombinedFormulaConfig
 
 
 class SmartWattsFormulaActorFactory:
@@ -40,17 +40,23 @@ class SmartWattsFormulaActorFactory:
     Factory to create SmartWatts formula actors.
     """
 
-    def __init__(self, actor_config: SmartWattsFormulaConfig):
+    def __init__(self, actor_config: SmartWattsFormulaConfig | SmartWattsCombinedFormulaConfig, pooled: bool = False):
         """
         Initialize a new SmartWatts formula factory.
+        :param actor_config: Configuration of the formula
+        :param pooled: Whether to create formula workers hosting many formula instances
         """
         self.actor_config = actor_config
+        self.pooled = pooled
 
-    def __call__(self, name: str, pushers: dict[str, PusherActor]) -> SmartWattsFormulaActor:
+    def __call__(self, name: str, pushers: dict[str, PusherActor]) -> SmartWattsFormulaActor | SmartWattsPooledFormulaActor:
         """
         Create a new SmartWatts formula actor.
         :param name: Name of the actor
         :param pushers: Dictionary of available pushers
         :return: A new SmartWatts formula actor
         """
+        if self.pooled:
+            return SmartWattsPooledFormulaActor(name, pushers, self.actor_config)
+
         return SmartWattsFormulaActor(name, pushers, self.actor_config)
@@ -32,6 +32,10 @@
 from powerapi.cli import ConfigValidator
 
 from smartwatts.exceptions import InvalidConfigurationParameterException
+from smartwatts.metrics import METRICS_OUTPUTS
+
+# below this amount of resident layers, the histories of the layers visited in turn are constantly released and relearned
+MIN_RESIDENT_LAYERS = 4
 
 
 class SmartWattsConfigValidator(ConfigValidator):
@@ -40,7 +44,7 @@ class SmartWattsConfigValidator(ConfigValidator):
     """
 
     @staticmethod
-    def validate(config: dict):
+    def validate(config: dict):  # pylint: disable=too-many-branches
 
         ConfigValidator.validate(config)
 
@@ -64,3 +68,89 @@ class SmartWattsConfigValidator(ConfigValidator):
 
         if config['learn-error-window-method'] not in ['mean', 'median']:
             raise InvalidConfigurationParameterException('Error window method is not supported')
+
+        if config['learn-max-resident-layers'] < 0:
+            raise InvalidConfigurationParameterException('Maximum amount of resident frequency layers must be positive')
+
+        if 0 < config['learn-max-resident-layers'] < MIN_RESIDENT_LAYERS:
+            raise InvalidConfigurationParameterException(f'Maximum amount of resident frequency layers must be 0 (unlimited) or at least {MIN_RESIDENT_LAYERS}')
+
+        if config['learn-method'] not in ['elasticnet', 'rls']:
+            raise InvalidConfigurationParameterException('Power model learning method is not supported')
+
+        if not 0.0 < config['learn-rls-forgetting-factor'] <= 1.0:
+            raise InvalidConfigurationParameterException('Forgetting factor of the recursive least squares learner must be in ]0, 1]')
+
+        if config['learn-async-workers'] < 0:
+            raise InvalidConfigurationParameterException('Amount of asynchronous learning workers must be positive')
+
+        if config['learn-history-dtype'] not in ['float64', 'float32']:
+            raise InvalidConfigurationParameterException('History data type is not supported')
+
+        if config['model-store-interval'] <= 0:
+            raise InvalidConfigurationParameterException('Power models store interval must be strictly positive')
+
+        if config['reorder-mode'] not in ['count', 'event-time', 'wall-clock']:
+            raise InvalidConfigurationParameterException('Reorder mode is not supported')
+
+        if config['reorder-depth'] < 0 or config['reorder-lateness'] < 0 or config['reorder-max-ticks'] < 0:
+            raise InvalidConfigurationParameterException('Reorder buffer parameters must be positive')
+
+        if not 0.0 <= config['reorder-adaptive-percentile'] <= 100.0:
+            raise InvalidConfigurationParameterException('Reorder adaptive percentile must be between 0 and 100')
+
+        if config['reorder-adaptive-percentile'] > 0 and config['reorder-mode'] == 'count':
+            raise InvalidConfigurationParameterException('Adaptive reorder window is not supported in count mode')
+
+        if config['reorder-min-lateness'] < 0 or config['reorder-max-lateness'] < 0:
+            raise InvalidConfigurationParameterException('Reorder lateness bounds must be positive')
+
+        if config['pooled-formula-workers'] < 0:
+            raise InvalidConfigurationParameterException('Amount of pooled formula workers must be positive')
+
+        if config['shard-count'] < 1 or not 0 <= config['shard-index'] < config['shard-count']:
+            raise InvalidConfigurationParameterException('Shard index must be between 0 and the amount of shards')
+
+        SmartWattsConfigValidator.validate_output(config)
+
+    @staticmethod
+    def validate_output(config: dict):
+        """
+        Check the parameters of the reports output stage.
+        :param config: Configuration to check
+        """
+        if config['report-batch-format'] not in ['reports', 'columnar']:
+            raise InvalidConfigurationParameterException('Report batch format is not supported')
+
+        if config['output-top-k'] < 0 or config['output-min-power'] < 0:
+            raise InvalidConfigurationParameterException('Output reduction parameters must be positive')
+
+        if not 0 <= config['output-min-ratio'] <= 1:
+            raise InvalidConfigurationParameterException('Output minimum ratio must be between 0 and 1')
+
+        if config['output-period'] < 0 or (config['output-period'] > 0 and config['output-period'] % max(config['sensor-reports-frequency'], 1) != 0):
+            raise InvalidConfigurationParameterException('Output period must be a positive multiple of the sensor reports frequency')
+
+        if config['energy-counters-interval'] < 0:
+            raise InvalidConfigurationParameterException('Energy counters interval must be positive')
+
+        if not all(depth.isdigit() and int(depth) > 0 for depth in config['rollup-depths'].split(',') if depth):
+            raise InvalidConfigurationParameterException('Rollup depths must be a comma separated list of positive integers')
+
+        if config['formula-report-mode'] not in ['always', 'on-change', 'interval']:
+            raise InvalidConfigurationParameterException('Formula report mode is not supported')
+
+        if config['formula-report-interval'] < 1:
+            raise InvalidConfigurationParameterException('Formula report interval must be greater than 0')
+
+        if config['lag-naive-timestamps'] not in ['local', 'utc']:
+            raise InvalidConfigurationParameterException('Timezone of the naive timestamps is not supported')
+
+        if config['metrics-output'] not in METRICS_OUTPUTS:
+            raise InvalidConfigurationParameterException('Metrics output is not supported')
+
+        if config['metrics-output'] == 'textfile' and not config['metrics-dir']:
+            raise InvalidConfigurationParameterException('Metrics directory is required by the textfile output')
+
+        if config['metrics-interval'] <= 0:
+            raise InvalidConfigurationParameterException('Metrics interval must be greater than 0')
@@ -0,0 +1,63 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import hashlib
+
+
+def stable_hash(key: str) -> int:
+    """
+    Compute a 64-bit hash of the given key that is stable across processes and Python versions.
+    :param key: Key to hash
+    :return: 64-bit unsigned hash of the key
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def jump_consistent_hash(key: str, buckets_count: int) -> int:
+    """
+    Assign the given key to a bucket using the Jump Consistent Hash algorithm (Lamping and Veach, 2014).
+    When the amount of buckets grows from n to n+1, only 1/(n+1) of the keys are moved to the new bucket.
+    :param key: Key to assign
+    :param buckets_count: Amount of buckets
+    :return: Index of the bucket of the key, between 0 and buckets_count - 1
+    """
+    if buckets_count <= 0:
+        raise ValueError('Buckets count must be strictly positive')
+
+    key_hash = stable_hash(key)
+    bucket = -1
+    next_bucket = 0
+    while next_bucket < buckets_count:
+        bucket = next_bucket
+        key_hash = (key_hash * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        next_bucket = int((bucket + 1) * ((1 << 31) / ((key_hash >> 33) + 1)))
+
+    return bucket
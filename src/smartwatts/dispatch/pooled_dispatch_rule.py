@@ -0,0 +1,64 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from powerapi.dispatch_rule import DispatchRule
+from powerapi.report import HWPCReport
+
+from .consistent_hash import jump_consistent_hash
+
+
+class PooledHWPCDispatchRule(DispatchRule):
+    """
+    Dispatch rule assigning the HWPC reports to a fixed pool of formula workers according to their sensor.
+    All the reports of a sensor are sent to the same worker, that hosts the formula instances of its sockets.
+    """
+
+    def __init__(self, workers_count: int, primary: bool = False):
+        """
+        Initialize a new pooled dispatch rule.
+        :param workers_count: Amount of formula workers
+        :param primary: Whether the rule is the primary dispatch rule
+        """
+        DispatchRule.__init__(self, primary, ['worker'])
+        self.workers_count = workers_count
+        self._workers_cache: dict[str, list[tuple[str]]] = {}
+
+    def get_formula_id(self, report: HWPCReport) -> list[tuple[str]]:
+        """
+        Compute the identifier of the formula worker of the given report.
+        :param report: HWPC report to dispatch
+        :return: List containing the identifier of the formula worker of the report
+        """
+        formula_id = self._workers_cache.get(report.sensor)
+        if formula_id is None:
+            formula_id = self._workers_cache[report.sensor] = [(str(jump_consistent_hash(report.sensor, self.workers_count)),)]
+
+        return formula_id
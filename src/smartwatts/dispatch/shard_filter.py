@@ -0,0 +1,67 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from powerapi.report import Report
+
+from .consistent_hash import jump_consistent_hash
+
+
+class SensorShardFilterRule:
+    """
+    Report filter rule accepting only the reports of the sensors assigned to a shard.
+    The sensors are assigned to the shards with a consistent hash of their name, so that several SmartWatts instances
+    reading the same input can each process a disjoint slice of the sensors.
+    """
+
+    def __init__(self, shard_index: int, shard_count: int):
+        """
+        Initialize a new sensor shard filter rule.
+        :param shard_index: Index of the shard processed by this instance (starting from 0)
+        :param shard_count: Total amount of shards
+        """
+        if not 0 <= shard_index < shard_count:
+            raise ValueError('Shard index must be between 0 and the amount of shards')
+
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self._sensors_cache: dict[str, bool] = {}
+
+    def __call__(self, report: Report) -> bool:
+        """
+        Check if the given report belongs to the shard.
+        :param report: Report to check
+        :return: True if the sensor of the report is assigned to the shard, False otherwise
+        """
+        accepted = self._sensors_cache.get(report.sensor)
+        if accepted is None:
+            accepted = self._sensors_cache[report.sensor] = jump_consistent_hash(report.sensor, self.shard_count) == self.shard_index
+
+        return accepted
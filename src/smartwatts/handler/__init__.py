@@ -29,8 +29,35 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from .combined_hwpc_report import CombinedHwPCReportHandler
+from .energy_counters import EnergyCounters
 from .hwpc_report import HwPCReportHandler
+from .multiplexed_hwpc_report import FormulaInstanceState, MultiplexedHwPCReportHandler
+from .poison_pill import FormulaPoisonPillMessageHandler
+from .power_reports_downsampler import PowerReportsDownsampler
+from .processing_lag import ProcessingLagTracker
+from .report_batch import ColumnarPowerReportBatch, ReportBatch, ReportBatchHandler, gen_report_batches, setup_pusher_report_batch_handler
+from .targets_power_reducer import TargetsPowerReducer
+from .targets_power_rollup import TargetsPowerRollup
+from .tick_handler import TickHandler
+from .tick_reorder_buffer import TickReorderBuffer
 
 __all__ = [
-    'HwPCReportHandler'
+    'ColumnarPowerReportBatch',
+    'CombinedHwPCReportHandler',
+    'EnergyCounters',
+    'FormulaInstanceState',
+    'FormulaPoisonPillMessageHandler',
+    'HwPCReportHandler',
+    'MultiplexedHwPCReportHandler',
+    'PowerReportsDownsampler',
+    'ProcessingLagTracker',
+    'ReportBatch',
+    'ReportBatchHandler',
+    'TargetsPowerReducer',
+    'TargetsPowerRollup',
+    'TickHandler',
+    'TickReorderBuffer',
+    'gen_report_batches',
+    'setup_pusher_report_batch_handler'
 ]
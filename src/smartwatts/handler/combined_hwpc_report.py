@@ -0,0 +1,102 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import datetime
+
+from powerapi.report import Report, HWPCReport
+
+from .hwpc_report import HwPCReportHandler
+from .multiplexed_hwpc_report import FormulaInstanceState
+from .tick_handler import TickHandler
+
+
+class CombinedHwPCReportHandler(TickHandler):
+    """
+    HwPC reports handler computing the power models of several scopes (CPU and DRAM) in a single pass.
+    The ticks are reordered once, and the package frequency and events matrix of each tick are computed once and shared
+    by the power models of every scope.
+    """
+
+    def __init__(self, state):
+        """
+        Initialize a new combined HwPC reports handler.
+        :param state: State of the formula, its configuration contains the configuration of each scope
+        """
+        TickHandler.__init__(self, state, state.config.scopes_config[0])
+        self.metrics_scope = 'combined'
+        self.scopes_handler = [HwPCReportHandler(FormulaInstanceState(state.dispatcher, state.sensor, state.socket, state.pushers, config)) for config in state.config.scopes_config]
+
+        # The ticks buffer of the first scope is shared to expose the same reorder statistics for every scope.
+        self.ticks = self.scopes_handler[0].ticks
+        for scope_handler in self.scopes_handler[1:]:
+            scope_handler.ticks = self.ticks
+
+        # The metrics of every scope are recorded in the registry of the combined handler, which is the only one exporting them.
+        for scope_handler in self.scopes_handler:
+            scope_handler.metrics = self.metrics
+            scope_handler.metrics_exporter = None
+
+    def close(self) -> None:
+        """
+        Release the resources used by the handler.
+        """
+        self.flush_output()
+        for scope_handler in self.scopes_handler:
+            scope_handler.close()
+
+    def _process_tick(self, timestamp: datetime.datetime, hwpc_reports: dict[str, HWPCReport]) -> list[Report]:
+        """
+        Process a tick and generate the power reports of each scope for the running target(s).
+        :param timestamp: Timestamp of the tick
+        :param hwpc_reports: HWPC reports of the tick, indexed by target
+        :return: Power and formula reports of every scope
+        """
+        for scope_handler in self.scopes_handler:
+            scope_handler.checkpoint_power_models(timestamp)
+
+        global_report = self._pop_global_report(timestamp, hwpc_reports)
+        if global_report is None:
+            return []
+
+        primary_handler = self.scopes_handler[0]
+        start_time = self._start_stage_timer()
+        pkg_frequency, events_matrix = primary_handler.preprocess_tick(timestamp, global_report, hwpc_reports)
+        if events_matrix is not None:
+            self._observe_stage_duration('preprocess', start_time)
+            for scope_handler in self.scopes_handler[1:]:
+                scope_handler.set_events_schema(primary_handler.events_schema)
+
+        reports = []
+        for scope_handler in self.scopes_handler:
+            power_reports, formula_reports = scope_handler.estimate_power(timestamp, global_report, hwpc_reports, pkg_frequency, events_matrix)
+            reports.extend(power_reports + formula_reports)
+
+        return reports
@@ -0,0 +1,127 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timedelta
+
+from powerapi.report import PowerReport
+
+from .targets_power_rollup import get_power_report_series_key
+
+
+class EnergyCounters:
+    """
+    Monotonically increasing energy counters of the targets, attached to their power reports.
+    The consumers can compute the exact energy consumed between any two reports of a target from the delta of their
+    counters, without having to ingest every report in between.
+    The counters of the targets that are no longer reported (terminated containers, ...) are evicted after being stale
+    for STALE_PERIODS output periods. A counter evicted or starting restarts from zero: the "energy_reset" metadata attached
+    with the counters is only true for the first report carrying it, the delta with the counters attached before this
+    report must not be computed.
+    """
+
+    STALE_PERIODS = 10
+
+    def __init__(self, reports_duration: timedelta, interval: timedelta = timedelta(0), output_period: timedelta | None = None):
+        """
+        Initialize new energy counters.
+        :param reports_duration: Duration covered by each power estimation, a downsampled power report covering as many
+                                 durations as its amount of samples
+        :param interval: Minimum interval between two power reports of a target carrying its counter (0 for every report)
+        :param output_period: Period of the power reports, the reports duration if not given
+        """
+        self.reports_duration = reports_duration
+        self.interval = interval
+        self.counters: dict[tuple[str, str, str, int | None], float] = {}
+        self.last_attach_timestamp: dict[tuple[str, str, str, int | None], datetime] = {}
+        self.last_update_timestamp: dict[tuple[str, str, str, int | None], datetime] = {}
+        self.stale_duration = (output_period if output_period is not None else reports_duration) * self.STALE_PERIODS
+        self.last_eviction_timestamp: datetime | None = None
+
+    def _evict_stale_counters(self, timestamp: datetime) -> None:
+        """
+        Evict the counters that have not been updated since the stale duration.
+        The stale counters are searched at most once per stale duration to keep the cost of the updates constant.
+        :param timestamp: Timestamp of the current power report
+        """
+        if self.last_eviction_timestamp is None:
+            self.last_eviction_timestamp = timestamp
+            return
+
+        if timestamp - self.last_eviction_timestamp < self.stale_duration:
+            return
+
+        self.last_eviction_timestamp = timestamp
+        stale_keys = [key for key, last_update in self.last_update_timestamp.items() if timestamp - last_update >= self.stale_duration]
+        for key in stale_keys:
+            del self.counters[key]
+            del self.last_update_timestamp[key]
+            self.last_attach_timestamp.pop(key, None)
+
+    def _add_energy(self, key: tuple[str, str, str, int | None], timestamp: datetime, energy: float) -> float:
+        """
+        Add energy to the counter of a series of power reports.
+        :param key: Key of the series of power reports
+        :param timestamp: Timestamp of the energy consumption
+        :param energy: Energy consumed (in Joules)
+        :return: Value of the counter
+        """
+        self._evict_stale_counters(timestamp)
+
+        energy += self.counters.get(key, 0.0)
+        self.counters[key] = energy
+        self.last_update_timestamp[key] = timestamp
+        return energy
+
+    def accumulate(self, target: str, scope: str, socket: str, timestamp: datetime, power: float) -> None:
+        """
+        Accumulate the energy of a target without power report, such as the targets folded by the targets reducer.
+        :param target: Name of the target
+        :param scope: Scope of the power estimation
+        :param socket: Socket of the power estimation
+        :param timestamp: Timestamp of the power estimation
+        :param power: Power estimation of the target (in Watts)
+        """
+        self._add_energy((target, scope, socket, None), timestamp, power * self.reports_duration.total_seconds())
+
+    def update(self, report: PowerReport) -> None:
+        """
+        Accumulate the energy of a power report in the counter of its target, and attach the counter to the report
+        when the interval since the last attached counter is elapsed.
+        :param report: Power report of a target
+        """
+        key = get_power_report_series_key(report)
+        energy = self._add_energy(key, report.timestamp, report.power * report.metadata.get('samples', 1) * self.reports_duration.total_seconds())
+
+        last_attach_timestamp = self.last_attach_timestamp.get(key)
+        if last_attach_timestamp is None or report.timestamp - last_attach_timestamp >= self.interval:
+            report.metadata['energy'] = energy
+            report.metadata['energy_reset'] = last_attach_timestamp is None
+            self.last_attach_timestamp[key] = report.timestamp
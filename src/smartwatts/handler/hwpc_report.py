@@ -29,46 +29,190 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import datetime
-import itertools
 import logging
+import time
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from math import ldexp, fabs
 from typing import Any
 
-from powerapi.handler import Handler
+import numpy as np
 from powerapi.report import PowerReport, HWPCReport, FormulaReport
 from sklearn.exceptions import NotFittedError
 
-from smartwatts.model import FrequencyLayer
+from smartwatts.model import FrequencyLayer, EventSchema, PowerModelLearner, ElasticNetLearner, RecursiveLeastSquaresLearner, PowerModelStore
+from .targets_power_reducer import TargetsPowerReducer
+from .targets_power_rollup import TargetsPowerRollup
+from .tick_handler import TickHandler
+from .tick_reorder_buffer import TickReorderBuffer
 
 
-class HwPCReportHandler(Handler):
+class HwPCReportHandler(TickHandler):
     """
     HwPC reports handler.
     """
 
     def __init__(self, state):
-        Handler.__init__(self, state)
-        self.layers = self._generate_frequency_layers()
-        self.ticks: OrderedDict[datetime.datetime, dict[str, HWPCReport]] = OrderedDict()
+        TickHandler.__init__(self, state, state.config)
+        self.layers: dict[int, FrequencyLayer] = {}
+        self.resident_layers: OrderedDict[int, FrequencyLayer] = OrderedDict()
+        self.events_schema: EventSchema | None = None
+        self.ticks = self._create_tick_reorder_buffer()
+        self.targets_reducer = TargetsPowerReducer(self.state.config.output_top_k, self.state.config.output_min_power, self.state.config.output_min_ratio)
+        self.targets_rollup = TargetsPowerRollup(self.state.config.rollup_depths) if self.state.config.rollup_depths else None
+        self.learn_executor = self._create_learn_executor()
+        self.model_store = PowerModelStore(self.state.config.model_store_dir, self.state.config.model_store_history) if self.state.config.model_store_dir else None
+        self.model_store_key = f'{self.state.sensor}-{self.state.socket}-{self.state.config.scope.value}'
+        self.last_checkpoint_timestamp: datetime.datetime | None = None
+        self.last_formula_report_model: tuple[int, int] | None = None
+        self.formula_report_skipped_ticks = 0
+        self._restore_power_models()
+
+    def _create_tick_reorder_buffer(self) -> TickReorderBuffer:
+        """
+        Create the buffer used to reorder the received reports by tick.
+        :return: Initialized tick reorder buffer
+        """
+        config = self.state.config
+        lateness_ms = config.reorder_lateness if config.reorder_lateness > 0 else 5 * config.reports_frequency
+        if config.reorder_adaptive_percentile <= 0:
+            return TickReorderBuffer(config.reorder_mode, config.reorder_depth, datetime.timedelta(milliseconds=lateness_ms), config.reorder_max_ticks)
+
+        # In event-time mode, the lateness of the on-time reports is measured in sensor periods and a report is accepted
+        # only if its lateness is strictly lower than the lateness of the buffer, hence the margin of one period.
+        margin_ms = config.reports_frequency if config.reorder_mode == 'event-time' else 0
+        max_lateness = datetime.timedelta(milliseconds=config.reorder_max_lateness) if config.reorder_max_lateness > 0 else datetime.timedelta.max
+        return TickReorderBuffer(config.reorder_mode, config.reorder_depth, datetime.timedelta(milliseconds=lateness_ms), config.reorder_max_ticks,
+                                 adaptive_percentile=config.reorder_adaptive_percentile, min_lateness=datetime.timedelta(milliseconds=config.reorder_min_lateness),
+                                 max_lateness=max_lateness, lateness_margin=datetime.timedelta(milliseconds=margin_ms))
+
+    def _create_learn_executor(self) -> ThreadPoolExecutor | None:
+        """
+        Create the executor used to learn the power models asynchronously, if enabled.
+        :return: Initialized thread pool executor, None when the power models are learned synchronously
+        """
+        if self.state.config.learn_async_workers <= 0:
+            return None
+
+        return ThreadPoolExecutor(self.state.config.learn_async_workers, thread_name_prefix='smartwatts-learn')
+
+    def close(self) -> None:
+        """
+        Release the resources used by the handler.
+        """
+        self.flush_output()
+        if self.learn_executor is not None:
+            self.learn_executor.shutdown(wait=True, cancel_futures=True)
+
+        self._save_power_models()
 
-    def _generate_frequency_layers(self) -> OrderedDict[int, FrequencyLayer]:
+    def _restore_power_models(self) -> None:
         """
-        Generate and returns a layered container to store per-frequency power models
-        :return: Initialized Ordered dict containing a power model for each frequency layer
+        Restore the frequency layers from the snapshot stored in the model store, if any.
         """
-        return OrderedDict(
-            (freq, FrequencyLayer(freq, self.state.config.min_samples_required, self.state.config.history_window_size, self.state.config.error_window_size))
-            for freq in self.state.config.cpu_topology.get_supported_frequencies()
-        )
+        if self.model_store is None:
+            return
+
+        snapshot = self.model_store.load(self.model_store_key)
+        if snapshot is None:
+            return
+
+        if snapshot['events'] is not None:
+            self.events_schema = EventSchema(snapshot['events'])
+
+        for frequency, (model, samples_history) in snapshot['layers'].items():
+            # the layer is built from the current configuration, only the compatible state of the snapshot is restored
+            layer = self._create_frequency_layer(frequency)
+            layer.restore(model, samples_history)
+            if samples_history is not None:
+                self._mark_frequency_layer_as_used(frequency, layer)
+            self.layers[frequency] = layer
+
+        logging.info('Restored %d power models of %s from the model store', len(self.layers), self.model_store_key)
+
+    def _save_power_models(self) -> None:
+        """
+        Store a snapshot of the frequency layers in the model store.
+        """
+        if self.model_store is None:
+            return
+
+        try:
+            self.model_store.save(self.model_store_key, self.layers, self.events_schema.raw_events_name if self.events_schema is not None else None)
+        except OSError as exn:
+            logging.error('Failed to save the power models snapshot of %s: %s', self.model_store_key, exn)
+
+    def checkpoint_power_models(self, timestamp: datetime.datetime) -> None:
+        """
+        Periodically store a snapshot of the frequency layers in the model store.
+        :param timestamp: Timestamp of the current tick
+        """
+        if self.model_store is None:
+            return
+
+        if self.last_checkpoint_timestamp is None:
+            self.last_checkpoint_timestamp = timestamp
+        elif (timestamp - self.last_checkpoint_timestamp).total_seconds() >= self.state.config.model_store_interval:
+            self._save_power_models()
+            self.last_checkpoint_timestamp = timestamp
+
+    def _create_frequency_layer(self, frequency: int) -> FrequencyLayer:
+        """
+        Create a new frequency layer to store the power model of the given frequency.
+        :param frequency: Frequency of the layer
+        :return: Initialized frequency layer
+        """
+        config = self.state.config
+        return FrequencyLayer(frequency, config.min_samples_required, config.history_window_size, config.error_window_size, config.history_dtype, config.error_window_method,
+                              self._create_power_model_learner())
+
+    def _create_power_model_learner(self) -> PowerModelLearner:
+        """
+        Create the learner used to compute the power model of a frequency layer.
+        :return: Initialized power model learner
+        """
+        if self.state.config.learn_method == 'rls':
+            return RecursiveLeastSquaresLearner(self.state.config.learn_forgetting_factor)
+
+        return ElasticNetLearner()
+
+    def _mark_frequency_layer_as_used(self, frequency: int, layer: FrequencyLayer) -> None:
+        """
+        Mark the frequency layer as the most recently used.
+        When the amount of resident layers exceeds the limit, the history of the least recently used layers is released.
+        The layers without a fitted power model are never evicted, as they need their history to learn their first model.
+        :param frequency: Frequency of the layer
+        :param layer: Frequency layer
+        """
+        max_resident_layers = self.state.config.max_resident_layers
+        if max_resident_layers <= 0:
+            return
+
+        self.resident_layers[frequency] = layer
+        self.resident_layers.move_to_end(frequency)
+        evictions_count = len(self.resident_layers) - max_resident_layers
+        if evictions_count <= 0:
+            return
+
+        cold_frequencies = [cold_frequency for cold_frequency, cold_layer in self.resident_layers.items() if cold_frequency != frequency and cold_layer.model.id > 0]
+        for cold_frequency in cold_frequencies[:evictions_count]:
+            self.resident_layers.pop(cold_frequency).release_history()
 
     def _get_nearest_frequency_layer(self, frequency: int) -> FrequencyLayer:
         """
         Find and returns the nearest frequency layer for the given frequency.
+        Frequencies outside the supported range are clamped to the lowest/highest frequency layer.
+        The layers are created on their first use.
         :param frequency: CPU frequency
         :return: The nearest frequency layer for the given frequency
         """
-        return self.layers.get(max(freq for freq in self.layers.keys() if freq <= frequency))
+        layer_frequency = self.state.config.cpu_topology.get_nearest_supported_frequency(frequency)
+        layer = self.layers.get(layer_frequency)
+        if layer is None:
+            layer = self.layers[layer_frequency] = self._create_frequency_layer(layer_frequency)
+
+        self._mark_frequency_layer_as_used(layer_frequency, layer)
+        return layer
 
     def _compute_avg_pkg_frequency(self, system_msr: dict[str, float]) -> int:
         """
@@ -78,89 +222,218 @@ class HwPCReportHandler(Handler):
         """
         return int((self.state.config.cpu_topology.get_base_frequency() * system_msr['APERF']) / system_msr['MPERF'])
 
-    def handle(self, msg: HWPCReport) -> None:
+    def _update_events_schema(self, target_report: HWPCReport) -> EventSchema:
         """
-        Process a HWPC report and send the result(s) to a pusher actor.
-        :param msg: Received HWPC report
+        Check that the events of the given report matches the current events schema, and rebuild it when needed.
+        The power models are reset when the events of the sensor changes, as they were learned on different features.
+        :param target_report: HWPC report of a running target
+        :raise: KeyError when the report have no core events for the current socket
+        :return: The events schema of the sensor
         """
-        logging.debug('received message: %s', msg)
-        self.ticks.setdefault(msg.timestamp, {}).update({msg.target: msg})
+        socket = str(self.state.socket)
+        cpu_events = next(iter(target_report.groups['core'][socket].values()), None)
+        if cpu_events is None:
+            raise KeyError(f'No core events for socket {socket}')
+
+        events_name = cpu_events.keys()
+        if self.events_schema is None or not self.events_schema.matches(events_name):
+            self.set_events_schema(EventSchema(events_name))
 
-        # Start to process the oldest tick only after receiving at least 5 ticks.
-        # We wait before processing the ticks in order to mitigate the possible delay between the sensor/database.
-        if len(self.ticks) > 5:
-            power_reports, formula_reports = self._process_oldest_tick()
-            for report in itertools.chain(power_reports, formula_reports):
-                for name, pusher in self.state.pushers.items():
-                    if isinstance(report, pusher.state.report_model):
-                        pusher.send_data(report)
-                        logging.debug('sent report: %s to %s', report, name)
+        return self.events_schema
 
-    def _process_oldest_tick(self) -> tuple[list[PowerReport], list[FormulaReport]]:
+    def set_events_schema(self, events_schema: EventSchema) -> None:
         """
-        Process the oldest tick stored in the stack and generate power reports for the running target(s).
-        :return: Power reports of the running target(s)
+        Use the given events schema to compute the power models.
+        The power models are reset when the events differ from the current schema, as they were learned on different features.
+        :param events_schema: Events schema of the sensor
         """
-        timestamp, hwpc_reports = self.ticks.popitem(last=False)
-        power_reports = []
-        formula_reports = []
+        if self.events_schema is not None and self.events_schema.raw_events_name != events_schema.raw_events_name:
+            logging.warning('The events of sensor %s have changed, resetting the power models', self.state.sensor)
+            self.layers.clear()
+            self.resident_layers.clear()
+
+        self.events_schema = events_schema
+
+    def _process_tick(self, timestamp: datetime.datetime, hwpc_reports: dict[str, HWPCReport]) -> list[PowerReport | FormulaReport]:
+        """
+        Process a tick and generate power reports for the running target(s).
+        :param timestamp: Timestamp of the tick
+        :param hwpc_reports: HWPC reports of the tick, indexed by target
+        :return: Power reports of the running target(s) followed by the formula report
+        """
+        self.checkpoint_power_models(timestamp)
+
+        global_report = self._pop_global_report(timestamp, hwpc_reports)
+        if global_report is None:
+            return []
+
+        start_time = self._start_stage_timer()
+        pkg_frequency, events_matrix = self.preprocess_tick(timestamp, global_report, hwpc_reports)
+        if events_matrix is not None:
+            self._observe_stage_duration('preprocess', start_time)
+
+        power_reports, formula_reports = self.estimate_power(timestamp, global_report, hwpc_reports, pkg_frequency, events_matrix)
+        return power_reports + formula_reports
 
+    def preprocess_tick(self, timestamp: datetime.datetime, global_report: HWPCReport, targets_report: dict[str, HWPCReport]) -> tuple[int | None, np.ndarray | None]:
+        """
+        Compute the scope independent values of a tick: the package frequency and the events matrix of the targets.
+        :param timestamp: Timestamp of the tick
+        :param global_report: HWPC report of the System target
+        :param targets_report: HWPC reports of the running targets
+        :return: Average package frequency and events matrix of the tick, None when they cannot be computed
+        """
+        try:
+            pkg_frequency = self._compute_avg_pkg_frequency(self._gen_msr_events_group(global_report))
+        except ZeroDivisionError:
+            logging.error('Failed to process tick %s: PKG frequency is invalid', timestamp)
+            self._inc_counter('smartwatts_ticks_zero_frequency_total', 'Amount of ticks dropped because of an invalid package frequency')
+            return None, None
+
+        # build the events matrix of the tick, the first row is the Global target followed by the running targets
         try:
-            global_report = hwpc_reports.pop('all')
+            events_matrix = self._gen_core_events_matrix(targets_report)
         except KeyError:
-            # cannot process this tick without the reference measurements
-            logging.error('Failed to process tick %s: missing global report', timestamp)
-            return power_reports, formula_reports
+            logging.error('Failed to process tick %s: the targets reports have inconsistent events', timestamp)
+            return pkg_frequency, None
 
-        # Don't continue if there is no reports available.
-        # Can happen when reports are dropped by a pre-processor.
-        if len(hwpc_reports) == 0:
-            return power_reports, formula_reports
+        return pkg_frequency, events_matrix
+
+    def estimate_power(self, timestamp: datetime.datetime, global_report: HWPCReport, targets_report: dict[str, HWPCReport], pkg_frequency: int | None,
+                       events_matrix: np.ndarray | None) -> tuple[list[PowerReport], list[FormulaReport]]:
+        """
+        Estimate the power consumption of the running targets of a tick and update the power model of the scope.
+        :param timestamp: Timestamp of the tick
+        :param global_report: HWPC report of the System target
+        :param targets_report: HWPC reports of the running targets
+        :param pkg_frequency: Average package frequency of the tick, None if it cannot be computed
+        :param events_matrix: Events matrix of the tick, None if it cannot be computed
+        :return: Power reports of the running target(s) and formula report of the power model used
+        """
+        power_reports = []
+        formula_reports = []
 
         rapl = self._gen_rapl_events_group(global_report)
-        avg_msr = self._gen_msr_events_group(global_report)
-        global_core = self._gen_agg_core_report_from_running_targets(hwpc_reports)
         rapl_power = rapl[self.state.config.rapl_event]
         power_reports.append(self._gen_power_report(timestamp, 'rapl', self.state.config.rapl_event, rapl_power, 1.0, global_report.metadata))
 
-        try:
-            pkg_frequency = self._compute_avg_pkg_frequency(avg_msr)
-        except ZeroDivisionError:
-            logging.error('Failed to process tick %s: PKG frequency is invalid', timestamp)
+        if pkg_frequency is None or events_matrix is None:
             return power_reports, formula_reports
 
+        global_events = events_matrix[0]
         layer = self._get_nearest_frequency_layer(pkg_frequency)
+        layer.apply_pending_power_model()
 
-        # compute Global target power report
+        # compute the raw power estimation of the Global and running targets at once
+        start_time = self._start_stage_timer()
         try:
-            raw_global_power = layer.model.predict_power_consumption(self._extract_events_value(global_core))
-            power_reports.append(self._gen_power_report(timestamp, 'global', layer.model.hash, raw_global_power, 1.0, global_report.metadata))
+            raw_power = layer.model.predict_power_consumption_batch(events_matrix)
         except NotFittedError:
-            layer.store_sample_in_history(rapl_power, self._extract_events_value(global_core))
-            layer.update_power_model(0.0, self.state.config.cpu_topology.tdp)
+            layer.store_sample_in_history(rapl_power, global_events)
+            self._update_power_model(layer)
             return power_reports, formula_reports
 
+        # compute Global target power report
+        raw_global_power = float(raw_power[0])
+        power_reports.append(self._gen_power_report(timestamp, 'global', layer.model.hash, raw_global_power, 1.0, global_report.metadata))
+
         # compute per-target power report
-        for target_name, target_report in hwpc_reports.items():
-            target_core = self._gen_core_events_group(target_report)
-            raw_target_power = layer.model.predict_power_consumption(self._extract_events_value(target_core))
-            target_power, target_ratio = layer.model.cap_power_estimation(raw_target_power, raw_global_power)
-            power_reports.append(self._gen_power_report(timestamp, target_name, layer.model.hash, target_power, target_ratio, target_report.metadata))
+        targets_power, targets_ratio = layer.model.cap_power_estimations(raw_power[1:], raw_global_power)
+        self._observe_stage_duration('predict', start_time)
+        if self.targets_reducer.enabled:
+            power_reports.extend(self._gen_reduced_targets_power_reports(timestamp, layer.model.hash, targets_report, targets_power, targets_ratio))
+        else:
+            for (target_name, target_report), target_power, target_ratio in zip(targets_report.items(), targets_power.tolist(), targets_ratio.tolist(), strict=True):
+                power_reports.append(self._gen_power_report(timestamp, target_name, layer.model.hash, target_power, target_ratio, target_report.metadata))
+
+        # aggregate the power of the targets at the configured depths of their hierarchy
+        if self.targets_rollup is not None:
+            for node_name, node_depth, node_power, node_ratio, node_targets_count in self.targets_rollup.rollup(list(targets_report), targets_power, targets_ratio):
+                node_metadata = {'rollup_depth': node_depth, 'targets_count': node_targets_count}
+                power_reports.append(self._gen_power_report(timestamp, node_name, layer.model.hash, node_power, node_ratio, node_metadata))
 
         # compute power model error from reference
         model_error = fabs(rapl_power - raw_global_power)
 
-        layer.store_sample_in_history(rapl_power, self._extract_events_value(global_core))
+        layer.store_sample_in_history(rapl_power, global_events)
         layer.store_error_in_history(model_error)
 
         # learn new power model if error exceeds the error threshold
-        if layer.error_history.compute_error(self.state.config.error_window_method) > self.state.config.error_threshold:
-            layer.update_power_model(0.0, self.state.config.cpu_topology.tdp)
+        if layer.error_history.compute_error() > self.state.config.error_threshold:
+            self._update_power_model(layer)
 
         # store information about the power model used for this tick
-        formula_reports.append(self._gen_formula_report(timestamp, pkg_frequency, layer, model_error))
+        if self._should_emit_formula_report(layer):
+            formula_reports.append(self._gen_formula_report(timestamp, pkg_frequency, layer, model_error))
         return power_reports, formula_reports
 
+    def _gen_reduced_targets_power_reports(self, timestamp: datetime, formula: str, targets_report: dict[str, HWPCReport], targets_power: np.ndarray,
+                                           targets_ratio: np.ndarray) -> list[PowerReport]:
+        """
+        Generate the power reports of the targets kept by the targets reducer, and of the synthetic target folding the others.
+        :param timestamp: Timestamp of the measurements
+        :param formula: Formula identifier
+        :param targets_report: HWPC reports of the running targets
+        :param targets_power: Power estimation of the running targets
+        :param targets_ratio: Ratio of the global power attributed to the running targets
+        :return: Power reports of the kept targets, followed by the one of the folded targets if any
+        """
+        kept_indices, other_power, other_ratio, other_count = self.targets_reducer.reduce(targets_power, targets_ratio)
+        targets_name = list(targets_report)
+
+        power_reports = []
+        for index in kept_indices.tolist():
+            target_name = targets_name[index]
+            power_reports.append(self._gen_power_report(timestamp, target_name, formula, float(targets_power[index]), float(targets_ratio[index]), targets_report[target_name].metadata))
+
+        # the energy of the folded targets is accumulated into their own counters, as they have no power report
+        if self.energy_counters is not None and other_count > 0:
+            folded_mask = np.ones(len(targets_name), dtype=bool)
+            folded_mask[kept_indices] = False
+            for index in np.flatnonzero(folded_mask).tolist():
+                self.energy_counters.accumulate(targets_name[index], self.state.config.scope.value, self.state.socket, timestamp, float(targets_power[index]))
+
+        if other_count > 0:
+            power_reports.append(self._gen_power_report(timestamp, TargetsPowerReducer.OTHER_TARGET_NAME, formula, other_power, other_ratio, {'targets_count': other_count}))
+
+        return power_reports
+
+    def _update_power_model(self, layer: FrequencyLayer) -> None:
+        """
+        Learn a new power model for the given frequency layer, and record the learning in the metrics if enabled.
+        When the power models are learned asynchronously, the recorded duration only covers the submission of the learning.
+        :param layer: Frequency layer to update
+        """
+        if self.metrics is None:
+            layer.update_power_model(0.0, self.state.config.cpu_topology.tdp, self.learn_executor)
+            return
+
+        start_time = time.perf_counter()
+        layer.update_power_model(0.0, self.state.config.cpu_topology.tdp, self.learn_executor)
+        labels = {'scope': self.state.config.scope.value}
+        self.metrics.histogram('smartwatts_learn_duration_seconds', 'Duration of the learning of the power models', labels).observe(time.perf_counter() - start_time)
+        self.metrics.counter('smartwatts_learn_total', 'Amount of power model learnings', labels).inc()
+
+    def _should_emit_formula_report(self, layer: FrequencyLayer) -> bool:
+        """
+        Decide whether the formula report of the current tick is emitted, according to the formula report mode.
+        :param layer: Frequency layer used for the current tick
+        :return: True if the formula report should be emitted, False otherwise
+        """
+        mode = self.state.config.formula_report_mode
+        if mode == 'on-change':
+            model = (layer.model.frequency, layer.model.id)
+            if model == self.last_formula_report_model:
+                return False
+            self.last_formula_report_model = model
+        elif mode == 'interval':
+            self.formula_report_skipped_ticks += 1
+            if self.formula_report_skipped_ticks < self.state.config.formula_report_interval:
+                return False
+            self.formula_report_skipped_ticks = 0
+
+        return True
+
     def _gen_formula_report(self, timestamp: datetime, pkg_frequency: int, layer: FrequencyLayer, error: float) -> FormulaReport:
         """
         Generate a formula report using the given parameters.
@@ -177,9 +450,13 @@ class HwPCReportHandler(Handler):
             'samples': len(layer.samples_history),
             'id': layer.model.id,
             'error': error,
-            'intercept': layer.model.clf.intercept_,
-            'coef': str(layer.model.clf.coef_)
+            'intercept': float(layer.model.clf.intercept_),
         }
+        # the coefficients are flattened into scalar fields, as required by the InfluxDB output
+        metadata |= {f'coef_{i}': float(coef) for i, coef in enumerate(layer.model.clf.coef_)}
+        if self.ticks.adaptive_percentile is not None:
+            metadata['reorder_window'] = self.ticks.lateness.total_seconds() * 1000.0
+            metadata['late_reports'] = self.ticks.late_reports_count
         return FormulaReport(timestamp, self.state.sensor, layer.model.hash, metadata)
 
     def _gen_power_report(self, timestamp: datetime, target: str, formula: str, power: float, ratio: float, metadata: dict[str, Any]) -> PowerReport:
@@ -224,38 +501,20 @@ class HwPCReportHandler(Handler):
 
         return {k: v / msr_events_count[k] for k, v in msr_events_group.items() if not k.startswith('time_')}
 
-    def _gen_core_events_group(self, report) -> dict[str, float]:
-        """
-        Generate an events group with Core events for the current socket.
-        The events value are the sum of the value for each CPU.
-        :param report: The HWPC report of any target
-        :return: A dictionary containing the Core events of the current socket
-        """
-        core_events_group = defaultdict(int)
-        for cpu_events in report.groups['core'][str(self.state.socket)].values():
-            for event_name, event_value in cpu_events.items():
-                core_events_group[event_name] += event_value
-
-        return {k: v for k, v in core_events_group.items() if not k.startswith('time_')}
-
-    def _gen_agg_core_report_from_running_targets(self, targets_report) -> dict[str, float]:
-        """
-        Generate an aggregate Core events group of the running targets for the current socket.
-        :param targets_report: List of Core events group of the running targets
-        :return: A dictionary containing an aggregate of the Core events for the running targets of the current socket
-        """
-        agg_core_events_group = defaultdict(int)
-        for target_report in targets_report.values():
-            for event_name, event_value in self._gen_core_events_group(target_report).items():
-                agg_core_events_group[event_name] += event_value
-
-        return agg_core_events_group
-
-    @staticmethod
-    def _extract_events_value(events: dict[str, float]) -> list[float]:
+    def _gen_core_events_matrix(self, targets_report: dict[str, HWPCReport]) -> np.ndarray:
         """
-        Creates and return a list of events value from the events group.
-        :param events: Events group
-        :return: List containing the events value sorted by event name
+        Generate the Core events matrix of the running targets for the current socket.
+        The first row contains the aggregate of the running targets events, followed by a row for each running target.
+        The events value are the sum of the value for each CPU, the columns follow the layout of the events schema.
+        :param targets_report: HWPC reports of the running targets
+        :raise: KeyError when the events of a target does not match the events schema
+        :return: Events matrix of the current socket
         """
-        return [events[key] for key in sorted(events)]
+        socket = str(self.state.socket)
+        events_schema = self._update_events_schema(next(iter(targets_report.values())))
+        events_matrix = events_schema.events_matrix(len(targets_report) + 1)
+        for row, target_report in enumerate(targets_report.values(), start=1):
+            events_schema.extract_events_value(target_report.groups['core'][socket], out=events_matrix[row])
+
+        np.sum(events_matrix[1:], axis=0, out=events_matrix[0])
+        return events_matrix
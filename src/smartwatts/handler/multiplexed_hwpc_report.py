@@ -0,0 +1,104 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
+from powerapi.handler import Handler
+from powerapi.report import HWPCReport
+
+from .tick_handler import TickHandler
+
+
+class FormulaInstanceState:
+    """
+    State of a formula instance (sensor and socket) hosted by another actor than a dedicated formula actor.
+    """
+
+    def __init__(self, dispatcher: str, sensor: str, socket: str, pushers: dict, config):
+        """
+        Initialize a new formula instance state.
+        :param dispatcher: Name of the dispatcher the formula belongs to
+        :param sensor: Name of the sensor handled by the formula
+        :param socket: Socket handled by the formula
+        :param pushers: Dictionary of available pushers
+        :param config: Configuration of the formula
+        """
+        self.dispatcher = dispatcher
+        self.sensor = sensor
+        self.socket = socket
+        self.pushers = pushers
+        self.config = config
+
+
+class MultiplexedHwPCReportHandler(Handler):
+    """
+    HwPC reports handler hosting the formula instances of many sensors and sockets.
+    The received reports are routed to the handler of their (sensor, socket) formula instance, created on first use.
+    """
+
+    def __init__(self, state, handler_class: type[TickHandler]):
+        """
+        Initialize a new multiplexed HwPC reports handler.
+        :param state: State of the actor hosting the formula instances
+        :param handler_class: Class of the HwPC reports handler of the formula instances
+        """
+        Handler.__init__(self, state)
+        self.handler_class = handler_class
+        self.dispatch_rule = HWPCDispatchRule(HWPCDepthLevel.SOCKET, primary=True)
+        self.handlers: dict[tuple[str, str], TickHandler] = {}
+
+    def get_handler(self, sensor: str, socket: str) -> TickHandler:
+        """
+        Get the HwPC report handler of the given formula instance, create it on first use.
+        :param sensor: Name of the sensor handled by the formula instance
+        :param socket: Socket handled by the formula instance
+        :return: HwPC report handler of the formula instance
+        """
+        handler = self.handlers.get((sensor, socket))
+        if handler is None:
+            state = FormulaInstanceState(self.state.dispatcher, sensor, socket, self.state.pushers, self.state.config)
+            handler = self.handlers[(sensor, socket)] = self.handler_class(state)
+
+        return handler
+
+    def close(self) -> None:
+        """
+        Release the resources used by the formula instances.
+        """
+        for handler in self.handlers.values():
+            handler.close()
+
+    def handle(self, msg: HWPCReport) -> None:
+        """
+        Route a HWPC report to the formula instance(s) of its sensor socket(s).
+        :param msg: Received HWPC report
+        """
+        for sensor, socket in self.dispatch_rule.get_formula_id(msg):
+            self.get_handler(sensor, socket).handle(msg)
@@ -0,0 +1,55 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from powerapi.handler import PoisonPillMessageHandler
+
+from .combined_hwpc_report import CombinedHwPCReportHandler
+from .hwpc_report import HwPCReportHandler
+from .multiplexed_hwpc_report import MultiplexedHwPCReportHandler
+
+
+class FormulaPoisonPillMessageHandler(PoisonPillMessageHandler):
+    """
+    PoisonPill message handler of the SmartWatts formula actor.
+    Release the resources of the HwPC reports handler before the actor terminates.
+    """
+
+    def __init__(self, state, hwpc_report_handler: HwPCReportHandler | CombinedHwPCReportHandler | MultiplexedHwPCReportHandler):
+        """
+        Initialize a new PoisonPill message handler.
+        :param state: State of the formula actor
+        :param hwpc_report_handler: HwPC reports handler of the formula actor
+        """
+        super().__init__(state)
+        self.hwpc_report_handler = hwpc_report_handler
+
+    def teardown(self, soft=False):
+        self.hwpc_report_handler.close()
@@ -0,0 +1,94 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timedelta, timezone
+
+from powerapi.report import PowerReport
+
+from .targets_power_rollup import get_power_report_series_key
+
+
+class PowerReportsDownsampler:
+    """
+    Aggregate the power reports of each target over a fixed output period.
+    The reports of a target are emitted as a single power report carrying its average power and ratio over the reports
+    seen during the period, and their amount ("samples" metadata). The energy of a target over the period is then its
+    power multiplied by its samples and the reports period, also for the targets seen during a part of the period only.
+    The periods are aligned on the Unix epoch, and the reports are expected to be added in timestamp order.
+    """
+
+    def __init__(self, output_period: timedelta):
+        """
+        Initialize a new power reports downsampler.
+        :param output_period: Period of the emitted power reports
+        """
+        self.output_period = output_period
+        self.window_start: datetime | None = None
+        self.windows: dict[tuple[str, str, str, int | None], tuple[float, float, int, PowerReport]] = {}
+
+    def _get_window_start(self, timestamp: datetime) -> datetime:
+        """
+        Returns the start of the output period containing the given timestamp.
+        :param timestamp: Timestamp of a report
+        :return: Start of the output period
+        """
+        epoch = datetime(1970, 1, 1) if timestamp.tzinfo is None else datetime(1970, 1, 1, tzinfo=timezone.utc)
+        return timestamp - (timestamp - epoch) % self.output_period
+
+    def add(self, report: PowerReport) -> list[PowerReport]:
+        """
+        Accumulate a power report in the current output period.
+        :param report: Power report to aggregate
+        :return: Power reports of the previous output period, when the report starts a new one
+        """
+        emitted_reports = []
+        window_start = self._get_window_start(report.timestamp)
+        if window_start != self.window_start:
+            emitted_reports = self.flush()
+            self.window_start = window_start
+
+        key = get_power_report_series_key(report)
+        power, ratio, samples, _ = self.windows.get(key, (0.0, 0.0, 0, None))
+        self.windows[key] = (power + report.power, ratio + report.metadata.get('ratio', 0.0), samples + 1, report)
+        return emitted_reports
+
+    def flush(self) -> list[PowerReport]:
+        """
+        Generate the power reports of the current output period and reset the aggregation.
+        :return: Average power reports of the targets seen during the current output period
+        """
+        power_reports = []
+        for power, ratio, samples, last_report in self.windows.values():
+            metadata = last_report.metadata | {'ratio': ratio / samples, 'samples': samples}
+            power_reports.append(PowerReport(self.window_start, last_report.sensor, last_report.target, power / samples, metadata))
+
+        self.windows.clear()
+        return power_reports
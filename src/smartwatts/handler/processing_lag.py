@@ -0,0 +1,94 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import deque
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+class ProcessingLagTracker:
+    """
+    Track the processing lag of a formula: the delay between the timestamp of a tick and the emission of its reports.
+    The lag includes the queueing of the input reports, the time spent in the reorder buffer and the processing itself.
+    The lag is computed in UTC. The naive timestamps are interpreted following the convention of their source: local
+    time for the reports decoded from a POSIX timestamp (csv, socket, ...) or UTC for the ones stored by MongoDB.
+    """
+
+    HISTORY_SIZE = 1000
+    PERCENTILE_UPDATE_INTERVAL = 100
+
+    def __init__(self, percentile: float = 99.0, naive_timestamps_utc: bool = False):
+        """
+        Initialize a new processing lag tracker.
+        :param percentile: Percentile of the recent lags to track
+        :param naive_timestamps_utc: Whether the naive timestamps are in UTC, otherwise they are in local time
+        """
+        self.percentile = percentile
+        self.naive_timestamps_utc = naive_timestamps_utc
+        self.current = 0.0
+        self.max = 0.0
+        self.current_percentile = 0.0
+        self.history: deque[float] = deque(maxlen=self.HISTORY_SIZE)
+        self._observations_since_update = 0
+
+    def _to_utc(self, timestamp: datetime) -> datetime:
+        """
+        Convert a timestamp to an aware UTC datetime.
+        :param timestamp: Aware or naive timestamp
+        :return: Timestamp in UTC
+        """
+        if timestamp.tzinfo is None and self.naive_timestamps_utc:
+            return timestamp.replace(tzinfo=timezone.utc)
+
+        # astimezone interprets the naive timestamps as local time
+        return timestamp.astimezone(timezone.utc)
+
+    def observe(self, timestamp: datetime, now: datetime | None = None) -> float:
+        """
+        Record the processing lag of a tick.
+        :param timestamp: Timestamp of the tick
+        :param now: Emission time of the reports of the tick, the current time if not given
+        :return: Processing lag of the tick (in seconds)
+        """
+        now = datetime.now(timezone.utc) if now is None else self._to_utc(now)
+
+        self.current = (now - self._to_utc(timestamp)).total_seconds()
+        self.max = max(self.max, self.current)
+        self.history.append(self.current)
+
+        # The percentile is periodically recomputed from the recent lags to keep the tracking cheap.
+        self._observations_since_update += 1
+        if self._observations_since_update >= self.PERCENTILE_UPDATE_INTERVAL or len(self.history) == 1:
+            self._observations_since_update = 0
+            self.current_percentile = float(np.percentile(self.history, self.percentile))
+
+        return self.current
@@ -0,0 +1,185 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime
+from typing import Any
+
+from powerapi.message import Message
+from powerapi.pusher.handlers import ReportHandler
+from powerapi.report import PowerReport, Report
+
+
+class ReportBatch(Message):
+    """
+    Message carrying all the reports generated for a pusher during the processing of a tick.
+    """
+
+    def __init__(self, sender_name: str, reports: list[Report]):
+        """
+        Initialize a new reports batch.
+        :param sender_name: Name of the sender of the batch
+        :param reports: Reports of the batch
+        """
+        Message.__init__(self, sender_name)
+        self.reports = reports
+
+    def __str__(self):
+        return f'ReportBatch({self.sender_name}, {len(self.reports)} reports)'
+
+    def to_reports(self) -> list[Report]:
+        """
+        Returns the reports of the batch.
+        :return: Reports of the batch
+        """
+        return self.reports
+
+
+class ColumnarPowerReportBatch(Message):
+    """
+    Message carrying the power reports of a tick for a sensor, scope and socket in a columnar form.
+    The values shared by all the reports are stored once, the values specific to each target are stored in columns.
+    """
+
+    SHARED_METADATA_KEYS = ('scope', 'socket')
+
+    def __init__(self, sender_name: str, timestamp: datetime, sensor: str, metadata: dict[str, Any], targets: list[str], powers: list[float], ratios: list[float],
+                 formulas: list[str], targets_metadata: list[dict[str, Any]]):
+        """
+        Initialize a new columnar power reports batch.
+        :param sender_name: Name of the sender of the batch
+        :param timestamp: Timestamp of the tick
+        :param sensor: Name of the sensor
+        :param metadata: Metadata shared by all the reports (scope and socket)
+        :param targets: Name of the targets
+        :param powers: Power estimation of the targets
+        :param ratios: Ratio of the global power attributed to the targets
+        :param formulas: Identifier of the formula used for the targets
+        :param targets_metadata: Metadata specific to each target
+        """
+        Message.__init__(self, sender_name)
+        self.timestamp = timestamp
+        self.sensor = sensor
+        self.metadata = metadata
+        self.targets = targets
+        self.powers = powers
+        self.ratios = ratios
+        self.formulas = formulas
+        self.targets_metadata = targets_metadata
+
+    def __str__(self):
+        return f'ColumnarPowerReportBatch({self.sender_name}, {self.timestamp}, {self.sensor}, {len(self.targets)} targets)'
+
+    @staticmethod
+    def get_batch_key(report: PowerReport) -> tuple:
+        """
+        Returns the key of the columnar batch a power report belongs to.
+        :param report: Power report
+        :return: Timestamp, sensor and shared metadata values of the report
+        """
+        return report.timestamp, report.sensor, *(report.metadata.get(key) for key in ColumnarPowerReportBatch.SHARED_METADATA_KEYS)
+
+    @staticmethod
+    def from_reports(sender_name: str, reports: list[PowerReport]) -> 'ColumnarPowerReportBatch':
+        """
+        Generate a columnar batch from power reports sharing the same batch key.
+        :param sender_name: Name of the sender of the batch
+        :param reports: Power reports of the batch
+        :return: Columnar batch of the power reports
+        """
+        shared_keys = ColumnarPowerReportBatch.SHARED_METADATA_KEYS
+        metadata = {key: reports[0].metadata[key] for key in shared_keys if key in reports[0].metadata}
+        targets_metadata = [{key: value for key, value in report.metadata.items() if key not in shared_keys and key not in ('formula', 'ratio')} for report in reports]
+        return ColumnarPowerReportBatch(sender_name, reports[0].timestamp, reports[0].sensor, metadata, [report.target for report in reports], [report.power for report in reports],
+                                        [report.metadata.get('ratio') for report in reports], [report.metadata.get('formula') for report in reports], targets_metadata)
+
+    def to_reports(self) -> list[PowerReport]:
+        """
+        Expand the batch into power reports.
+        :return: Power reports of the batch
+        """
+        return [PowerReport(self.timestamp, self.sensor, target, power, target_metadata | self.metadata | {'formula': formula, 'ratio': ratio})
+                for target, power, ratio, formula, target_metadata in zip(self.targets, self.powers, self.ratios, self.formulas, self.targets_metadata, strict=True)]
+
+
+def gen_report_batches(sender_name: str, reports: list[Report], batch_format: str) -> list[ReportBatch | ColumnarPowerReportBatch]:
+    """
+    Group the reports sent to a pusher during a tick into batch messages.
+    :param sender_name: Name of the sender of the batches
+    :param reports: Reports to send to the pusher
+    :param batch_format: Format of the batches (reports or columnar)
+    :return: Batch messages carrying the reports
+    """
+    if batch_format != 'columnar':
+        return [ReportBatch(sender_name, reports)]
+
+    power_reports: dict[tuple, list[PowerReport]] = {}
+    other_reports = []
+    for report in reports:
+        if isinstance(report, PowerReport):
+            power_reports.setdefault(ColumnarPowerReportBatch.get_batch_key(report), []).append(report)
+        else:
+            other_reports.append(report)
+
+    batches = [ColumnarPowerReportBatch.from_reports(sender_name, batch_reports) for batch_reports in power_reports.values()]
+    if other_reports:
+        batches.append(ReportBatch(sender_name, other_reports))
+
+    return batches
+
+
+class ReportBatchHandler(ReportHandler):
+    """
+    Pusher handler buffering all the reports of a batch at once.
+    The buffer is written to the database in bulk with the same delay and size policy as the reports received one by one.
+    """
+
+    def handle(self, msg: ReportBatch | ColumnarPowerReportBatch) -> None:
+        """
+        Save the reports of the batch in the database.
+        The reports are buffered at once, the last one going through the report handler to apply its write policy.
+        :param msg: Reports batch to save
+        """
+        reports = msg.to_reports()
+        if not reports:
+            return
+
+        self.state.buffer.extend(reports[:-1])
+        super().handle(reports[-1])
+
+
+def setup_pusher_report_batch_handler(pusher) -> None:
+    """
+    Register the reports batch handler of a pusher actor, must be called before the actor is started.
+    :param pusher: Pusher actor
+    """
+    handler = ReportBatchHandler(pusher.state, pusher.delay, pusher.max_size)
+    pusher.state.add_handler(ReportBatch, handler)
+    pusher.state.add_handler(ColumnarPowerReportBatch, handler)
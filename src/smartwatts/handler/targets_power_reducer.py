@@ -0,0 +1,76 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+
+
+class TargetsPowerReducer:
+    """
+    Reduce the amount of power reports emitted per tick by keeping only the most consuming targets.
+    The power of the other targets is folded into a single synthetic target, so the energy of a tick still adds up.
+    """
+
+    OTHER_TARGET_NAME = 'other'
+
+    def __init__(self, top_k: int = 0, min_power: float = 0.0, min_ratio: float = 0.0):
+        """
+        Initialize a new targets power reducer.
+        :param top_k: Maximum amount of targets kept per tick (0 for unlimited)
+        :param min_power: Minimum power of the kept targets (in Watt)
+        :param min_ratio: Minimum ratio of the global power of the kept targets
+        """
+        self.top_k = top_k
+        self.min_power = min_power
+        self.min_ratio = min_ratio
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns whether the reducer can drop targets.
+        """
+        return self.top_k > 0 or self.min_power > 0 or self.min_ratio > 0
+
+    def reduce(self, targets_power: np.ndarray, targets_ratio: np.ndarray) -> tuple[np.ndarray, float, float, int]:
+        """
+        Select the targets to emit and compute the values of the folded targets.
+        :param targets_power: Power estimation of the targets (in Watt)
+        :param targets_ratio: Ratio of the global power attributed to the targets
+        :return: Sorted indices of the kept targets, power, ratio and amount of the folded targets
+        """
+        keep_mask = (targets_power >= self.min_power) & (targets_ratio >= self.min_ratio)
+        kept_indices = np.flatnonzero(keep_mask)
+        if 0 < self.top_k < len(kept_indices):
+            top_indices = np.argpartition(targets_power[kept_indices], -self.top_k)[-self.top_k:]
+            kept_indices = np.sort(kept_indices[top_indices])
+
+        folded_mask = np.ones(len(targets_power), dtype=bool)
+        folded_mask[kept_indices] = False
+        return kept_indices, float(targets_power[folded_mask].sum()), float(targets_ratio[folded_mask].sum()), int(folded_mask.sum())
@@ -0,0 +1,100 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+from powerapi.report import PowerReport
+
+
+def get_power_report_series_key(report: PowerReport) -> tuple[str, str, str, int | None]:
+    """
+    Returns the key identifying the series of power reports of a target.
+    The rollup depth is part of the key because the name of a hierarchy node can be the same as the name of a target.
+    :param report: Power report of a target or of a hierarchy node
+    :return: Key of the series of the report
+    """
+    return report.target, report.metadata.get('scope'), report.metadata.get('socket'), report.metadata.get('rollup_depth')
+
+
+class TargetsPowerRollup:
+    """
+    Aggregate the power of the targets at the given depths of the hierarchy of their names (cgroup paths).
+    For example, at depth 2 the targets "/kubepods/burstable/pod1/ctr1" and "/kubepods/burstable/pod2/ctr1" are both
+    aggregated into the "/kubepods/burstable" node.
+    """
+
+    MAX_CACHED_TARGETS = 65536
+
+    def __init__(self, depths: list[int]):
+        """
+        Initialize a new targets power rollup.
+        :param depths: Depths of the hierarchy at which the power of the targets is aggregated
+        """
+        self.depths = sorted(set(depths))
+        self.targets_nodes: dict[str, list[tuple[int, str]]] = {}
+
+    def _get_target_nodes(self, target: str) -> list[tuple[int, str]]:
+        """
+        Get the nodes of the hierarchy a target is aggregated into, the nodes are computed once per target name.
+        :param target: Name of the target
+        :return: Depth and name of the nodes of the target
+        """
+        nodes = self.targets_nodes.get(target)
+        if nodes is None:
+            if len(self.targets_nodes) >= self.MAX_CACHED_TARGETS:
+                self.targets_nodes.clear()
+
+            root = '/' if target.startswith('/') else ''
+            parts = [part for part in target.split('/') if part]
+            nodes = [(depth, root + '/'.join(parts[:depth])) for depth in self.depths if depth <= len(parts)]
+            self.targets_nodes[target] = nodes
+
+        return nodes
+
+    def rollup(self, targets_name: list[str], targets_power: np.ndarray, targets_ratio: np.ndarray) -> list[tuple[str, int, float, float, int]]:
+        """
+        Aggregate the power of the targets of a tick.
+        :param targets_name: Name of the targets
+        :param targets_power: Power estimation of the targets (in Watt)
+        :param targets_ratio: Ratio of the global power attributed to the targets
+        :return: Name, depth, power, ratio and amount of targets of each node of the hierarchy
+        """
+        nodes: dict[tuple[int, str], list] = {}
+        for target_name, target_power, target_ratio in zip(targets_name, targets_power.tolist(), targets_ratio.tolist(), strict=True):
+            for node in self._get_target_nodes(target_name):
+                node_values = nodes.get(node)
+                if node_values is None:
+                    nodes[node] = [target_power, target_ratio, 1]
+                else:
+                    node_values[0] += target_power
+                    node_values[1] += target_ratio
+                    node_values[2] += 1
+
+        return [(name, depth, power, ratio, count) for (depth, name), (power, ratio, count) in nodes.items()]
@@ -0,0 +1,267 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import datetime
+import logging
+import re
+import time
+from typing import Any
+
+from powerapi.handler import Handler
+from powerapi.report import Report, HWPCReport, PowerReport, FormulaReport
+
+from smartwatts.metrics import MetricsExporter, MetricsRegistry
+from .energy_counters import EnergyCounters
+from .power_reports_downsampler import PowerReportsDownsampler
+from .processing_lag import ProcessingLagTracker
+from .report_batch import gen_report_batches
+from .tick_reorder_buffer import TickReorderBuffer
+
+
+class TickHandler(Handler):
+    """
+    Base class of the handlers grouping the HWPC reports by tick before processing them.
+    The subclasses must initialize the `ticks` reorder buffer and implement the processing of a tick.
+    """
+
+    ticks: TickReorderBuffer
+
+    def __init__(self, state, output_config=None):
+        """
+        Initialize a new tick handler.
+        :param state: State of the formula
+        :param output_config: Formula configuration defining how the reports are sent, None to send them one by one as generated
+        """
+        Handler.__init__(self, state)
+        self.report_batch = output_config.report_batch if output_config is not None else False
+        self.report_batch_format = output_config.report_batch_format if output_config is not None else 'reports'
+        self.report_routes: dict[type[Report], list[tuple[str, Any]]] = {}
+        self.downsampler = None
+        self.energy_counters = None
+        if output_config is not None:
+            reports_period = datetime.timedelta(milliseconds=output_config.reports_frequency)
+            output_period = datetime.timedelta(milliseconds=output_config.output_period) if output_config.output_period > 0 else reports_period
+            if output_config.output_period > 0:
+                self.downsampler = PowerReportsDownsampler(output_period)
+            if output_config.energy_counters:
+                self.energy_counters = EnergyCounters(reports_period, datetime.timedelta(milliseconds=output_config.energy_counters_interval), output_period)
+
+        # The metrics are only collected when enabled, every instrumentation point checks the registry first.
+        self.metrics: MetricsRegistry | None = None
+        self.metrics_exporter: MetricsExporter | None = None
+        self.metrics_scope = output_config.scope.value if output_config is not None else ''
+        if output_config is not None and output_config.metrics_output != 'none':
+            self.metrics = MetricsRegistry({'dispatcher': state.dispatcher, 'sensor': state.sensor, 'socket': str(state.socket)})
+            exporter_name = re.sub(r'[^A-Za-z0-9_.-]', '_', f'smartwatts_{state.dispatcher}_{state.sensor}_{state.socket}')
+            self.metrics_exporter = MetricsExporter(self.metrics, output_config.metrics_output, exporter_name, output_config.metrics_dir, output_config.metrics_interval)
+
+        self.formula_report_lag = output_config is not None and output_config.formula_report_lag
+        self.lag_tracker = None
+        if self.metrics is not None or self.formula_report_lag:
+            self.lag_tracker = ProcessingLagTracker(naive_timestamps_utc=output_config.lag_naive_timestamps == 'utc')
+
+    def _inc_counter(self, name: str, help_text: str, labels: dict[str, str] | None = None) -> None:
+        """
+        Increment a counter of the metrics registry, if the metrics are enabled.
+        :param name: Name of the counter
+        :param help_text: Description of the counter
+        :param labels: Labels of the counter
+        """
+        if self.metrics is not None:
+            self.metrics.counter(name, help_text, labels).inc()
+
+    def _start_stage_timer(self) -> float | None:
+        """
+        Start timing a processing stage, if the metrics are enabled.
+        :return: Value of the performance counter at the start of the stage, None when the metrics are disabled
+        """
+        return time.perf_counter() if self.metrics is not None else None
+
+    def _observe_stage_duration(self, stage: str, start_time: float | None) -> None:
+        """
+        Record the duration of a processing stage of the scope of the handler in the metrics registry.
+        :param stage: Name of the processing stage
+        :param start_time: Value of the performance counter at the start of the stage, None when the metrics are disabled
+        """
+        if start_time is None:
+            return
+
+        labels = {'stage': stage, 'scope': self.metrics_scope}
+        self.metrics.histogram('smartwatts_stage_duration_seconds', 'Duration of the tick processing stages', labels).observe(time.perf_counter() - start_time)
+
+    def _get_report_pushers(self, report_type: type[Report]) -> list[tuple[str, Any]]:
+        """
+        Get the pushers handling the given type of report, the matching pushers are resolved once per report type.
+        :param report_type: Type of the report
+        :return: Name and actor of the pushers handling the reports of this type
+        """
+        pushers = self.report_routes.get(report_type)
+        if pushers is None:
+            pushers = [(name, pusher) for name, pusher in self.state.pushers.items() if issubclass(report_type, pusher.state.report_model)]
+            self.report_routes[report_type] = pushers
+
+        return pushers
+
+    def _downsample_reports(self, reports: list[Report]) -> list[Report]:
+        """
+        Aggregate the power reports of a tick over the output period, the other reports are kept as is.
+        :param reports: Reports generated for a tick
+        :return: Reports to send, including the average power reports of the output period completed by this tick if any
+        """
+        output_reports = []
+        for report in reports:
+            if isinstance(report, PowerReport):
+                output_reports.extend(self.downsampler.add(report))
+            else:
+                output_reports.append(report)
+
+        return output_reports
+
+    def flush_output(self) -> None:
+        """
+        Send the reports of the pending output period and export the metrics, if enabled.
+        """
+        if self.downsampler is not None:
+            self._send_reports(self.downsampler.flush(), downsample=False)
+
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.export()
+
+    def _send_reports(self, reports: list[Report], downsample: bool = True) -> None:
+        """
+        Send the reports generated for a tick to the pushers handling them.
+        :param reports: Generated reports
+        :param downsample: Whether the power reports are aggregated over the output period before being sent
+        """
+        if downsample and self.downsampler is not None:
+            reports = self._downsample_reports(reports)
+
+        if self.energy_counters is not None:
+            for report in reports:
+                if isinstance(report, PowerReport):
+                    self.energy_counters.update(report)
+
+        if not self.report_batch:
+            for report in reports:
+                for name, pusher in self._get_report_pushers(type(report)):
+                    pusher.send_data(report)
+                    logging.debug('sent report: %s to %s', report, name)
+            return
+
+        batches: dict[str, tuple[Any, list[Report]]] = {}
+        for report in reports:
+            for name, pusher in self._get_report_pushers(type(report)):
+                batches.setdefault(name, (pusher, []))[1].append(report)
+
+        for name, (pusher, batch_reports) in batches.items():
+            for batch in gen_report_batches(self.state.dispatcher, batch_reports, self.report_batch_format):
+                pusher.send_data(batch)
+                logging.debug('sent %s to %s', batch, name)
+
+    def handle(self, msg: HWPCReport) -> None:
+        """
+        Process a HWPC report and send the result(s) to a pusher actor.
+        :param msg: Received HWPC report
+        """
+        logging.debug('received message: %s', msg)
+        if not self.ticks.add(msg):
+            logging.debug('dropped late report of target %s for tick %s', msg.target, msg.timestamp)
+            self._inc_counter('smartwatts_reports_dropped_total', 'Amount of HWPC reports dropped because they arrived too late')
+            return
+
+        # The ticks are processed only once they are considered complete by the reorder buffer.
+        # We wait before processing the ticks in order to mitigate the possible delay between the sensor/database.
+        for timestamp, hwpc_reports in self.ticks.pop_ready_ticks():
+            if self.lag_tracker is None:
+                self._send_reports(self._process_tick(timestamp, hwpc_reports))
+            else:
+                self._process_tick_instrumented(timestamp, hwpc_reports)
+
+        if self.metrics is not None:
+            self.metrics.gauge('smartwatts_tick_buffer_depth', 'Amount of ticks waiting in the reorder buffer').set(len(self.ticks))
+            self.metrics_exporter.maybe_export()
+
+    def _process_tick_instrumented(self, timestamp: datetime.datetime, hwpc_reports: dict[str, HWPCReport]) -> None:
+        """
+        Process a tick and send the generated reports, recording the duration of both stages and the processing lag.
+        :param timestamp: Timestamp of the tick
+        :param hwpc_reports: HWPC reports of the tick, indexed by target
+        """
+        start_time = self._start_stage_timer()
+        reports = self._process_tick(timestamp, hwpc_reports)
+        self._observe_stage_duration('process', start_time)
+
+        lag = self.lag_tracker.observe(timestamp)
+        if self.formula_report_lag:
+            for report in reports:
+                if isinstance(report, FormulaReport):
+                    report.metadata['lag_ms'] = lag * 1000
+
+        start_time = self._start_stage_timer()
+        self._send_reports(reports)
+        self._observe_stage_duration('send', start_time)
+
+        if self.metrics is not None:
+            self.metrics.counter('smartwatts_ticks_processed_total', 'Amount of processed ticks').inc()
+            self.metrics.gauge('smartwatts_processing_lag_seconds', 'Delay between the timestamp of the last processed tick and the emission of its reports').set(lag)
+            self.metrics.gauge('smartwatts_processing_lag_max_seconds', 'Maximum processing lag of the ticks').set(self.lag_tracker.max)
+            self.metrics.gauge('smartwatts_processing_lag_p99_seconds', 'Percentile 99 of the processing lag of the recent ticks').set(self.lag_tracker.current_percentile)
+
+    def _pop_global_report(self, timestamp: datetime.datetime, hwpc_reports: dict[str, HWPCReport]) -> HWPCReport | None:
+        """
+        Remove the report of the System target from the reports of a tick.
+        :param timestamp: Timestamp of the tick
+        :param hwpc_reports: HWPC reports of the tick, indexed by target
+        :return: HWPC report of the System target, None if the tick cannot be processed
+        """
+        try:
+            global_report = hwpc_reports.pop('all')
+        except KeyError:
+            # cannot process this tick without the reference measurements
+            logging.error('Failed to process tick %s: missing global report', timestamp)
+            self._inc_counter('smartwatts_ticks_missing_global_total', 'Amount of ticks dropped because of a missing global report')
+            return None
+
+        # Don't continue if there is no reports available.
+        # Can happen when reports are dropped by a pre-processor.
+        if len(hwpc_reports) == 0:
+            return None
+
+        return global_report
+
+    def _process_tick(self, timestamp: datetime.datetime, hwpc_reports: dict[str, HWPCReport]) -> list[Report]:
+        """
+        Process a tick and generate the reports to send to the pushers.
+        :param timestamp: Timestamp of the tick
+        :param hwpc_reports: HWPC reports of the tick, indexed by target
+        :return: Generated reports
+        """
+        raise NotImplementedError()
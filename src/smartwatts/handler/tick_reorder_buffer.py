@@ -0,0 +1,191 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import heapq
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import numpy as np
+from powerapi.report import HWPCReport
+
+REORDER_MODES = ['count', 'event-time', 'wall-clock']
+
+
+class TickReorderBuffer:
+    """
+    Buffer grouping the HWPC reports by timestamp (tick) and releasing the ticks in chronological order once they are
+    considered complete. A tick is released:
+      - count: when more than `depth` ticks are buffered
+      - event-time: when the most recent timestamp received is at least `lateness` ahead of it (watermark)
+      - wall-clock: when its first report was received at least `lateness` ago
+    The reports received for an already released tick are dropped and accounted as late. The amount of buffered ticks
+    is bounded, the oldest ticks are released early when the bound is reached.
+    When adaptive, the lateness is periodically resized to a percentile of the lateness observed for the recent reports.
+    """
+
+    ADAPTIVE_HISTORY_SIZE = 1000
+    ADAPTIVE_UPDATE_INTERVAL = 100
+
+    def __init__(self, mode: str = 'event-time', depth: int = 5, lateness: timedelta = timedelta(seconds=5), max_ticks: int = 100,
+                 clock: Callable[[], float] = time.monotonic, adaptive_percentile: float | None = None,
+                 min_lateness: timedelta = timedelta(0), max_lateness: timedelta = timedelta.max, lateness_margin: timedelta = timedelta(0)):
+        """
+        Initialize a new tick reorder buffer.
+        :param mode: Method used to decide when a tick is complete (count, event-time, wall-clock)
+        :param depth: Amount of ticks kept in the buffer (count mode)
+        :param lateness: Maximum lateness of the reports of a tick (event-time and wall-clock modes), initial value when adaptive
+        :param max_ticks: Maximum amount of ticks kept in the buffer (0 for unlimited)
+        :param clock: Monotonic clock used in wall-clock mode (in seconds)
+        :param adaptive_percentile: Percentile of the observed lateness used as lateness, None to keep a fixed lateness
+        :param min_lateness: Minimum lateness when adaptive
+        :param max_lateness: Maximum lateness when adaptive
+        :param lateness_margin: Margin added to the observed lateness percentile when adaptive
+        """
+        if mode not in REORDER_MODES:
+            raise ValueError(f'Unknown reorder mode {mode}')
+
+        if adaptive_percentile is not None and mode == 'count':
+            raise ValueError('Adaptive lateness is not supported in count mode')
+
+        self.mode = mode
+        self.depth = depth
+        self.lateness = lateness
+        self.max_ticks = max_ticks
+        self.clock = clock
+
+        self.ticks: dict[datetime, dict[str, HWPCReport]] = {}
+        self.ticks_arrival_time: dict[datetime, float] = {}
+        self._timestamps_heap: list[datetime] = []
+        self.max_timestamp: datetime | None = None
+        self.last_released_timestamp: datetime | None = None
+        self.late_reports_count = 0
+        self.forced_releases_count = 0
+
+        self.adaptive_percentile = adaptive_percentile
+        self.min_lateness = min_lateness
+        self.max_lateness = max_lateness
+        self.lateness_margin = lateness_margin
+        self.observed_lateness: deque[float] = deque(maxlen=self.ADAPTIVE_HISTORY_SIZE)
+        self._observations_since_update = 0
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def add(self, report: HWPCReport) -> bool:
+        """
+        Add a report to the buffer.
+        :param report: HWPC report to add
+        :return: False if the report is late (its tick was already released) and has been dropped, True otherwise
+        """
+        timestamp = report.timestamp
+        if self.last_released_timestamp is not None and timestamp <= self.last_released_timestamp:
+            self.late_reports_count += 1
+            self._observe_lateness(timestamp, None)
+            return False
+
+        tick = self.ticks.get(timestamp)
+        if tick is None:
+            tick = self.ticks[timestamp] = {}
+            self.ticks_arrival_time[timestamp] = self.clock()
+            heapq.heappush(self._timestamps_heap, timestamp)
+            if self.max_timestamp is None or timestamp > self.max_timestamp:
+                self.max_timestamp = timestamp
+
+        tick[report.target] = report
+        self._observe_lateness(timestamp, self.ticks_arrival_time[timestamp])
+        return True
+
+    def _observe_lateness(self, timestamp: datetime, tick_arrival_time: float | None) -> None:
+        """
+        Record the lateness of a received report and periodically resize the lateness of the buffer, when adaptive.
+        The lateness of a report is its delay behind the most recent timestamp received (event-time mode), or behind the
+        first report of its tick (wall-clock mode).
+        :param timestamp: Timestamp of the report
+        :param tick_arrival_time: Arrival time of the first report of the tick, None if the tick was already released
+        """
+        if self.adaptive_percentile is None:
+            return
+
+        if self.mode == 'event-time':
+            self.observed_lateness.append((self.max_timestamp - timestamp).total_seconds())
+        elif tick_arrival_time is not None:
+            self.observed_lateness.append(self.clock() - tick_arrival_time)
+        else:
+            # The arrival time of a released tick is unknown, the report was later than the current lateness.
+            # Recording it as twice the current lateness lets the lateness grow when the reports are often dropped.
+            self.observed_lateness.append(2 * self.lateness.total_seconds())
+
+        self._observations_since_update += 1
+        if self._observations_since_update >= self.ADAPTIVE_UPDATE_INTERVAL:
+            self._observations_since_update = 0
+            lateness = timedelta(seconds=float(np.percentile(self.observed_lateness, self.adaptive_percentile))) + self.lateness_margin
+            self.lateness = min(max(lateness, self.min_lateness), self.max_lateness)
+
+    def _is_oldest_tick_ready(self, oldest_timestamp: datetime) -> bool:
+        """
+        Check if the oldest tick of the buffer can be released.
+        :param oldest_timestamp: Timestamp of the oldest tick
+        :return: True if the oldest tick can be released, False otherwise
+        """
+        if 0 < self.max_ticks < len(self.ticks):
+            self.forced_releases_count += 1
+            return True
+
+        if self.mode == 'count':
+            return len(self.ticks) > self.depth
+
+        if self.mode == 'event-time':
+            return self.max_timestamp - oldest_timestamp >= self.lateness
+
+        return self.clock() - self.ticks_arrival_time[oldest_timestamp] >= self.lateness.total_seconds()
+
+    def _release_oldest_tick(self) -> tuple[datetime, dict[str, HWPCReport]]:
+        """
+        Remove the oldest tick from the buffer.
+        :return: Timestamp and reports of the oldest tick
+        """
+        timestamp = heapq.heappop(self._timestamps_heap)
+        del self.ticks_arrival_time[timestamp]
+        self.last_released_timestamp = timestamp
+        return timestamp, self.ticks.pop(timestamp)
+
+    def pop_ready_ticks(self) -> list[tuple[datetime, dict[str, HWPCReport]]]:
+        """
+        Remove and return the ticks that are ready to be processed, in chronological order.
+        :return: List of the timestamp and reports of the ready ticks
+        """
+        ready_ticks = []
+        while self._timestamps_heap and self._is_oldest_tick_ready(self._timestamps_heap[0]):
+            ready_ticks.append(self._release_oldest_tick())
+
+        return ready_ticks
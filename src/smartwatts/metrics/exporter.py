@@ -0,0 +1,93 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import os
+import time
+from collections.abc import Callable
+
+from .registry import MetricsRegistry
+
+METRICS_OUTPUTS = ['none', 'log', 'textfile']
+
+
+class MetricsExporter:
+    """
+    Periodically export the metrics of a registry to the logs or to a Prometheus textfile.
+    The textfile is meant to be collected by the textfile collector of the Prometheus node exporter.
+    """
+
+    def __init__(self, registry: MetricsRegistry, output: str, name: str, directory: str = '', interval: float = 10.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a new metrics exporter.
+        :param registry: Registry of the exported metrics
+        :param output: Output of the metrics (log or textfile)
+        :param name: Name identifying the registry in the logs and the name of the textfile
+        :param directory: Directory where the textfile is written (textfile output)
+        :param interval: Minimum interval between two exports (in seconds)
+        :param clock: Monotonic clock used to schedule the exports
+        """
+        if output not in METRICS_OUTPUTS[1:]:
+            raise ValueError(f'Unsupported metrics output: {output}')
+
+        self.registry = registry
+        self.output = output
+        self.name = name
+        self.path = os.path.join(directory, f'{name}.prom')
+        self.interval = interval
+        self.clock = clock
+        self.last_export_time = clock()
+
+    def maybe_export(self) -> None:
+        """
+        Export the metrics if the interval since the last export is elapsed.
+        """
+        now = self.clock()
+        if now - self.last_export_time >= self.interval:
+            self.last_export_time = now
+            self.export()
+
+    def export(self) -> None:
+        """
+        Export the metrics of the registry.
+        """
+        if self.output == 'log':
+            logging.info('metrics of %s: %s', self.name, self.registry.render_summary())
+            return
+
+        # write to a temporary file and rename it, so the collector never reads a partially written file
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                file.write(self.registry.render_prometheus())
+            os.replace(tmp_path, self.path)
+        except OSError as exn:
+            logging.warning('Failed to export the metrics of %s to %s: %s', self.name, self.path, exn)
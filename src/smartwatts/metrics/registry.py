@@ -0,0 +1,217 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from bisect import bisect_left
+
+DEFAULT_DURATION_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1, 5e-1, 1.0, 5.0)
+
+
+def escape_label_value(value) -> str:
+    """
+    Escape a label value for the Prometheus text format.
+    :param value: Label value
+    :return: Escaped label value
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Counter:
+    """
+    Monotonically increasing value.
+    """
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+        :param amount: Amount to add to the counter
+        """
+        self.value += amount
+
+
+class Gauge:
+    """
+    Value that can go up and down.
+    """
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """
+        Set the value of the gauge.
+        :param value: New value of the gauge
+        """
+        self.value = value
+
+
+class Histogram:
+    """
+    Distribution of observed values over fixed buckets.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_DURATION_BUCKETS):
+        """
+        :param buckets: Upper bounds of the buckets, in increasing order
+        """
+        self.buckets = buckets
+        self.buckets_count = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Add a value to the distribution.
+        :param value: Observed value
+        """
+        self.buckets_count[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    In-process registry of the metrics of a formula.
+    The metrics are only aggregated in memory, exporting them is the responsibility of a metrics exporter.
+    """
+
+    def __init__(self, labels: dict[str, str] | None = None):
+        """
+        Initialize a new metrics registry.
+        :param labels: Labels added to every metric of the registry
+        """
+        self.labels = labels if labels is not None else {}
+        self.families: dict[str, tuple[str, str, dict[tuple[tuple[str, str], ...], Counter | Gauge | Histogram]]] = {}
+
+    def _get_metric(self, metric_type: type, name: str, help_text: str, labels: dict[str, str] | None) -> Counter | Gauge | Histogram:
+        """
+        Get a metric of the registry, create it on first use.
+        :param metric_type: Type of the metric
+        :param name: Name of the metric family
+        :param help_text: Description of the metric family
+        :param labels: Labels identifying the metric in its family
+        :return: The metric
+        """
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = (metric_type.__name__.lower(), help_text, {})
+
+        metrics = family[2]
+        labels_key = tuple(sorted((labels or {}).items()))
+        metric = metrics.get(labels_key)
+        if metric is None:
+            metric = metrics[labels_key] = metric_type()
+
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: dict[str, str] | None = None) -> Counter:
+        """
+        Get a counter of the registry, create it on first use.
+        :param name: Name of the metric family
+        :param help_text: Description of the metric family
+        :param labels: Labels identifying the metric in its family
+        :return: The counter
+        """
+        return self._get_metric(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, labels: dict[str, str] | None = None) -> Gauge:
+        """
+        Get a gauge of the registry, create it on first use.
+        :param name: Name of the metric family
+        :param help_text: Description of the metric family
+        :param labels: Labels identifying the metric in its family
+        :return: The gauge
+        """
+        return self._get_metric(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str, labels: dict[str, str] | None = None) -> Histogram:
+        """
+        Get a histogram of the registry, create it on first use.
+        :param name: Name of the metric family
+        :param help_text: Description of the metric family
+        :param labels: Labels identifying the metric in its family
+        :return: The histogram
+        """
+        return self._get_metric(Histogram, name, help_text, labels)
+
+    def _format_labels(self, labels_key: tuple[tuple[str, str], ...], extra_labels: dict[str, str] | None = None) -> str:
+        """
+        Format the labels of a metric in the Prometheus text format.
+        :param labels_key: Labels identifying the metric in its family
+        :param extra_labels: Additional labels of the sample (bucket bound of the histograms)
+        :return: Formatted labels, empty when the metric has no label
+        """
+        labels = self.labels | dict(labels_key) | (extra_labels or {})
+        if not labels:
+            return ''
+
+        return '{' + ','.join(f'{key}="{escape_label_value(value)}"' for key, value in labels.items()) + '}'
+
+    def render_prometheus(self) -> str:
+        """
+        Render the metrics of the registry in the Prometheus text exposition format.
+        :return: Metrics in the Prometheus text format
+        """
+        lines = []
+        for name, (metric_type, help_text, metrics) in self.families.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for labels_key, metric in metrics.items():
+                if isinstance(metric, Histogram):
+                    cumulative_count = 0
+                    for bucket, bucket_count in zip((*metric.buckets, '+Inf'), metric.buckets_count, strict=True):
+                        cumulative_count += bucket_count
+                        lines.append(f'{name}_bucket{self._format_labels(labels_key, {"le": str(bucket)})} {cumulative_count}')
+                    lines.append(f'{name}_sum{self._format_labels(labels_key)} {metric.sum}')
+                    lines.append(f'{name}_count{self._format_labels(labels_key)} {metric.count}')
+                else:
+                    lines.append(f'{name}{self._format_labels(labels_key)} {metric.value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def render_summary(self) -> str:
+        """
+        Render a compact one line summary of the metrics of the registry, the histograms are summarized by their mean.
+        :return: Summary of the metrics
+        """
+        values = []
+        for name, (_, _, metrics) in self.families.items():
+            for labels_key, metric in metrics.items():
+                metric_name = name + ''.join(f'[{value}]' for _, value in labels_key)
+                if isinstance(metric, Histogram):
+                    mean = metric.sum / metric.count if metric.count else 0.0
+                    values.append(f'{metric_name}=count:{metric.count},mean:{mean:.6f}')
+                else:
+                    values.append(f'{metric_name}={metric.value:g}')
+
+        return ' '.join(values)
@@ -30,14 +30,26 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from .cpu_topology import CPUTopology
+from .event_schema import EventSchema
+from .learner import PowerModelLearner, OnlinePowerModelLearner, ElasticNetLearner, RecursiveLeastSquaresLearner
+from .rolling_statistics import RollingMean, RollingMedian
 from .sample_history import ReportHistory, ErrorHistory
 from .power_model import PowerModel
 from .frequency_layer import FrequencyLayer
+from .model_store import PowerModelStore
 
 __all__ = [
     'CPUTopology',
+    'ElasticNetLearner',
     'ErrorHistory',
+    'EventSchema',
     'FrequencyLayer',
+    'OnlinePowerModelLearner',
     'PowerModel',
-    'ReportHistory'
+    'PowerModelLearner',
+    'PowerModelStore',
+    'RecursiveLeastSquaresLearner',
+    'ReportHistory',
+    'RollingMean',
+    'RollingMedian'
 ]
@@ -77,3 +77,14 @@ class CPUTopology:
         :return: A list of supported frequencies in MHz
         """
         return [ratio * self.freq_bclk for ratio in range(self.ratio_min, self.ratio_max + 1)]
+
+    def get_nearest_supported_frequency(self, frequency: int) -> int:
+        """
+        Compute the nearest supported frequency that is lower or equal to the given frequency.
+        The supported frequencies are multiples of the base clock, the frequencies outside the supported range are
+        clamped to the minimum/maximum supported frequency.
+        :param frequency: CPU frequency in MHz
+        :return: The nearest supported frequency in MHz
+        """
+        ratio = min(max(frequency // self.freq_bclk, self.ratio_min), self.ratio_max)
+        return ratio * self.freq_bclk
@@ -0,0 +1,91 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections.abc import Iterable
+from operator import itemgetter
+
+import numpy as np
+
+
+class EventSchema:
+    """
+    This class stores the layout of the Core events used as features by the power models.
+    The events are sorted by name and mapped to a fixed column of the events matrix, the `time_*` events are ignored.
+    """
+
+    def __init__(self, events_name: Iterable[str]):
+        """
+        Initialize a new events schema.
+        :param events_name: Name of the events reported by the sensor
+        """
+        self.raw_events_name = frozenset(events_name)
+        self.events_name = sorted(name for name in self.raw_events_name if not name.startswith('time_'))
+        self.events_index = {name: index for index, name in enumerate(self.events_name)}
+        self._events_getter = itemgetter(*self.events_name) if len(self.events_name) > 1 else lambda events: tuple(events[name] for name in self.events_name)
+        self._events_matrix = np.zeros((0, len(self.events_name)))
+
+    def __len__(self) -> int:
+        """
+        Compute the number of events of the schema.
+        :return: Number of events used as features
+        """
+        return len(self.events_name)
+
+    def matches(self, events_name: Iterable[str]) -> bool:
+        """
+        Check if the given events are the ones described by the schema.
+        :param events_name: Name of the events reported by the sensor
+        :return: True if the events matches the schema, False otherwise
+        """
+        return self.raw_events_name == events_name
+
+    def events_matrix(self, rows: int) -> np.ndarray:
+        """
+        Returns a preallocated events matrix with the given number of rows.
+        The matrix is reused (and only grown when needed) between calls, its content is overwritten by the next call.
+        :param rows: Number of rows of the matrix
+        :return: Events matrix of shape (rows, number of events)
+        """
+        if rows > self._events_matrix.shape[0]:
+            self._events_matrix = np.zeros((max(rows, 2 * self._events_matrix.shape[0]), len(self.events_name)))
+
+        return self._events_matrix[:rows]
+
+    def extract_events_value(self, cpus_events: dict[str, dict[str, float]], out: np.ndarray) -> np.ndarray:
+        """
+        Store the sum of the events value of every CPU into the given row, following the schema layout.
+        :param cpus_events: Events group of a socket, indexed by CPU
+        :param out: Row where to store the events value
+        :raise: KeyError when an event of the schema is missing from the events group
+        :return: The row containing the events value
+        """
+        values = np.array([self._events_getter(events) for events in cpus_events.values()], dtype=float).reshape(len(cpus_events), len(self.events_name))
+        return np.sum(values, axis=0, out=out)
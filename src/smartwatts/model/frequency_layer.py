@@ -29,6 +29,13 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
+from concurrent.futures import Executor, Future
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from .learner import PowerModelLearner
 from .sample_history import ReportHistory, ErrorHistory
 from .power_model import PowerModel
 
@@ -38,33 +45,65 @@ class FrequencyLayer:
     Frequency layer of the CPU.
     """
 
-    def __init__(self, frequency: int, min_samples: int, samples_window_size: int, error_window_size: int) -> None:
+    def __init__(self, frequency: int, min_samples: int, samples_window_size: int, error_window_size: int, samples_dtype: DTypeLike = 'float64',
+                 error_window_method: str = 'median', learner: PowerModelLearner | None = None) -> None:
         """
         Initialize a new frequency layer.
         :param min_samples: Minimum amount of samples required before trying to learn a power model
         :param samples_window_size: Size of the samples history window used to keep samples to learn from
         :param error_window_size: Size of the error history window used to keep errors of the model
+        :param samples_dtype: Data type used to store the samples history (float64 or float32)
+        :param error_window_method: Method used to compute the error of the error history window (median or mean)
+        :param learner: Learner used to compute the power model of the layer, defaults to an ElasticNet learner
         """
-        self.model = PowerModel(frequency, min_samples)
-        self.samples_history = ReportHistory(samples_window_size)
-        self.error_history = ErrorHistory(error_window_size)
+        self.model = PowerModel(frequency, min_samples, learner)
+        self.samples_history = ReportHistory(samples_window_size, samples_dtype)
+        self.error_history = ErrorHistory(error_window_size, error_window_method)
+        self.pending_power_model: Future | None = None
 
-    def update_power_model(self, min_intercept: float, max_intercept: float) -> None:
+    def update_power_model(self, min_intercept: float, max_intercept: float, executor: Executor | None = None) -> None:
         """
         Learn a new power model using the sample's history.
+        When an executor is given, the learning is done asynchronously and the new model is applied by a later call to
+        `apply_pending_power_model`. Only one learning can be pending at a time, the other requests are coalesced.
+        Online learners are always updated synchronously as their model is already up-to-date with the samples.
         :param min_intercept: Minimum intercept value allowed for the model
         :param max_intercept: Maximum intercept value allowed for the model
+        :param executor: Executor used to learn the model asynchronously, None to learn it synchronously
         """
-        self.model.learn_power_model(self.samples_history, min_intercept, max_intercept)
+        if executor is None or self.model.learner.online:
+            self.model.learn_power_model(self.samples_history, min_intercept, max_intercept)
+        elif self.pending_power_model is None:
+            self.pending_power_model = self.model.submit_power_model_learning(self.samples_history, min_intercept, max_intercept, executor)
+
         self.error_history.clear()
 
-    def store_sample_in_history(self, power_reference: float, events_value: list[float]) -> None:
+    def apply_pending_power_model(self) -> None:
+        """
+        Replace the power model by the asynchronously learned one, if its learning is done.
+        """
+        if self.pending_power_model is None or not self.pending_power_model.done():
+            return
+
+        future, self.pending_power_model = self.pending_power_model, None
+        try:
+            model = future.result()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception('Failed to learn the power model of frequency layer %s', self.model.frequency)
+            return
+
+        if model is not None:
+            self.model.update_model(model)
+
+    def store_sample_in_history(self, power_reference: float, events_value: list[float] | np.ndarray) -> None:
         """
         Append a sample to the history.
         :param power_reference: Power reference (RAPL) of the machine
         :param events_value: Events value (Hardware Performance Counters) of the target
         """
         self.samples_history.store_report(power_reference, events_value)
+        if self.model.learner.online:
+            self.model.learner.partial_fit(events_value, power_reference)
 
     def store_error_in_history(self, error: float) -> None:
         """
@@ -72,3 +111,29 @@ class FrequencyLayer:
         :param error: Power model error
         """
         self.error_history.store_error(error)
+
+    def restore(self, model: PowerModel, samples_history: ReportHistory | None) -> None:
+        """
+        Restore the state of a stored frequency layer into this one, built from the current configuration.
+        The stored samples are re-inserted into the samples history, so that its current window size and data type are
+        used. When the state of the stored learner cannot be reused, the samples are fed to the current online learner.
+        :param model: Stored power model of the layer
+        :param samples_history: Stored samples history of the layer, None if not stored
+        """
+        learner_restored = self.model.restore(model)
+        if samples_history is None:
+            return
+
+        for power_reference, events_value in zip(samples_history.power_values, samples_history.events_values, strict=True):
+            if learner_restored:
+                self.samples_history.store_report(power_reference, events_value)
+            else:
+                self.store_sample_in_history(power_reference, events_value)
+
+    def release_history(self) -> None:
+        """
+        Release the samples and error histories of the layer, the power model is kept.
+        Used to bound the memory of the layers that are not used anymore.
+        """
+        self.samples_history.clear()
+        self.error_history.clear()
@@ -0,0 +1,168 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import warnings
+
+import numpy as np
+from scipy.linalg import solve_triangular
+from scipy.optimize import nnls
+from sklearn.base import RegressorMixin
+from sklearn.linear_model import ElasticNet, LinearRegression
+
+
+class PowerModelLearner:
+    """
+    Base class of the learners used to compute the coefficients of the power models.
+    Batch learners fit a new model from the whole samples history.
+    """
+
+    online = False
+
+    def has_same_configuration(self, other: 'PowerModelLearner') -> bool:
+        """
+        Check whether the given learner uses the same method and parameters, its state can then be reused by this one.
+        :param other: Learner to compare with
+        :return: True if the learners have the same configuration, False otherwise
+        """
+        return type(self) is type(other)
+
+    def fit(self, events_values: np.ndarray, power_values: np.ndarray, fit_intercept: bool) -> RegressorMixin | None:
+        """
+        Fit a new model using the given samples.
+        :param events_values: Events value of the samples
+        :param power_values: Power reference of the samples
+        :param fit_intercept: Whether to compute the intercept of the model
+        :return: The fitted model
+        """
+        raise NotImplementedError()
+
+
+class OnlinePowerModelLearner(PowerModelLearner):
+    """
+    Base class of the online learners.
+    Online learners incrementally update their model with each sample, and only publish it when a new power model is
+    requested.
+    """
+
+    online = True
+
+    def partial_fit(self, events_value: np.ndarray, power_reference: float) -> None:
+        """
+        Update the model of the learner with a new sample.
+        :param events_value: Events value of the sample
+        :param power_reference: Power reference of the sample
+        """
+        raise NotImplementedError()
+
+    def current_model(self) -> RegressorMixin | None:
+        """
+        Returns a snapshot of the model of the learner.
+        :return: The current model, None if the learner haven't received any sample
+        """
+        raise NotImplementedError()
+
+    def fit(self, events_values: np.ndarray, power_values: np.ndarray, fit_intercept: bool) -> RegressorMixin | None:
+        for events_value, power_reference in zip(events_values, power_values, strict=True):
+            self.partial_fit(events_value, power_reference)
+
+        return self.current_model()
+
+
+class ElasticNetLearner(PowerModelLearner):
+    """
+    Batch learner fitting an ElasticNet model with positive coefficients from the samples history.
+    """
+
+    def fit(self, events_values: np.ndarray, power_values: np.ndarray, fit_intercept: bool) -> ElasticNet:
+        model = ElasticNet(fit_intercept=fit_intercept, positive=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model.fit(events_values, power_values)
+
+        return model
+
+
+class RecursiveLeastSquaresLearner(OnlinePowerModelLearner):
+    """
+    Online learner using an exponentially weighted recursive least squares estimator.
+    The estimator is kept in information form: each sample updates the weighted correlation matrix of the events and
+    their correlation with the power reference in O(n_events²). The coefficients are only solved when a model is
+    requested, as a ridge regularized least squares problem constrained to non-negative coefficients.
+    The events are scaled by the magnitude of the first sample to keep the problem well conditioned with raw hardware
+    counters values.
+    """
+
+    def __init__(self, forgetting_factor: float = 0.99, regularization: float = 1e-3):
+        """
+        Initialize a new recursive least squares learner.
+        :param forgetting_factor: Weight given to the previous samples at each update (between 0 and 1)
+        :param regularization: Ridge regularization applied to the scaled coefficients
+        """
+        self.forgetting_factor = forgetting_factor
+        self.regularization = regularization
+        self.samples_count = 0
+        self._scale: np.ndarray | None = None
+        self._correlation: np.ndarray | None = None
+        self._cross_correlation: np.ndarray | None = None
+
+    def has_same_configuration(self, other: PowerModelLearner) -> bool:
+        return super().has_same_configuration(other) and (self.forgetting_factor, self.regularization) == (other.forgetting_factor, other.regularization)
+
+    def partial_fit(self, events_value: np.ndarray, power_reference: float) -> None:
+        events_value = np.asarray(events_value, dtype=np.float64)
+        if self._scale is None:
+            n_features = len(events_value) + 1
+            self._scale = np.append(np.maximum(np.abs(events_value), 1.0), 1.0)
+            self._correlation = np.zeros((n_features, n_features))
+            self._cross_correlation = np.zeros(n_features)
+
+        # The last feature is a constant used to learn the intercept of the model.
+        features = np.append(events_value, 1.0) / self._scale
+        self._correlation *= self.forgetting_factor
+        self._correlation += np.outer(features, features)
+        self._cross_correlation *= self.forgetting_factor
+        self._cross_correlation += features * power_reference
+        self.samples_count += 1
+
+    def current_model(self) -> LinearRegression | None:
+        if self._scale is None:
+            return None
+
+        regularized_correlation = self._correlation + self.regularization * np.eye(len(self._scale))
+        cholesky_factor = np.linalg.cholesky(regularized_correlation)
+        weights, _ = nnls(cholesky_factor.T, solve_triangular(cholesky_factor, self._cross_correlation, lower=True))
+
+        coefficients = weights / self._scale
+        model = LinearRegression(positive=True)
+        model.coef_ = coefficients[:-1]
+        model.intercept_ = float(coefficients[-1])
+        model.n_features_in_ = len(model.coef_)
+        return model
@@ -0,0 +1,117 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import os
+import pickle
+import re
+import tempfile
+from typing import Any
+
+from .frequency_layer import FrequencyLayer
+
+
+class PowerModelStore:
+    """
+    This class stores snapshots of the power models of a formula on the local filesystem.
+    A snapshot contains the power model of each frequency layer (coefficients, intercept, id/hash and learner state),
+    and optionally their samples history. The snapshots are written atomically to avoid loading a truncated file.
+    """
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, directory: str, include_history: bool = False):
+        """
+        Initialize a new power model store.
+        :param directory: Directory where the snapshots are stored
+        :param include_history: Whether to store the samples history of the layers in the snapshots
+        """
+        self.directory = directory
+        self.include_history = include_history
+
+    def get_snapshot_path(self, key: str) -> str:
+        """
+        Compute the path of the snapshot file for the given key.
+        :param key: Key of the snapshot (sensor, socket and scope of the formula)
+        :return: Path of the snapshot file
+        """
+        return os.path.join(self.directory, re.sub(r'[^\w.-]', '_', key) + '.pkl')
+
+    def save(self, key: str, layers: dict[int, FrequencyLayer], events_name: frozenset[str] | None) -> None:
+        """
+        Store a snapshot of the given frequency layers.
+        :param key: Key of the snapshot (sensor, socket and scope of the formula)
+        :param layers: Frequency layers of the formula
+        :param events_name: Name of the events used as features by the power models
+        """
+        snapshot = {
+            'version': self.SNAPSHOT_VERSION,
+            'events': events_name,
+            'layers': {
+                frequency: (layer.model, layer.samples_history if self.include_history else None)
+                for frequency, layer in layers.items()
+                if layer.model.id > 0 or self.include_history
+            }
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.snapshot-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.get_snapshot_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """
+        Load the snapshot stored for the given key.
+        :param key: Key of the snapshot (sensor, socket and scope of the formula)
+        :return: Dictionary containing the events name and the layers (power model and samples history) of the snapshot,
+                 None when there is no usable snapshot for the key
+        """
+        try:
+            with open(self.get_snapshot_path(key), 'rb') as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exn:
+            logging.warning('Failed to load the power models snapshot of %s: %s', key, exn)
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != self.SNAPSHOT_VERSION:
+            logging.warning('Ignoring the power models snapshot of %s: unsupported snapshot version', key)
+            return None
+
+        return snapshot
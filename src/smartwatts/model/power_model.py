@@ -29,12 +29,16 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import warnings
+from concurrent.futures import Executor, Future
 from hashlib import sha1
 from pickle import dumps
 
+import numpy as np
+from sklearn.base import RegressorMixin
 from sklearn.linear_model import ElasticNet
+from sklearn.utils.validation import check_is_fitted
 
+from .learner import PowerModelLearner, ElasticNetLearner
 from .sample_history import ReportHistory
 
 
@@ -43,13 +47,16 @@ class PowerModel:
     This Power model compute the power estimations and handle the learning of a new model when needed.
     """
 
-    def __init__(self, frequency: int, min_samples: int):
+    def __init__(self, frequency: int, min_samples: int, learner: PowerModelLearner | None = None):
         """
         Initialize a new power model.
         :param frequency: Frequency of the power model (in MHz)
+        :param min_samples: Minimum amount of samples required before trying to learn a power model
+        :param learner: Learner used to compute the power model, defaults to an ElasticNet learner
         """
         self.frequency = frequency
         self.min_samples = min_samples
+        self.learner = learner if learner is not None else ElasticNetLearner()
         self.clf = ElasticNet()
         self.hash = 'uninitialized'
         self.id = 0
@@ -64,20 +71,87 @@ class PowerModel:
         if len(samples_history) < self.min_samples:
             return
 
+        if self.learner.online:
+            model = self._check_model_intercept(self.learner.current_model(), min_intercept, max_intercept)
+        else:
+            fit_intercept = len(samples_history) == samples_history.max_length
+            model = self.fit_model(samples_history.events_values, samples_history.power_values, fit_intercept, min_intercept, max_intercept)
+
+        if model is not None:
+            self.update_model(model)
+
+    def submit_power_model_learning(self, samples_history: ReportHistory, min_intercept: float, max_intercept: float, executor: Executor) -> Future | None:
+        """
+        Submit the learning of a new power model to the given executor.
+        The learning is done on a snapshot of the reports history, the resulting model (if any) have to be applied
+        with `update_model` once the learning is done.
+        :param samples_history: History of the reports used to learn the model
+        :param min_intercept: Minimum value allowed for the intercept of the model
+        :param max_intercept: Maximum value allowed for the intercept of the model
+        :param executor: Executor used to learn the model
+        :return: Future of the learned model, None when there is not enough samples to learn a model
+        """
+        if len(samples_history) < self.min_samples:
+            return None
+
         fit_intercept = len(samples_history) == samples_history.max_length
-        model = ElasticNet(fit_intercept=fit_intercept, positive=True)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            model.fit(samples_history.events_values, samples_history.power_values)
+        events_values = samples_history.events_values.copy()
+        power_values = samples_history.power_values.copy()
+        return executor.submit(self.fit_model, events_values, power_values, fit_intercept, min_intercept, max_intercept)
 
-        # Discard the new model when the intercept is not in specified range
-        if not min_intercept <= model.intercept_ < max_intercept:
-            return
+    def fit_model(self, events_values: np.ndarray, power_values: np.ndarray, fit_intercept: bool, min_intercept: float, max_intercept: float) -> RegressorMixin | None:
+        """
+        Fit a new power model with the learner using the given samples.
+        :param events_values: Events value of the samples
+        :param power_values: Power reference of the samples
+        :param fit_intercept: Whether to compute the intercept of the model
+        :param min_intercept: Minimum value allowed for the intercept of the model
+        :param max_intercept: Maximum value allowed for the intercept of the model
+        :return: The fitted model, None when its intercept is not in the specified range
+        """
+        return self._check_model_intercept(self.learner.fit(events_values, power_values, fit_intercept), min_intercept, max_intercept)
+
+    @staticmethod
+    def _check_model_intercept(model: RegressorMixin | None, min_intercept: float, max_intercept: float) -> RegressorMixin | None:
+        """
+        Discard the given model when its intercept is not in the specified range.
+        :param model: Power model to check
+        :param min_intercept: Minimum value allowed for the intercept of the model
+        :param max_intercept: Maximum value allowed for the intercept of the model
+        :return: The given model if its intercept is in the specified range, None otherwise
+        """
+        if model is None or not min_intercept <= model.intercept_ < max_intercept:
+            return None
+
+        return model
 
+    def update_model(self, model: RegressorMixin) -> None:
+        """
+        Replace the power model by the given one and update the formula id/hash.
+        :param model: New power model
+        """
         self.clf = model
         self.hash = sha1(dumps(self.clf)).hexdigest()
         self.id += 1
 
+    def restore(self, model: 'PowerModel') -> bool:
+        """
+        Restore the fitted model and the formula id/hash of a stored power model.
+        The minimum amount of samples and the learner of this power model are kept, the state of the stored learner is
+        only reused when it has the same configuration as the current one.
+        :param model: Stored power model
+        :return: True if the state of the stored learner have been reused, False otherwise
+        """
+        self.clf = model.clf
+        self.hash = model.hash
+        self.id = model.id
+
+        if not self.learner.has_same_configuration(model.learner):
+            return False
+
+        self.learner = model.learner
+        return True
+
     def predict_power_consumption(self, events: list[float]) -> float | None:
         """
         Compute a power estimation from the events value using the power model.
@@ -87,6 +161,17 @@ class PowerModel:
         """
         return self.clf.predict([events])[0]
 
+    def predict_power_consumption_batch(self, events: np.ndarray) -> np.ndarray:
+        """
+        Compute the power estimations of several events vectors at once using the power model.
+        This is equivalent to calling `predict_power_consumption` on each row, without the per-call validation overhead.
+        :param events: Matrix of events value, one row per events vector
+        :raise: NotFittedError when the model haven't been fitted
+        :return: Power estimation for each row of the given matrix
+        """
+        check_is_fitted(self.clf)
+        return events @ self.clf.coef_ + self.clf.intercept_
+
     def cap_power_estimation(self, raw_target_power: float, raw_global_power: float) -> (float, float):
         """
         Cap target's power estimation to the global power estimation.
@@ -104,3 +189,23 @@ class PowerModel:
         target_intercept_share = target_ratio * self.clf.intercept_
 
         return target_power + target_intercept_share, target_ratio
+
+    def cap_power_estimations(self, raw_targets_power: np.ndarray, raw_global_power: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cap the power estimations of several targets to the global power estimation.
+        This is the vectorized version of `cap_power_estimation`.
+        :param raw_targets_power: Targets power estimation from the power model (in Watt)
+        :param raw_global_power: Global power estimation from the power model (in Watt)
+        :return: Capped power estimations (in Watt) with their ratio over global power consumption
+        """
+        targets_power = raw_targets_power - self.clf.intercept_
+        global_power = raw_global_power - self.clf.intercept_
+
+        if global_power <= 0.0:
+            return np.zeros_like(targets_power), np.zeros_like(targets_power)
+
+        positive = targets_power > 0.0
+        targets_ratio = np.where(positive, targets_power / global_power, 0.0)
+        targets_capped_power = np.where(positive, targets_power + targets_ratio * self.clf.intercept_, 0.0)
+
+        return targets_capped_power, targets_ratio
@@ -0,0 +1,246 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from heapq import heappush, heappop, heapify
+
+
+class RollingMean:
+    """
+    This class incrementally computes the mean of a sliding window of values in constant time.
+    The running sum uses a compensated (Neumaier) summation to avoid accumulating floating point errors.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new rolling mean estimator.
+        """
+        self._count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def __len__(self) -> int:
+        """
+        Compute the amount of values in the window.
+        :return: Amount of values in the window
+        """
+        return self._count
+
+    def _accumulate(self, value: float) -> None:
+        """
+        Add the given value to the running sum.
+        :param value: Value to add (negative to remove a value)
+        """
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def add(self, value: float) -> None:
+        """
+        Add a new value to the window.
+        :param value: Value to add
+        """
+        self._accumulate(value)
+        self._count += 1
+
+    def remove_oldest(self, value: float) -> None:
+        """
+        Remove the oldest value from the window.
+        :param value: Value of the oldest element of the window
+        """
+        self._accumulate(-value)
+        self._count -= 1
+
+    def clear(self) -> None:
+        """
+        Remove all the values from the window.
+        """
+        self._count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def value(self) -> float:
+        """
+        Compute the mean of the window.
+        :return: Mean of the values of the window, 0 when the window is empty
+        """
+        if self._count == 0:
+            return 0.0
+
+        return (self._sum + self._compensation) / self._count
+
+
+class RollingMedian:
+    """
+    This class incrementally computes the median of a sliding window of values in logarithmic time.
+    The window is split in two heaps (lower half in a max-heap, upper half in a min-heap), the values leaving the
+    window are lazily removed when they reach the top of their heap.
+    Each value is identified by its insertion sequence number, so duplicated values are removed exactly.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new rolling median estimator.
+        """
+        self._low: list[tuple[float, int]] = []  # max-heap of the lower half, stored as (-value, -seq)
+        self._high: list[tuple[float, int]] = []  # min-heap of the upper half, stored as (value, seq)
+        self._low_size = 0
+        self._high_size = 0
+        self._removed: set[tuple[float, int]] = set()
+        self._next_seq = 0
+        self._oldest_seq = 0
+
+    def __len__(self) -> int:
+        """
+        Compute the amount of values in the window.
+        :return: Amount of values in the window
+        """
+        return self._low_size + self._high_size
+
+    @property
+    def stored_values_count(self) -> int:
+        """
+        Compute the amount of values stored by the estimator, including the removed values not discarded yet.
+        :return: Amount of stored values
+        """
+        return len(self._low) + len(self._high)
+
+    def _low_top(self) -> tuple[float, int]:
+        """
+        Returns the greatest element of the lower half.
+        :return: Tuple containing the value and sequence number of the element
+        """
+        value, seq = self._low[0]
+        return -value, -seq
+
+    def _prune(self) -> None:
+        """
+        Pop the removed elements that are at the top of the heaps.
+        """
+        while self._low and self._low_top() in self._removed:
+            self._removed.discard(self._low_top())
+            heappop(self._low)
+
+        while self._high and self._high[0] in self._removed:
+            self._removed.discard(self._high[0])
+            heappop(self._high)
+
+    def _compact(self) -> None:
+        """
+        Rebuild the heaps without the removed elements when they represent the majority of the stored elements.
+        Removed elements that never reach the top of their heap would otherwise be kept forever.
+        """
+        if len(self._low) + len(self._high) <= 2 * len(self) + 16:
+            return
+
+        self._low = [(value, seq) for value, seq in self._low if (-value, -seq) not in self._removed]
+        self._high = [element for element in self._high if element not in self._removed]
+        heapify(self._low)
+        heapify(self._high)
+        self._removed.clear()
+
+    def _rebalance(self) -> None:
+        """
+        Move the top element between the heaps so that the lower half holds the same amount of elements, or one more.
+        """
+        if self._low_size > self._high_size + 1:
+            heappush(self._high, self._low_top())
+            heappop(self._low)
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            value, seq = heappop(self._high)
+            heappush(self._low, (-value, -seq))
+            self._low_size += 1
+            self._high_size -= 1
+
+        self._prune()
+
+    def add(self, value: float) -> None:
+        """
+        Add a new value to the window.
+        :param value: Value to add
+        """
+        element = (value, self._next_seq)
+        self._next_seq += 1
+
+        if self._low_size == 0 or element <= self._low_top():
+            heappush(self._low, (-value, -element[1]))
+            self._low_size += 1
+        else:
+            heappush(self._high, element)
+            self._high_size += 1
+
+        self._rebalance()
+
+    def remove_oldest(self, value: float) -> None:
+        """
+        Remove the oldest value from the window.
+        :param value: Value of the oldest element of the window
+        """
+        element = (value, self._oldest_seq)
+        self._oldest_seq += 1
+        self._removed.add(element)
+
+        if element <= self._low_top():
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+
+        self._prune()
+        self._rebalance()
+        self._compact()
+
+    def clear(self) -> None:
+        """
+        Remove all the values from the window.
+        """
+        self._low.clear()
+        self._high.clear()
+        self._removed.clear()
+        self._low_size = 0
+        self._high_size = 0
+        self._oldest_seq = self._next_seq
+
+    def value(self) -> float:
+        """
+        Compute the median of the window.
+        :return: Median of the values of the window, 0 when the window is empty
+        """
+        if self._low_size == 0:
+            return 0.0
+
+        if self._low_size > self._high_size:
+            return self._low_top()[0]
+
+        return (self._low_top()[0] + self._high[0][0]) / 2
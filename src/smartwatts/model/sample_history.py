@@ -29,84 +29,204 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from collections import deque
-from statistics import median, mean
+import numpy as np
+from numpy.typing import DTypeLike
+
+from .rolling_statistics import RollingMean, RollingMedian
 
 
 class ReportHistory:
     """
     This class stores the reports history to use when learning a new power model.
+    The samples are kept in a ring buffer backed by a preallocated array, allocated when the first sample is stored.
+    Each sample is written twice (at index i and i + max_length) so that the samples are always available as a
+    contiguous, correctly ordered, view of the buffer.
     """
 
-    def __init__(self, max_length: int):
+    def __init__(self, max_length: int, dtype: DTypeLike = np.float64):
         """
         Initialize a new reports history container.
         :param max_length: Maximum amount of samples to keep before overriding the oldest sample at insertion
+        :param dtype: Data type used to store the samples (float64 or float32)
         """
         self.max_length = max_length
-        self.events_values = deque(maxlen=max_length)
-        self.power_values = deque(maxlen=max_length)
+        self.dtype = np.dtype(dtype)
+        self._events_buffer: np.ndarray | None = None
+        self._power_buffer: np.ndarray | None = None
+        self._next_index = 0
+        self._length = 0
 
     def __len__(self) -> int:
         """
         Compute the length of the history.
         :return: Length of the history
         """
-        return len(self.events_values)
+        return self._length
 
-    def store_report(self, power_reference: float, events_value: list[float]) -> None:
+    def _window(self) -> slice:
+        """
+        Compute the position of the stored samples in the buffers.
+        :return: Slice of the buffers containing the samples, from the oldest to the newest
+        """
+        start = self._next_index if self._length == self.max_length else 0
+        return slice(start, start + self._length)
+
+    @property
+    def events_values(self) -> np.ndarray:
+        """
+        Returns the events value of the stored samples, from the oldest to the newest.
+        :return: View of the events value buffer, of shape (length of the history, number of events)
+        """
+        if self._events_buffer is None:
+            return np.empty((0, 0), dtype=self.dtype)
+
+        return self._events_buffer[self._window()]
+
+    @property
+    def power_values(self) -> np.ndarray:
+        """
+        Returns the power reference of the stored samples, from the oldest to the newest.
+        :return: View of the power reference buffer
+        """
+        if self._power_buffer is None:
+            return np.empty(0, dtype=self.dtype)
+
+        return self._power_buffer[self._window()]
+
+    def store_report(self, power_reference: float, events_value: list[float] | np.ndarray) -> None:
         """
         Append a report to the report's history.
         :param events_value: List of raw events value
         :param power_reference: Power reference corresponding to the events value
         """
-        self.events_values.append(events_value)
-        self.power_values.append(power_reference)
+        if self.max_length == 0:
+            return
+
+        if self._events_buffer is None:
+            self._events_buffer = np.zeros((2 * self.max_length, len(events_value)), dtype=self.dtype)
+            self._power_buffer = np.zeros(2 * self.max_length, dtype=self.dtype)
+
+        index = self._next_index
+        self._events_buffer[index] = self._events_buffer[index + self.max_length] = events_value
+        self._power_buffer[index] = self._power_buffer[index + self.max_length] = power_reference
+        self._next_index = (index + 1) % self.max_length
+        self._length = min(self._length + 1, self.max_length)
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the report's history, only the stored samples are kept to get a compact representation.
+        :return: State of the report's history
+        """
+        return {'max_length': self.max_length, 'dtype': self.dtype.str, 'events_values': self.events_values.copy(), 'power_values': self.power_values.copy()}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the state of the report's history.
+        :param state: State of the report's history
+        """
+        self.max_length = state['max_length']
+        self.dtype = np.dtype(state['dtype'])
+        self.clear()
+        for power_reference, events_value in zip(state['power_values'], state['events_values'], strict=True):
+            self.store_report(power_reference, events_value)
+
+    def clear(self) -> None:
+        """
+        Clear the report's history and release its buffers.
+        """
+        self._events_buffer = None
+        self._power_buffer = None
+        self._next_index = 0
+        self._length = 0
+
+
+ERROR_WINDOW_ESTIMATORS = {
+    'median': RollingMedian,
+    'mean': RollingMean,
+}
 
 
 class ErrorHistory:
     """
     This class stores the error history used to trigger the learning of a new power model.
+    The errors are kept in a preallocated ring buffer, and the error of the window is incrementally maintained by a
+    rolling estimator (median or mean) so that its computation does not depend on the size of the window.
     """
 
-    def __init__(self, max_length: int):
+    def __init__(self, max_length: int, method: str = 'median'):
         """
         Initialize a new error history container.
         :param max_length: Maximum amount of samples to keep before overriding the oldest sample at insertion
+        :param method: Method used to compute the error of the window (median or mean)
         """
+        if method not in ERROR_WINDOW_ESTIMATORS:
+            raise ValueError(f'Unknown method {method}')
+
         self.max_length = max_length
-        self.error_values = deque(maxlen=max_length)
+        self.method = method
+        self._estimator = ERROR_WINDOW_ESTIMATORS[method]()
+        self._error_buffer = np.zeros(max_length)
+        self._next_index = 0
+        self._length = 0
 
     def __len__(self) -> int:
         """
         Compute the length of the history.
         :return: Length of the history
         """
-        return len(self.error_values)
+        return self._length
+
+    @property
+    def error_values(self) -> np.ndarray:
+        """
+        Returns the stored errors, in no particular order.
+        :return: View of the error buffer
+        """
+        return self._error_buffer[:self._length]
 
     def store_error(self, error_value: float) -> None:
         """
         Append a report to the report's history.
         :param error_value: Power reference corresponding to the events value
         """
-        self.error_values.append(error_value)
+        if self.max_length == 0:
+            return
+
+        index = self._next_index
+        if self._length == self.max_length:
+            self._estimator.remove_oldest(float(self._error_buffer[index]))
+
+        self._error_buffer[index] = error_value
+        self._estimator.add(error_value)
+        self._next_index = (index + 1) % self.max_length
+        self._length = min(self._length + 1, self.max_length)
 
     def clear(self) -> None:
         """
         Clear the error history.
         """
-        self.error_values.clear()
+        self._estimator.clear()
+        self._next_index = 0
+        self._length = 0
 
-    def compute_error(self, method: str = 'median') -> float:
+    def compute_error(self, method: str | None = None) -> float:
         """
         Compute the error from the history.
-        :param method: Method to use to compute the error (median or mean)
+        The error is given by the rolling estimator when the method is the one of the history, and computed from the
+        stored errors otherwise.
+        :param method: Method to use to compute the error (median or mean), defaults to the method of the history
         :return: Error value
         """
+        if method is None or method == self.method:
+            return self._estimator.value()
+
+        if self._length == 0:
+            return 0.0
+
         if method == 'median':
-            return median(self.error_values)
+            return float(np.median(self.error_values))
 
         if method == 'mean':
-            return mean(self.error_values)
+            return float(np.mean(self.error_values))
 
         raise ValueError(f'Unknown method {method}')
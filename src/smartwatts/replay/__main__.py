@@ -0,0 +1,115 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import sys
+import time
+from importlib.metadata import version
+
+from powerapi.cli.generator import PusherGenerator, PullerGenerator
+from powerapi.database import DBError
+from powerapi.filter import Filter
+from powerapi.report import HWPCReport
+
+from smartwatts.__main__ import generate_smartwatts_parser, generate_formula_configuration, generate_report_filter_rule, validate_smartwatts_configuration
+from smartwatts.actor import SmartWattsFormulaScope, SmartWattsCombinedFormulaConfig
+from smartwatts.model import CPUTopology
+from smartwatts.replay import SmartWattsReplayEngine, ReplayPusher, iter_database_reports
+
+
+def generate_smartwatts_replay_parser():
+    """
+    Construct and returns the SmartWatts replay cli parameters parser.
+    :return: SmartWatts replay cli parameters parser
+    """
+    pm = generate_smartwatts_parser()
+    pm.add_argument('replay-chunk-size', help_text='Amount of HWPC reports processed between two writes of the output reports', argument_type=int, default_value=10000)
+    return pm
+
+
+def run_smartwatts_replay(config) -> None:
+    """
+    Replay the HWPC reports of the input database(s) through the SmartWatts formula.
+    :param config: CLI arguments namespace
+    """
+    logging.info('SmartWatts replay version %s based on PowerAPI version %s', version('smartwatts'), version('powerapi'))
+
+    cpu_topology = CPUTopology(config['cpu-tdp'], config['cpu-base-clock'], 1, int(config['cpu-base-freq'] / config['cpu-base-clock']), 100)
+
+    formulas_config = {}
+    if not config['disable-cpu-formula']:
+        formulas_config['cpu_dispatcher'] = generate_formula_configuration(config, cpu_topology, SmartWattsFormulaScope.CPU)
+    if not config['disable-dram-formula']:
+        formulas_config['dram_dispatcher'] = generate_formula_configuration(config, cpu_topology, SmartWattsFormulaScope.DRAM)
+    if config['combined-formula'] and len(formulas_config) > 1:
+        formulas_config = {'combined_dispatcher': SmartWattsCombinedFormulaConfig(list(formulas_config.values()))}
+
+    pullers = PullerGenerator(Filter()).generate(config)
+    pushers = {name: ReplayPusher(name, actor.state.report_model, actor.state.database) for name, actor in PusherGenerator().generate(config).items()}
+
+    try:
+        for pusher in pushers.values():
+            pusher.state.database.connect()
+        for puller in pullers.values():
+            puller.state.database.connect()
+    except DBError as exn:
+        logging.error('Failed to connect to database: %s', exn.msg)
+        sys.exit(1)
+
+    report_filter_rule = generate_report_filter_rule(config)
+    engine = SmartWattsReplayEngine(formulas_config, pushers, config['replay-chunk-size'])
+    begin = time.perf_counter()
+    for name, puller in pullers.items():
+        logging.info('Replaying the reports of input %s...', name)
+        engine.process(report for report in iter_database_reports(puller.state.database) if isinstance(report, HWPCReport) and report_filter_rule(report))
+
+    engine.close()
+    logging.info('Replayed %d reports in %.2f seconds', engine.processed_reports_count, time.perf_counter() - begin)
+
+
+if __name__ == "__main__":
+    args_parser = generate_smartwatts_replay_parser()
+    args = args_parser.parse()
+
+    validate_smartwatts_configuration(args)
+    if args['stream']:
+        logging.error('Invalid configuration: Replay mode cannot be used with the stream mode')
+        sys.exit(1)
+    if args['replay-chunk-size'] <= 0:
+        logging.error('Invalid configuration: Replay chunk size must be strictly positive')
+        sys.exit(1)
+
+    LOGGING_LEVEL = logging.DEBUG if args['verbose'] else logging.INFO
+    LOGGING_FORMAT = '%(asctime)s - %(process)d - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=LOGGING_LEVEL, format=LOGGING_FORMAT)
+
+    run_smartwatts_replay(args)
+    sys.exit(0)
@@ -0,0 +1,201 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+from collections.abc import Iterable, Iterator
+
+from powerapi.database import BaseDB
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
+from powerapi.report import Report, HWPCReport, BadInputData
+
+from smartwatts.actor import SmartWattsFormulaConfig, SmartWattsCombinedFormulaConfig, get_hwpc_report_handler_class
+from smartwatts.handler import ColumnarPowerReportBatch, FormulaInstanceState, ReportBatch, TickHandler
+
+
+class ReplayPusherState:
+    """
+    State of a replay pusher.
+    """
+
+    def __init__(self, report_model: type[Report], database: BaseDB):
+        """
+        Initialize a new replay pusher state.
+        :param report_model: Type of the reports handled by the pusher
+        :param database: Database where the reports are saved
+        """
+        self.report_model = report_model
+        self.database = database
+        self.buffer: list[Report] = []
+
+
+class ReplayPusher:
+    """
+    In-process replacement of a pusher actor used by the replay engine.
+    The reports are buffered and saved to the database in batches instead of being sent one by one to an actor.
+    """
+
+    def __init__(self, name: str, report_model: type[Report], database: BaseDB):
+        """
+        Initialize a new replay pusher.
+        :param name: Name of the pusher
+        :param report_model: Type of the reports handled by the pusher
+        :param database: Database where the reports are saved
+        """
+        self.name = name
+        self.state = ReplayPusherState(report_model, database)
+
+    def send_data(self, report: Report | ReportBatch | ColumnarPowerReportBatch) -> None:
+        """
+        Buffer a report, or the reports of a batch, to be saved to the database.
+        :param report: Report or reports batch to save
+        """
+        if isinstance(report, (ReportBatch, ColumnarPowerReportBatch)):
+            self.state.buffer.extend(report.to_reports())
+        else:
+            self.state.buffer.append(report)
+
+    def flush(self) -> None:
+        """
+        Save the buffered reports to the database.
+        """
+        if self.state.buffer:
+            self.state.database.save_many(self.state.buffer)
+            self.state.buffer = []
+
+
+class SmartWattsReplayEngine:
+    """
+    Offline engine replaying the HwPC reports of a database through the SmartWatts formulas.
+    The reports are dispatched in-process to one HwPC report handler per (scope, sensor, socket), exactly like the
+    dispatcher actors do, and the resulting reports are saved in chunks.
+    This produces the same Power and Formula reports as the actor pipeline without its messaging overhead.
+    """
+
+    def __init__(self, formulas_config: dict[str, SmartWattsFormulaConfig | SmartWattsCombinedFormulaConfig], pushers: dict[str, ReplayPusher], chunk_size: int = 10000):
+        """
+        Initialize a new replay engine.
+        :param formulas_config: Configuration of the formulas, indexed by the name of their dispatcher
+        :param pushers: Dictionary of available pushers
+        :param chunk_size: Amount of HwPC reports processed between two flushes of the pushers
+        """
+        self.formulas_config = formulas_config
+        self.pushers = pushers
+        self.chunk_size = chunk_size
+        self.dispatch_rule = HWPCDispatchRule(HWPCDepthLevel.SOCKET, primary=True)
+        self.handlers: dict[tuple[str, str, str], TickHandler] = {}
+        self.processed_reports_count = 0
+
+    def _get_handler(self, dispatcher: str, sensor: str, socket: str) -> TickHandler:
+        """
+        Get the HwPC report handler of the given formula, create it on first use.
+        :param dispatcher: Name of the dispatcher of the formula
+        :param sensor: Name of the sensor handled by the formula
+        :param socket: Socket handled by the formula
+        :return: HwPC report handler of the formula
+        """
+        formula_id = (dispatcher, sensor, socket)
+        handler = self.handlers.get(formula_id)
+        if handler is None:
+            config = self.formulas_config[dispatcher]
+            state = FormulaInstanceState(dispatcher, sensor, socket, self.pushers, config)
+            handler = get_hwpc_report_handler_class(config)(state)
+            self.handlers[formula_id] = handler
+            logging.debug('created formula %s', formula_id)
+
+        return handler
+
+    def process_report(self, report: HWPCReport) -> None:
+        """
+        Dispatch a HwPC report to the formula(s) handling it.
+        :param report: HwPC report to process
+        """
+        for sensor, socket in self.dispatch_rule.get_formula_id(report):
+            for dispatcher in self.formulas_config:
+                self._get_handler(dispatcher, sensor, socket).handle(report)
+
+        self.processed_reports_count += 1
+
+    def process_chunk(self, reports: Iterable[HWPCReport]) -> None:
+        """
+        Process a chunk of HwPC reports and save the generated reports.
+        :param reports: HwPC reports to process
+        """
+        for report in reports:
+            self.process_report(report)
+
+        self.flush()
+
+    def process(self, reports: Iterable[HWPCReport]) -> None:
+        """
+        Process the given HwPC reports by chunks.
+        :param reports: HwPC reports to process
+        """
+        chunk = []
+        for report in reports:
+            chunk.append(report)
+            if len(chunk) >= self.chunk_size:
+                self.process_chunk(chunk)
+                chunk = []
+
+        self.process_chunk(chunk)
+
+    def flush(self) -> None:
+        """
+        Save the reports buffered by the pushers.
+        """
+        for pusher in self.pushers.values():
+            pusher.flush()
+
+    def close(self) -> None:
+        """
+        Release the resources of the formulas and save the remaining reports.
+        """
+        for handler in self.handlers.values():
+            handler.close()
+
+        self.flush()
+
+
+def iter_database_reports(database: BaseDB) -> Iterator[Report]:
+    """
+    Iterate over the reports stored in a database, skipping the malformed ones.
+    :param database: Database to read the reports from
+    :return: Iterator over the reports of the database
+    """
+    database_it = database.iter(False)
+    while True:
+        try:
+            yield next(database_it)
+        except BadInputData as exn:
+            logging.error('Received malformed report from database: %s', exn.msg)
+            logging.debug('Raw report value: %s', exn.input_data)
+        except StopIteration:
+            return
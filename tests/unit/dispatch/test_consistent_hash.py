@@ -0,0 +1,98 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from collections import Counter
+from datetime import datetime
+
+import pytest
+from powerapi.report import HWPCReport
+
+from smartwatts.dispatch import PooledHWPCDispatchRule, SensorShardFilterRule, jump_consistent_hash
+
+
+def test_jump_consistent_hash_is_balanced_and_in_range():
+    """
+    Test that the keys are evenly assigned to the buckets.
+    """
+    buckets = Counter(jump_consistent_hash(f'sensor-{i}', 8) for i in range(8000))
+
+    assert sorted(buckets) == list(range(8))
+    assert min(buckets.values()) > 800
+
+
+def test_jump_consistent_hash_moves_few_keys_when_adding_a_bucket():
+    """
+    Test that only the keys assigned to the new bucket move when a bucket is added.
+    """
+    keys = [f'sensor-{i}' for i in range(2000)]
+    before = {key: jump_consistent_hash(key, 4) for key in keys}
+    after = {key: jump_consistent_hash(key, 5) for key in keys}
+
+    moved_keys = [key for key in keys if before[key] != after[key]]
+    assert all(after[key] == 4 for key in moved_keys)
+    assert len(moved_keys) < len(keys) / 4
+
+
+def test_jump_consistent_hash_rejects_invalid_buckets_count():
+    """
+    Test that an invalid amount of buckets is rejected.
+    """
+    with pytest.raises(ValueError, match='strictly positive'):
+        jump_consistent_hash('sensor', 0)
+
+
+def test_pooled_dispatch_rule_assigns_all_reports_of_a_sensor_to_the_same_worker():
+    """
+    Test that the reports of a sensor are always dispatched to the same worker.
+    """
+    rule = PooledHWPCDispatchRule(4)
+    global_report = HWPCReport(datetime(2024, 1, 1), 'sensor-1', 'all', {}, {})
+    target_report = HWPCReport(datetime(2024, 1, 1), 'sensor-1', 'target', {}, {})
+
+    assert rule.get_formula_id(global_report) == rule.get_formula_id(target_report)
+    assert rule.get_formula_id(global_report) == [(str(jump_consistent_hash('sensor-1', 4)),)]
+
+
+def test_sensor_shard_filter_rules_split_the_sensors_in_disjoint_slices():
+    """
+    Test that every sensor is accepted by exactly one shard.
+    """
+    rules = [SensorShardFilterRule(shard_index, 3) for shard_index in range(3)]
+    for i in range(100):
+        report = HWPCReport(datetime(2024, 1, 1), f'sensor-{i}', 'all', {}, {})
+        assert sum(rule(report) for rule in rules) == 1
+
+
+def test_sensor_shard_filter_rule_rejects_invalid_shard_index():
+    """
+    Test that a shard index outside the shards range is rejected.
+    """
+    with pytest.raises(ValueError, match='Shard index'):
+        SensorShardFilterRule(2, 2)
@@ -0,0 +1,115 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timedelta
+
+from powerapi.report import HWPCReport, PowerReport, FormulaReport
+
+from smartwatts.actor import SmartWattsFormulaConfig, SmartWattsFormulaScope
+from smartwatts.handler import HwPCReportHandler, TickHandler
+from smartwatts.model import CPUTopology
+
+
+class FakePusherState:
+    """
+    State of a fake pusher.
+    """
+
+    def __init__(self, report_model):
+        self.report_model = report_model
+
+
+class FakePusher:
+    """
+    Pusher storing the received reports in memory.
+    """
+
+    def __init__(self, report_model):
+        self.state = FakePusherState(report_model)
+        self.reports = []
+
+    def send_data(self, report):
+        """
+        Store the given report.
+        """
+        self.reports.append(report)
+
+
+class FakeFormulaState:
+    """
+    State of a fake formula actor.
+    """
+
+    def __init__(self, config, sensor: str = 'sensor', socket: str = '0'):
+        self.config = config
+        self.dispatcher = 'dispatcher'
+        self.sensor = sensor
+        self.socket = socket
+        self.pushers = {'power': FakePusher(PowerReport), 'formula': FakePusher(FormulaReport)}
+
+
+def gen_hwpc_reports(ticks_count: int, sensor: str = 'sensor', targets: tuple[str, ...] = ('a', 'b')) -> list[HWPCReport]:
+    """
+    Generate the HwPC reports of a sensor monitoring the given targets.
+    """
+    reports = []
+    for i in range(ticks_count):
+        timestamp = datetime(2024, 1, 1) + timedelta(seconds=i)
+        rapl = {'0': {'0': {'RAPL_ENERGY_PKG': (20 + i % 7) * 2**32, 'RAPL_ENERGY_DRAM': (5 + i % 3) * 2**32}}}
+        msr = {'0': {'0': {'APERF': 1000, 'MPERF': 1000, 'TSC': 1}}}
+        reports.append(HWPCReport(timestamp, sensor, 'all', {'rapl': rapl, 'msr': msr}, {}))
+        for target in targets:
+            core = {'0': {'0': {'CYCLES': 1000.0 * (i % 5 + 1), 'INSTRUCTIONS': 500.0 * (i % 3 + 1)}}}
+            reports.append(HWPCReport(timestamp, sensor, target, {'core': core}, {}))
+    return reports
+
+
+def gen_formula_config(scope: SmartWattsFormulaScope = SmartWattsFormulaScope.CPU, rapl_event: str = 'RAPL_ENERGY_PKG',
+                       error_threshold: float = 0.5, min_samples_required: int = 5, history_window_size: int = 60,
+                       **parameters) -> SmartWattsFormulaConfig:
+    """
+    Generate the configuration of a formula scope, the given parameters are passed to the config constructor.
+    """
+    return SmartWattsFormulaConfig(scope, 1000, rapl_event, error_threshold, CPUTopology(125, 100, 1, 21, 100),
+                                   min_samples_required, history_window_size, False, 60, 'median', **parameters)
+
+
+def run_formula(config, reports: list[HWPCReport], handler_class: type[TickHandler] = HwPCReportHandler, close: bool = False) -> tuple[TickHandler, FakeFormulaState]:
+    """
+    Process the given reports with a formula handler and returns the handler and its state.
+    """
+    state = FakeFormulaState(config)
+    handler = handler_class(state)
+    for report in reports:
+        handler.handle(report)
+    if close:
+        handler.close()
+    return handler, state
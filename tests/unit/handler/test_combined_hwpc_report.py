@@ -0,0 +1,77 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from smartwatts.actor import SmartWattsCombinedFormulaConfig, SmartWattsFormulaScope
+from smartwatts.handler import HwPCReportHandler, CombinedHwPCReportHandler, MultiplexedHwPCReportHandler
+
+from .helpers import FakeFormulaState, gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def get_pushed_reports(state: FakeFormulaState) -> list[tuple]:
+    """
+    Returns a comparable summary of the reports sent to the pushers.
+    """
+    power_reports = [(r.timestamp, r.target, r.power, r.metadata['scope']) for r in state.pushers['power'].reports]
+    formula_reports = [(r.timestamp, r.target, r.metadata['scope'], r.metadata['error']) for r in state.pushers['formula'].reports]
+    return sorted(power_reports + formula_reports, key=str)
+
+
+def test_combined_handler_produces_the_reports_of_separate_scopes():
+    """
+    Test that the combined handler produces the same reports as a handler per scope.
+    """
+    scopes = [(SmartWattsFormulaScope.CPU, 'RAPL_ENERGY_PKG'), (SmartWattsFormulaScope.DRAM, 'RAPL_ENERGY_DRAM')]
+    reports = gen_hwpc_reports(60)
+
+    expected_reports = []
+    for scope, rapl_event in scopes:
+        _, state = run_formula(gen_formula_config(scope, rapl_event), reports)
+        expected_reports += get_pushed_reports(state)
+
+    combined_config = SmartWattsCombinedFormulaConfig([gen_formula_config(scope, rapl_event) for scope, rapl_event in scopes])
+    combined_handler, combined_state = run_formula(combined_config, reports, CombinedHwPCReportHandler)
+
+    assert len(expected_reports) > 0
+    assert get_pushed_reports(combined_state) == sorted(expected_reports, key=str)
+    assert combined_handler.scopes_handler[1].events_schema is combined_handler.scopes_handler[0].events_schema
+
+
+def test_multiplexed_handler_routes_reports_to_each_sensor_socket():
+    """
+    Test that the multiplexed handler hosts a formula instance per sensor and socket.
+    """
+    state = FakeFormulaState(gen_formula_config())
+    handler = MultiplexedHwPCReportHandler(state, HwPCReportHandler)
+    for report, other_sensor_report in zip(gen_hwpc_reports(20), gen_hwpc_reports(20, 'other-sensor'), strict=True):
+        handler.handle(report)
+        handler.handle(other_sensor_report)
+
+    assert sorted(handler.handlers) == [('other-sensor', '0'), ('sensor', '0')]
+    assert {report.sensor for report in state.pushers['power'].reports} == {'sensor', 'other-sensor'}
@@ -0,0 +1,145 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timedelta
+
+import pytest
+from powerapi.report import PowerReport
+
+from smartwatts.handler import EnergyCounters
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def gen_power_reports(target: str, seconds: list[int], power: float = 10.0) -> list[PowerReport]:
+    """
+    Generate power reports of a target at the given seconds of a fixed start date.
+    """
+    start = datetime(2024, 1, 1)
+    return [PowerReport(start + timedelta(seconds=second), 'sensor', target, power, {'scope': 'cpu', 'socket': '0'}) for second in seconds]
+
+
+def test_energy_counters_are_attached_at_the_given_interval():
+    """
+    Test that the counters accumulate the energy of every report but are only attached at the given interval.
+    """
+    counters = EnergyCounters(timedelta(seconds=1), timedelta(seconds=2))
+    reports = gen_power_reports('a', [0, 1, 2, 3])
+    for report in reports:
+        counters.update(report)
+
+    assert [report.metadata.get('energy') for report in reports] == [10.0, None, 30.0, None]
+    assert [report.metadata.get('energy_reset') for report in reports] == [True, None, False, None]
+    assert counters.counters[('a', 'cpu', '0', None)] == 40.0
+
+
+def test_energy_counters_continue_across_a_short_gap():
+    """
+    Test that the counter of a target missing for less than the stale duration continues from its previous value.
+    """
+    counters = EnergyCounters(timedelta(seconds=1))
+    reports = gen_power_reports('a', [0, 1, EnergyCounters.STALE_PERIODS - 1])
+    for report in reports:
+        counters.update(report)
+
+    assert [report.metadata['energy'] for report in reports] == [10.0, 20.0, 30.0]
+    assert [report.metadata['energy_reset'] for report in reports] == [True, False, False]
+
+
+def test_energy_counters_of_stale_targets_are_evicted_and_reset():
+    """
+    Test that the counters of the targets not reported for the stale duration are evicted, and that the counter of a
+    target reappearing afterward restarts from zero with an explicit reset marker.
+    """
+    counters = EnergyCounters(timedelta(seconds=1))
+    running_reports = gen_power_reports('running', list(range(2 * EnergyCounters.STALE_PERIODS)))
+    terminated_report = gen_power_reports('terminated', [0])[0]
+    counters.update(terminated_report)
+    for report in running_reports:
+        counters.update(report)
+
+    assert list(counters.counters) == [('running', 'cpu', '0', None)]
+    assert list(counters.last_attach_timestamp) == [('running', 'cpu', '0', None)]
+    assert list(counters.last_update_timestamp) == [('running', 'cpu', '0', None)]
+    assert counters.counters[('running', 'cpu', '0', None)] == 10.0 * 2 * EnergyCounters.STALE_PERIODS
+
+    reappeared_report = gen_power_reports('terminated', [2 * EnergyCounters.STALE_PERIODS])[0]
+    counters.update(reappeared_report)
+    assert reappeared_report.metadata['energy'] == 10.0
+    assert reappeared_report.metadata['energy_reset'] is True
+
+
+def test_energy_counters_accumulate_the_targets_without_report():
+    """
+    Test that the energy accumulated for a target without power report is included in its next counter.
+    """
+    counters = EnergyCounters(timedelta(seconds=1))
+    report = gen_power_reports('a', [4])[0]
+    counters.accumulate('a', 'cpu', '0', report.timestamp - timedelta(seconds=1), 5.0)
+    counters.update(report)
+
+    assert report.metadata['energy'] == 15.0
+    assert report.metadata['energy_reset'] is True
+
+
+def test_energy_counters_of_downsampled_reports():
+    """
+    Test that the energy of a downsampled power report covers its amount of samples, and that its counter is only
+    evicted after being stale for several output periods.
+    """
+    counters = EnergyCounters(timedelta(seconds=1), output_period=timedelta(seconds=10))
+    reports = gen_power_reports('a', [0, 10 * (EnergyCounters.STALE_PERIODS - 1)])
+    reports[0].metadata['samples'] = 10
+    reports[1].metadata['samples'] = 4
+    for report in reports:
+        counters.update(report)
+
+    assert [report.metadata['energy'] for report in reports] == [100.0, 140.0]
+
+
+def test_handler_energy_counters_include_the_folded_targets():
+    """
+    Test that the energy of the targets folded by the targets reducer is accumulated into their own counters.
+    """
+    reports = gen_hwpc_reports(30)
+    for index, report in enumerate(reports):
+        # the "a" and "b" targets are in turn the most consuming one
+        tick = index // 3
+        if report.target == ('a' if tick % 2 else 'b'):
+            report.groups['core']['0']['0']['CYCLES'] *= 3
+
+    handler, _ = run_formula(gen_formula_config(energy_counters=True), reports)
+    reduced_handler, reduced_state = run_formula(gen_formula_config(energy_counters=True, output_top_k=1), reports)
+
+    assert {report.target for report in reduced_state.pushers['power'].reports} >= {'a', 'b', 'other'}
+    for target in ['a', 'b']:
+        key = (target, 'cpu', '0', None)
+        assert reduced_handler.energy_counters.counters[key] == pytest.approx(handler.energy_counters.counters[key])
@@ -0,0 +1,91 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from itertools import pairwise
+
+from powerapi.report import FormulaReport
+
+from .helpers import FakeFormulaState, gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def run_handler(formula_report_mode: str, formula_report_interval: int = 10) -> FakeFormulaState:
+    """
+    Process a trace with the given formula report mode and returns the state of the formula.
+    """
+    config = gen_formula_config(formula_report_mode=formula_report_mode, formula_report_interval=formula_report_interval)
+    return run_formula(config, gen_hwpc_reports(60))[1]
+
+
+def test_formula_report_carries_numeric_coefficients():
+    """
+    Test that the coefficients and intercept of the power model are reported as floats.
+    """
+    report = run_handler('always').pushers['formula'].reports[-1]
+
+    coefs = [value for name, value in report.metadata.items() if name.startswith('coef_')]
+    assert isinstance(report.metadata['intercept'], float)
+    assert coefs
+    assert all(isinstance(coef, float) for coef in coefs)
+
+
+def test_formula_report_can_be_stored_into_influxdb():
+    """
+    Test that the fields of the formula reports converted for InfluxDB are scalar values.
+    """
+    report = run_handler('always').pushers['formula'].reports[-1]
+
+    document = FormulaReport.to_influxdb(report)
+
+    assert document['fields']['coef_0'] == report.metadata['coef_0']
+    assert all(isinstance(value, (int, float, str, bool)) for value in document['fields'].values())
+
+
+def test_formula_report_on_change_mode_emits_only_model_changes():
+    """
+    Test that the on-change mode emits a formula report only when the power model used changes.
+    """
+    all_reports = run_handler('always').pushers['formula'].reports
+    changed_reports = run_handler('on-change').pushers['formula'].reports
+
+    models = [(r.metadata['layer_frequency'], r.metadata['id']) for r in changed_reports]
+    assert 0 < len(changed_reports) < len(all_reports)
+    assert all(previous != current for previous, current in pairwise(models))
+    assert set(models) == {(r.metadata['layer_frequency'], r.metadata['id']) for r in all_reports}
+
+
+def test_formula_report_interval_mode_emits_every_n_ticks():
+    """
+    Test that the interval mode emits a formula report every given amount of ticks.
+    """
+    all_reports = run_handler('always').pushers['formula'].reports
+    interval_reports = run_handler('interval', 5).pushers['formula'].reports
+
+    assert [r.timestamp for r in interval_reports] == [r.timestamp for r in all_reports[4::5]]
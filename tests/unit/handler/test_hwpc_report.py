@@ -0,0 +1,119 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from powerapi.report import HWPCReport
+
+from smartwatts.model import RecursiveLeastSquaresLearner
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def gen_multi_frequency_hwpc_reports(frequencies: list[int], ticks_per_frequency: int) -> list[HWPCReport]:
+    """
+    Generate HwPC reports visiting the given package frequencies in turn, each one for the given amount of ticks.
+    """
+    reports = gen_hwpc_reports(len(frequencies) * ticks_per_frequency)
+    global_reports = [report for report in reports if report.target == 'all']
+    for tick, report in enumerate(global_reports):
+        # the frequency is the base frequency (2100MHz) scaled by APERF/MPERF
+        report.groups['msr']['0']['0'] |= {'APERF': frequencies[tick // ticks_per_frequency], 'MPERF': 2100}
+    return reports
+
+
+def test_handler_restored_power_models_use_the_current_configuration(tmp_path):
+    """
+    Test that the power models restored from the model store use the learning configuration given at restart.
+    """
+    store_config = {'model_store_dir': str(tmp_path), 'model_store_history': True}
+    handler, _ = run_formula(gen_formula_config(**store_config), gen_hwpc_reports(30), close=True)
+    stored_layers = {frequency: layer.model.id for frequency, layer in handler.layers.items()}
+    assert any(model_id > 0 for model_id in stored_layers.values())
+
+    config = gen_formula_config(min_samples_required=20, history_window_size=8, learn_method='rls', **store_config)
+    restored_handler, _ = run_formula(config, [])
+
+    assert {frequency: layer.model.id for frequency, layer in restored_handler.layers.items()} == stored_layers
+    for layer in restored_handler.layers.values():
+        assert layer.model.min_samples == 20
+        assert layer.samples_history.max_length == 8
+        assert len(layer.samples_history) == 8
+        assert isinstance(layer.model.learner, RecursiveLeastSquaresLearner)
+
+
+def test_handler_resident_layers_eviction_keeps_the_power_models():
+    """
+    Test that exceeding the maximum amount of resident layers only releases the history of the least recently used
+    layers, the estimations of their kept power models being the same as without eviction.
+    """
+    # the error threshold is above the TDP so that the layers are only learned once, before the eviction of their history
+    reports = gen_multi_frequency_hwpc_reports([1000, 1500, 2100, 3000] * 2, 10)
+    _, state = run_formula(gen_formula_config(error_threshold=1000.0), reports)
+    handler, evicted_state = run_formula(gen_formula_config(error_threshold=1000.0, max_resident_layers=2), reports)
+
+    assert sorted(handler.layers) == [1000, 1500, 2100, 3000]
+    assert list(handler.resident_layers) == [2100, 3000]
+    assert all(layer.model.id == 1 for layer in handler.layers.values())
+    assert [len(handler.layers[frequency].samples_history) for frequency in [1000, 1500]] == [0, 0]
+
+    power_reports = [(report.timestamp, report.target, report.power) for report in state.pushers['power'].reports]
+    evicted_power_reports = [(report.timestamp, report.target, report.power) for report in evicted_state.pushers['power'].reports]
+    assert evicted_power_reports
+    assert evicted_power_reports == power_reports
+
+
+def test_handler_learns_when_the_working_set_exceeds_the_resident_layers():
+    """
+    Test that the layers visited in turn are still learned when they are more numerous than the resident layers, as the
+    layers without a fitted power model keep their history.
+    """
+    reports = gen_multi_frequency_hwpc_reports([1000, 1500, 2100, 3000] * 30, 1)
+    handler, state = run_formula(gen_formula_config(max_resident_layers=2), reports)
+
+    assert all(layer.model.id > 0 for layer in handler.layers.values())
+    assert len(handler.resident_layers) == 2
+    assert {report.target for report in state.pushers['power'].reports} == {'rapl', 'global', 'a', 'b'}
+    assert len(state.pushers['formula'].reports) > 0
+
+
+def test_handler_drops_the_ticks_without_core_events():
+    """
+    Test that the ticks whose targets have an empty core events group for the socket are dropped without failing.
+    """
+    reports = gen_hwpc_reports(30)
+    for report in reports:
+        if report.target != 'all' and report.timestamp.second in (10, 11):
+            report.groups['core']['0'] = {}
+
+    _, state = run_formula(gen_formula_config(), reports)
+
+    power_reports_timestamps = {report.timestamp.second for report in state.pushers['power'].reports if report.target == 'a'}
+    assert power_reports_timestamps
+    assert not power_reports_timestamps & {10, 11}
@@ -0,0 +1,74 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+
+from smartwatts.actor import SmartWattsCombinedFormulaConfig, SmartWattsFormulaScope
+from smartwatts.handler import CombinedHwPCReportHandler
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def test_handler_metrics_are_collected_and_exported_only_when_enabled(monkeypatch, tmp_path):
+    """
+    Test that the handler neither times its stages nor records metrics when they are disabled, and that it exports the
+    metrics it records to a Prometheus textfile when it is closed.
+    """
+    perf_counter_calls = []
+    monkeypatch.setattr(time, 'perf_counter', lambda: perf_counter_calls.append(None) or 0.0)
+    handler, _ = run_formula(gen_formula_config(formula_report_lag=True), gen_hwpc_reports(30), close=True)
+    assert handler.metrics is None
+    assert handler.metrics_exporter is None
+    assert not perf_counter_calls
+    monkeypatch.undo()
+
+    config = gen_formula_config(metrics_output='textfile', metrics_dir=str(tmp_path))
+    handler, _ = run_formula(config, gen_hwpc_reports(30), close=True)
+
+    assert handler.metrics.counter('smartwatts_ticks_processed_total', '').value == 25
+    assert handler.metrics.counter('smartwatts_learn_total', '', {'scope': 'cpu'}).value > 0
+    assert handler.metrics.histogram('smartwatts_stage_duration_seconds', '', {'stage': 'predict', 'scope': 'cpu'}).count > 0
+    assert [path.name for path in tmp_path.iterdir()] == ['smartwatts_dispatcher_sensor_0.prom']
+    content = (tmp_path / 'smartwatts_dispatcher_sensor_0.prom').read_text(encoding='utf-8')
+    assert content == handler.metrics.render_prometheus()
+    assert 'smartwatts_ticks_processed_total{dispatcher="dispatcher",sensor="sensor",socket="0"} 25' in content
+
+
+def test_combined_handler_stages_durations_are_labelled_by_scope():
+    """
+    Test that the combined handler records the duration of the stages of each scope separately.
+    """
+    scopes_config = [gen_formula_config(metrics_output='log'), gen_formula_config(SmartWattsFormulaScope.DRAM, 'RAPL_ENERGY_DRAM', metrics_output='log')]
+    handler, _ = run_formula(SmartWattsCombinedFormulaConfig(scopes_config), gen_hwpc_reports(30), CombinedHwPCReportHandler)
+
+    _, _, metrics = handler.metrics.families['smartwatts_stage_duration_seconds']
+    stages = {(dict(labels)['stage'], dict(labels)['scope']) for labels in metrics}
+    assert stages == {('preprocess', 'combined'), ('predict', 'cpu'), ('predict', 'dram'), ('process', 'combined'), ('send', 'combined')}
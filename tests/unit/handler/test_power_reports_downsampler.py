@@ -0,0 +1,106 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from powerapi.report import PowerReport
+
+from smartwatts.handler import PowerReportsDownsampler
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def gen_power_report(timestamp: datetime, target: str, power: float, ratio: float = 0.5) -> PowerReport:
+    """
+    Generate a power report of the CPU scope.
+    """
+    return PowerReport(timestamp, 'sensor', target, power, {'scope': 'cpu', 'socket': '0', 'formula': 'f', 'ratio': ratio})
+
+
+def test_downsampler_emits_the_average_power_of_each_period():
+    """
+    Test that the downsampler emits the average power and ratio of the targets once their output period is complete,
+    both averaged over the reports of the target.
+    """
+    downsampler = PowerReportsDownsampler(timedelta(seconds=2))
+    start = datetime(2024, 1, 1)
+
+    assert not downsampler.add(gen_power_report(start, 'a', 10.0, 0.2))
+    assert not downsampler.add(gen_power_report(start + timedelta(seconds=1), 'a', 20.0, 0.4))
+    assert not downsampler.add(gen_power_report(start + timedelta(seconds=1), 'b', 4.0, 0.1))
+    reports = downsampler.add(gen_power_report(start + timedelta(seconds=2), 'a', 30.0))
+
+    assert [(r.timestamp, r.target, r.power, r.metadata['samples']) for r in reports] == [(start, 'a', 15.0, 2), (start, 'b', 4.0, 1)]
+    assert [r.metadata['ratio'] for r in reports] == pytest.approx([0.3, 0.1])
+
+
+def test_downsampler_flushes_the_partial_period_without_under_reporting():
+    """
+    Test that flushing a period seen partially (on close) emits the average power of the reports seen.
+    """
+    downsampler = PowerReportsDownsampler(timedelta(seconds=10))
+    start = datetime(2024, 1, 1)
+    for second, power in enumerate([10.0, 20.0, 30.0]):
+        downsampler.add(gen_power_report(start + timedelta(seconds=second), 'a', power))
+
+    assert [(r.timestamp, r.power, r.metadata['samples']) for r in downsampler.flush()] == [(start, 20.0, 3)]
+    assert not downsampler.flush()
+
+
+@pytest.mark.parametrize('epoch', [datetime(1970, 1, 1), datetime(1970, 1, 1, tzinfo=timezone.utc)])
+def test_downsampler_aligns_the_periods_on_the_epoch(epoch):
+    """
+    Test that the output periods are aligned on the Unix epoch, also for periods not dividing a day.
+    """
+    downsampler = PowerReportsDownsampler(timedelta(seconds=7))
+    timestamp = epoch + timedelta(days=19723, seconds=12)
+
+    downsampler.add(gen_power_report(timestamp, 'a', 10.0))
+
+    # 19723 days are 243438171 periods of 7 seconds plus 3 seconds, the timestamp is 15 seconds after this period start
+    assert [r.timestamp for r in downsampler.flush()] == [epoch + timedelta(seconds=(19723 * 86400 // 7 + 2) * 7)]
+
+
+def test_handler_downsampling_preserves_the_targets_energy():
+    """
+    Test that the downsampled power reports carry the same energy as the power reports of every tick.
+    """
+    reports = gen_hwpc_reports(60)
+    _, state = run_formula(gen_formula_config(), reports)
+    _, downsampled_state = run_formula(gen_formula_config(output_period=10000), reports, close=True)
+
+    target_reports = [r for r in state.pushers['power'].reports if r.target == 'a']
+    downsampled_target_reports = [r for r in downsampled_state.pushers['power'].reports if r.target == 'a']
+    assert len(downsampled_target_reports) < len(target_reports)
+    assert sum(r.metadata['samples'] for r in downsampled_target_reports) == len(target_reports)
+    assert sum(r.power * r.metadata['samples'] for r in downsampled_target_reports) == pytest.approx(sum(r.power for r in target_reports))
+    assert len(downsampled_state.pushers['formula'].reports) == len(state.pushers['formula'].reports)
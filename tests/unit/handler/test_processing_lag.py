@@ -0,0 +1,104 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from smartwatts.handler import ProcessingLagTracker
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def test_lag_tracker_tracks_current_max_and_percentile():
+    """
+    Test that the tracker reports the current, maximum and percentile processing lag.
+    """
+    tracker = ProcessingLagTracker(percentile=50.0)
+    start = datetime(2024, 1, 1)
+    for lag in [1, 5, 2]:
+        tracker.observe(start, start + timedelta(seconds=lag))
+
+    assert tracker.current == 2.0
+    assert tracker.max == 5.0
+    assert tracker.current_percentile == 1.0
+
+    for _ in range(ProcessingLagTracker.PERCENTILE_UPDATE_INTERVAL):
+        tracker.observe(start, start + timedelta(seconds=3))
+    assert tracker.current_percentile == 3.0
+
+
+@pytest.fixture
+def non_utc_local_timezone(monkeypatch):
+    """
+    Set the local timezone of the process to a timezone ahead of UTC.
+    """
+    monkeypatch.setenv('TZ', 'Asia/Tokyo')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.usefixtures('non_utc_local_timezone')
+def test_lag_tracker_normalizes_the_timestamps_to_utc():
+    """
+    Test that the lag of naive (local or UTC) and aware timestamps is computed in UTC when the local time is not UTC.
+    """
+    now = datetime(2024, 1, 1, 0, 0, 2, tzinfo=timezone.utc)
+
+    local_tracker = ProcessingLagTracker()
+    assert local_tracker.observe(datetime(2024, 1, 1, 9, 0, 0), now) == 2.0
+    assert local_tracker.observe(datetime(2024, 1, 1, tzinfo=timezone.utc), now) == 2.0
+    assert local_tracker.observe(datetime(2024, 1, 1, 9, 0, 0), datetime(2024, 1, 1, 9, 0, 3)) == 3.0
+
+    utc_tracker = ProcessingLagTracker(naive_timestamps_utc=True)
+    assert utc_tracker.observe(datetime(2024, 1, 1), now) == 2.0
+    assert utc_tracker.observe(datetime(2024, 1, 1, tzinfo=timezone.utc), now) == 2.0
+    assert utc_tracker.observe(datetime(2024, 1, 1), datetime(2024, 1, 1, 0, 0, 3)) == 3.0
+    assert utc_tracker.observe(datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=2)) == pytest.approx(2.0, abs=0.5)
+
+
+def test_handler_adds_the_lag_to_the_formula_reports():
+    """
+    Test that the processing lag is added to the formula reports only when enabled.
+    """
+    handler, state = run_formula(gen_formula_config(), gen_hwpc_reports(30))
+    assert handler.lag_tracker is None
+    assert all('lag_ms' not in report.metadata for report in state.pushers['formula'].reports)
+
+    lag_handler, lag_state = run_formula(gen_formula_config(formula_report_lag=True), gen_hwpc_reports(30))
+
+    lags = [report.metadata['lag_ms'] for report in lag_state.pushers['formula'].reports]
+    assert lags
+    assert all(lag > 0 for lag in lags)
+    assert max(lags) <= lag_handler.lag_tracker.max * 1000
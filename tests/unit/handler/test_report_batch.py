@@ -0,0 +1,144 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+from datetime import datetime, timedelta
+
+from powerapi.report import PowerReport, FormulaReport
+
+from smartwatts.handler import ColumnarPowerReportBatch, ReportBatch, ReportBatchHandler, gen_report_batches
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+class FakeDatabase:
+    """
+    Database storing the saved reports in memory.
+    """
+
+    def __init__(self):
+        self.saved_reports = []
+
+    def save_many(self, reports):
+        """
+        Store the given reports.
+        """
+        self.saved_reports.append(list(reports))
+
+
+class FakePusherActor:
+    """
+    Pusher actor providing the logger used by its handlers.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger('pusher')
+
+
+class FakePusherState:
+    """
+    State of a pusher actor, as used by its reports handlers.
+    """
+
+    def __init__(self):
+        self.actor = FakePusherActor()
+        self.buffer = []
+        self.database = FakeDatabase()
+
+
+def test_report_batch_handler_applies_the_write_policy_once_per_batch():
+    """
+    Test that the reports of the batches are buffered, and written in bulk once the buffer exceeds its maximum size.
+    """
+    state = FakePusherState()
+    handler = ReportBatchHandler(state, delay=3600000, max_size=3)
+    start = datetime(2024, 1, 1)
+    reports = [PowerReport(start + timedelta(seconds=i), 'sensor', 'a', float(i), {}) for i in range(4)]
+
+    handler.handle(ReportBatch('formula', []))
+    handler.handle(ReportBatch('formula', [reports[1], reports[0]]))
+    assert state.buffer == [reports[1], reports[0]]
+    assert not state.database.saved_reports
+
+    handler.handle(ReportBatch('formula', reports[2:]))
+    assert state.database.saved_reports == [reports]
+    assert not state.buffer
+
+
+def test_handler_routes_reports_to_the_pushers_of_their_type():
+    """
+    Test that the reports are only sent to the pushers handling their type, resolved once per report type.
+    """
+    handler, state = run_formula(gen_formula_config(), gen_hwpc_reports(30))
+
+    assert state.pushers['power'].reports
+    assert all(isinstance(r, PowerReport) for r in state.pushers['power'].reports)
+    assert state.pushers['formula'].reports
+    assert all(isinstance(r, FormulaReport) for r in state.pushers['formula'].reports)
+    assert set(handler.report_routes) == {PowerReport, FormulaReport}
+
+
+def test_handler_sends_the_reports_of_a_tick_in_a_single_batch():
+    """
+    Test that the batch mode sends the same reports as the individual mode, with one message per pusher and tick.
+    """
+    reports = gen_hwpc_reports(30)
+    _, state = run_formula(gen_formula_config(), reports)
+    _, batch_state = run_formula(gen_formula_config(report_batch=True), reports)
+
+    batches = batch_state.pushers['power'].reports
+    assert all(isinstance(batch, ReportBatch) for batch in batches)
+    assert len({batch.reports[0].timestamp for batch in batches}) == len(batches)
+    batch_reports = [(r.timestamp, r.target, r.power) for batch in batches for r in batch.reports]
+    assert batch_reports == [(r.timestamp, r.target, r.power) for r in state.pushers['power'].reports]
+
+
+def test_columnar_batch_expands_into_the_original_power_reports():
+    """
+    Test that the columnar batches of a tick are expanded into the power reports they were generated from.
+    """
+    timestamp = datetime(2024, 1, 1)
+    power_reports = [
+        PowerReport(timestamp, 'sensor', 'a', 12.0, {'scope': 'cpu', 'socket': '0', 'formula': 'f1', 'ratio': 0.6}),
+        PowerReport(timestamp, 'sensor', 'other', 8.0, {'scope': 'cpu', 'socket': '0', 'formula': 'f1', 'ratio': 0.4, 'targets_count': 3}),
+    ]
+    formula_report = FormulaReport(timestamp, 'sensor', 'f1', {'scope': 'cpu', 'socket': '0'})
+    batches = gen_report_batches('dispatcher', [*power_reports, formula_report], 'columnar')
+
+    assert isinstance(batches[0], ColumnarPowerReportBatch)
+    assert batches[0].targets == ['a', 'other']
+    assert batches[0].powers == [12.0, 8.0]
+    assert batches[0].ratios == [0.6, 0.4]
+    assert batches[0].metadata == {'scope': 'cpu', 'socket': '0'}
+    assert batches[0].targets_metadata == [{}, {'targets_count': 3}]
+    assert batches[0].to_reports() == power_reports
+    assert isinstance(batches[1], ReportBatch)
+    assert batches[1].to_reports() == [formula_report]
@@ -0,0 +1,80 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+
+from smartwatts.handler import TargetsPowerReducer
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def test_reducer_keeps_the_top_k_targets():
+    """
+    Test that the reducer keeps the most consuming targets in their original order and folds the others.
+    """
+    reducer = TargetsPowerReducer(top_k=2)
+    kept_indices, other_power, other_ratio, other_count = reducer.reduce(np.array([1.0, 5.0, 0.5, 3.0]), np.array([0.1, 0.5, 0.05, 0.3]))
+
+    assert kept_indices.tolist() == [1, 3]
+    assert other_power == pytest.approx(1.5)
+    assert other_ratio == pytest.approx(0.15)
+    assert other_count == 2
+
+
+def test_reducer_folds_the_targets_below_the_thresholds():
+    """
+    Test that the reducer folds the targets below the power or ratio thresholds.
+    """
+    reducer = TargetsPowerReducer(min_power=1.0, min_ratio=0.2)
+    kept_indices, other_power, _, other_count = reducer.reduce(np.array([1.0, 5.0, 0.5, 3.0]), np.array([0.1, 0.5, 0.05, 0.3]))
+
+    assert kept_indices.tolist() == [1, 3]
+    assert other_power == pytest.approx(1.5)
+    assert other_count == 2
+    assert not TargetsPowerReducer().enabled
+
+
+def test_handler_reports_the_folded_targets_as_other():
+    """
+    Test that the reduced power reports of a tick carry the same total power as the complete ones.
+    """
+    reports = gen_hwpc_reports(30)
+    _, state = run_formula(gen_formula_config(), reports)
+    _, reduced_state = run_formula(gen_formula_config(output_top_k=1), reports)
+
+    def targets_power(pushed_reports):
+        return [r.power for r in pushed_reports if r.target not in ('rapl', 'global')]
+
+    reduced_reports = [r for r in reduced_state.pushers['power'].reports if r.target not in ('rapl', 'global')]
+    assert {r.target for r in reduced_reports} <= {'a', 'b', 'other'}
+    assert any(r.target == 'other' and r.metadata['targets_count'] == 1 for r in reduced_reports)
+    assert sum(targets_power(reduced_state.pushers['power'].reports)) == pytest.approx(sum(targets_power(state.pushers['power'].reports)))
@@ -0,0 +1,91 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from powerapi.report import PowerReport
+
+from smartwatts.handler import EnergyCounters, PowerReportsDownsampler, TargetsPowerRollup
+
+from .helpers import gen_formula_config, gen_hwpc_reports, run_formula
+
+
+def test_rollup_aggregates_the_targets_at_each_depth():
+    """
+    Test that the rollup aggregates the targets sharing the same prefix at each configured depth.
+    """
+    rollup = TargetsPowerRollup([2, 1])
+    targets = ['/kubepods/burstable/pod1/ctr1', '/kubepods/burstable/pod2/ctr1', '/kubepods/besteffort/pod3/ctr1', '/system.slice']
+    nodes = rollup.rollup(targets, np.array([1.0, 2.0, 4.0, 8.0]), np.array([0.1, 0.2, 0.4, 0.8]))
+
+    assert sorted((name, depth, power, count) for name, depth, power, _, count in nodes) == [
+        ('/kubepods', 1, 7.0, 3),
+        ('/kubepods/besteffort', 2, 4.0, 1),
+        ('/kubepods/burstable', 2, 3.0, 2),
+        ('/system.slice', 1, 8.0, 1),
+    ]
+
+
+def test_handler_emits_the_rollup_power_reports():
+    """
+    Test that the handler emits the power reports of the hierarchy nodes in addition to the targets ones.
+    """
+    _, state = run_formula(gen_formula_config(rollup_depths=[1]), gen_hwpc_reports(30, targets=('/pods/a', '/pods/b')))
+
+    targets_power = {}
+    for report in state.pushers['power'].reports:
+        if report.target in ('/pods/a', '/pods/b'):
+            targets_power[report.timestamp] = targets_power.get(report.timestamp, 0.0) + report.power
+
+    nodes_power = {r.timestamp: r.power for r in state.pushers['power'].reports if r.target == '/pods' and r.metadata['rollup_depth'] == 1}
+    assert nodes_power
+    assert nodes_power == pytest.approx({timestamp: targets_power[timestamp] for timestamp in nodes_power})
+
+
+def test_rollup_nodes_are_not_mixed_with_the_targets_of_the_same_name():
+    """
+    Test that the downsampling and the energy counters keep the series of a rollup node apart from the series of the
+    target having the same name.
+    """
+    downsampler = PowerReportsDownsampler(timedelta(seconds=10))
+    counters = EnergyCounters(timedelta(seconds=1))
+    start = datetime(2024, 1, 1)
+    for second in range(10):
+        target_report = PowerReport(start + timedelta(seconds=second), 'sensor', '/pods', 2.0, {'scope': 'cpu', 'socket': '0', 'ratio': 0.2})
+        node_report = PowerReport(start + timedelta(seconds=second), 'sensor', '/pods', 6.0, {'scope': 'cpu', 'socket': '0', 'ratio': 0.6, 'rollup_depth': 1})
+        for report in (target_report, node_report):
+            counters.update(report)
+            downsampler.add(report)
+
+    assert [(r.power, r.metadata.get('rollup_depth'), r.metadata['samples']) for r in downsampler.flush()] == [(2.0, None, 10), (6.0, 1, 10)]
+    assert counters.counters == {('/pods', 'cpu', '0', None): 20.0, ('/pods', 'cpu', '0', 1): 60.0}
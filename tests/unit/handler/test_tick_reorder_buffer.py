@@ -0,0 +1,153 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from datetime import datetime, timedelta
+
+import pytest
+from powerapi.report import HWPCReport
+
+from smartwatts.handler import TickReorderBuffer
+
+
+def gen_report(second: int, target: str) -> HWPCReport:
+    """
+    Generate an empty HWPC report for the given tick and target.
+    """
+    return HWPCReport(datetime(2024, 1, 1) + timedelta(seconds=second), 'sensor', target, {}, {})
+
+
+def test_tick_reorder_buffer_count_mode_releases_oldest_tick_after_depth():
+    """
+    Test that in count mode the oldest tick is released once more than `depth` ticks are buffered.
+    """
+    buffer = TickReorderBuffer('count', depth=2)
+    for second in range(3):
+        buffer.add(gen_report(second, 'all'))
+        if second < 2:
+            assert not buffer.pop_ready_ticks()
+
+    ready_ticks = buffer.pop_ready_ticks()
+    assert [timestamp.second for timestamp, _ in ready_ticks] == [0]
+    assert len(buffer) == 2
+
+
+def test_tick_reorder_buffer_event_time_mode_reorders_ticks():
+    """
+    Test that in event-time mode the ticks are released in chronological order once the watermark passed them.
+    """
+    buffer = TickReorderBuffer('event-time', lateness=timedelta(seconds=2))
+    for second in [1, 0, 2]:
+        buffer.add(gen_report(second, 'all'))
+    buffer.add(gen_report(0, 'target'))
+    assert [timestamp.second for timestamp, _ in buffer.pop_ready_ticks()] == [0]
+
+    buffer.add(gen_report(4, 'all'))
+    ready_ticks = buffer.pop_ready_ticks()
+    assert [timestamp.second for timestamp, _ in ready_ticks] == [1, 2]
+
+
+def test_tick_reorder_buffer_drops_late_reports():
+    """
+    Test that the reports of an already released tick are dropped and accounted as late.
+    """
+    buffer = TickReorderBuffer('event-time', lateness=timedelta(seconds=1))
+    buffer.add(gen_report(0, 'all'))
+    buffer.add(gen_report(1, 'all'))
+    ready_ticks = buffer.pop_ready_ticks()
+    assert len(ready_ticks) == 1
+    reports = ready_ticks[0][1]
+
+    assert not buffer.add(gen_report(0, 'target'))
+    assert buffer.late_reports_count == 1
+    assert list(reports) == ['all']
+
+
+def test_tick_reorder_buffer_wall_clock_mode():
+    """
+    Test that in wall-clock mode a tick is released once its first report was received `lateness` ago.
+    """
+    now = 0.0
+    buffer = TickReorderBuffer('wall-clock', lateness=timedelta(milliseconds=500), clock=lambda: now)
+    buffer.add(gen_report(0, 'all'))
+    now = 0.4
+    buffer.add(gen_report(1, 'all'))
+    assert not buffer.pop_ready_ticks()
+
+    now = 0.5
+    assert [timestamp.second for timestamp, _ in buffer.pop_ready_ticks()] == [0]
+
+
+def test_tick_reorder_buffer_bounds_buffered_ticks():
+    """
+    Test that the oldest ticks are released early when the maximum amount of buffered ticks is reached.
+    """
+    buffer = TickReorderBuffer('event-time', lateness=timedelta(hours=1), max_ticks=3)
+    for second in range(5):
+        buffer.add(gen_report(second, 'all'))
+
+    assert [timestamp.second for timestamp, _ in buffer.pop_ready_ticks()] == [0, 1]
+    assert buffer.forced_releases_count == 2
+    assert len(buffer) == 3
+
+
+def test_tick_reorder_buffer_unknown_mode():
+    """
+    Test that an unknown reorder mode is rejected.
+    """
+    with pytest.raises(ValueError, match='Unknown reorder mode'):
+        TickReorderBuffer('unknown')
+
+
+def test_tick_reorder_buffer_adaptive_lateness_follows_observed_lateness():
+    """
+    Test that the adaptive lateness is resized to the percentile of the observed lateness, within its bounds.
+    """
+    buffer = TickReorderBuffer('event-time', lateness=timedelta(seconds=5), adaptive_percentile=90.0,
+                               min_lateness=timedelta(seconds=1), max_lateness=timedelta(seconds=3), lateness_margin=timedelta(seconds=1))
+    for second in range(TickReorderBuffer.ADAPTIVE_UPDATE_INTERVAL):
+        buffer.add(gen_report(second, 'all'))
+        buffer.pop_ready_ticks()
+    # The reports are received in order, only the margin is kept.
+    assert buffer.lateness == timedelta(seconds=1)
+
+    for second in range(TickReorderBuffer.ADAPTIVE_UPDATE_INTERVAL, 3 * TickReorderBuffer.ADAPTIVE_UPDATE_INTERVAL):
+        buffer.add(gen_report(second, 'all'))
+        buffer.add(gen_report(second - 10, 'target'))
+        buffer.pop_ready_ticks()
+    assert buffer.lateness == timedelta(seconds=3)
+    assert buffer.late_reports_count > 0
+
+
+def test_tick_reorder_buffer_adaptive_lateness_not_supported_in_count_mode():
+    """
+    Test that the adaptive lateness is rejected in count mode.
+    """
+    with pytest.raises(ValueError, match='not supported in count mode'):
+        TickReorderBuffer('count', adaptive_percentile=99.0)
@@ -0,0 +1,87 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+
+from smartwatts.metrics import MetricsExporter, MetricsRegistry
+
+
+def test_registry_renders_the_prometheus_text_format():
+    """
+    Test that the registry renders its counters and histograms in the Prometheus text format.
+    """
+    registry = MetricsRegistry({'sensor': 'node"1'})
+    registry.counter('ticks_total', 'Processed ticks').inc(3)
+    histogram = registry.histogram('duration_seconds', 'Stage duration', {'stage': 'predict'})
+    histogram.observe(0.002)
+    histogram.observe(2.0)
+
+    lines = registry.render_prometheus().splitlines()
+
+    assert '# TYPE ticks_total counter' in lines
+    assert 'ticks_total{sensor="node\\"1"} 3.0' in lines
+    assert 'duration_seconds_bucket{sensor="node\\"1",stage="predict",le="0.005"} 1' in lines
+    assert 'duration_seconds_bucket{sensor="node\\"1",stage="predict",le="+Inf"} 2' in lines
+    assert 'duration_seconds_count{sensor="node\\"1",stage="predict"} 2' in lines
+
+
+def test_exporter_writes_the_textfile_at_the_given_interval(tmp_path):
+    """
+    Test that the exporter only writes the textfile once the export interval is elapsed.
+    """
+    now = [0.0]
+    registry = MetricsRegistry()
+    registry.gauge('depth', 'Buffer depth').set(4)
+    exporter = MetricsExporter(registry, 'textfile', 'formula', str(tmp_path), 10.0, lambda: now[0])
+
+    exporter.maybe_export()
+    assert not (tmp_path / 'formula.prom').exists()
+
+    now[0] = 10.0
+    exporter.maybe_export()
+    assert 'depth 4' in (tmp_path / 'formula.prom').read_text(encoding='utf-8')
+
+
+def test_exporter_logs_a_summary_of_the_metrics(caplog):
+    """
+    Test that the exporter logs a one line summary of the metrics with the log output.
+    """
+    registry = MetricsRegistry()
+    registry.counter('ticks_total', 'Processed ticks').inc(3)
+    histogram = registry.histogram('duration_seconds', 'Stage duration', {'stage': 'predict'})
+    histogram.observe(0.5)
+    histogram.observe(1.5)
+    exporter = MetricsExporter(registry, 'log', 'formula')
+
+    with caplog.at_level(logging.INFO):
+        exporter.export()
+
+    assert [record.getMessage() for record in caplog.records] == ['metrics of formula: ticks_total=3 duration_seconds[predict]=count:2,mean:1.000000']
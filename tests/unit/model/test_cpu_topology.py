@@ -63,3 +63,24 @@ def test_cpu_topology_with_133mhz_base_clock():
     assert cpu_topology.get_base_frequency() == 2660
     assert cpu_topology.get_max_frequency() == 3990
     assert cpu_topology.get_supported_frequencies() == [ratio * 133 for ratio in range(10, 30 + 1)]
+
+
+def test_cpu_topology_nearest_supported_frequency():
+    """
+    Test that the nearest supported frequency is the highest supported frequency lower or equal to the given frequency.
+    """
+    cpu_topology = CPUTopology(125, 100, 10, 22, 39)
+    for frequency in range(1000, 3999):
+        expected = max(freq for freq in cpu_topology.get_supported_frequencies() if freq <= frequency)
+        assert cpu_topology.get_nearest_supported_frequency(frequency) == expected
+
+
+def test_cpu_topology_nearest_supported_frequency_is_clamped():
+    """
+    Test that the frequencies outside the supported range are clamped to the minimum/maximum supported frequency.
+    """
+    cpu_topology = CPUTopology(0, 133, 10, 20, 30)
+    assert cpu_topology.get_nearest_supported_frequency(0) == 1330
+    assert cpu_topology.get_nearest_supported_frequency(1329) == 1330
+    assert cpu_topology.get_nearest_supported_frequency(3990) == 3990
+    assert cpu_topology.get_nearest_supported_frequency(10000) == 3990
@@ -0,0 +1,96 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+
+from smartwatts.model import EventSchema
+
+
+def test_event_schema_sorts_events_and_ignores_time_events():
+    """
+    Test that the events schema sorts the events by name and ignores the time events.
+    """
+    schema = EventSchema(['INSTRUCTIONS', 'time_enabled', 'CYCLES', 'time_running', 'LLC_MISSES'])
+    assert schema.events_name == ['CYCLES', 'INSTRUCTIONS', 'LLC_MISSES']
+    assert len(schema) == 3
+
+
+def test_event_schema_matches_events_set():
+    """
+    Test that the events schema only matches the exact set of events it was built from.
+    """
+    schema = EventSchema(['CYCLES', 'INSTRUCTIONS', 'time_enabled'])
+    assert schema.matches({'time_enabled': 0, 'INSTRUCTIONS': 0, 'CYCLES': 0}.keys())
+    assert not schema.matches({'INSTRUCTIONS': 0, 'CYCLES': 0}.keys())
+    assert not schema.matches({'CYCLES': 0, 'INSTRUCTIONS': 0, 'LLC_MISSES': 0, 'time_enabled': 0}.keys())
+
+
+def test_event_schema_extract_events_value_sums_cpus():
+    """
+    Test that the events value of each CPU are summed and stored following the schema layout.
+    """
+    schema = EventSchema(['INSTRUCTIONS', 'CYCLES', 'time_enabled'])
+    cpus_events = {
+        '0': {'CYCLES': 1, 'INSTRUCTIONS': 10, 'time_enabled': 100},
+        '1': {'INSTRUCTIONS': 20, 'CYCLES': 2, 'time_enabled': 100},
+    }
+    row = np.zeros(len(schema))
+    schema.extract_events_value(cpus_events, out=row)
+    assert row.tolist() == [3.0, 30.0]
+
+
+def test_event_schema_extract_events_value_single_event():
+    """
+    Test that the events value extraction works when the schema contains a single event.
+    """
+    schema = EventSchema(['CYCLES', 'time_enabled'])
+    row = np.zeros(len(schema))
+    schema.extract_events_value({'0': {'CYCLES': 1}, '1': {'CYCLES': 2}}, out=row)
+    assert row.tolist() == [3.0]
+
+
+def test_event_schema_extract_events_value_missing_event():
+    """
+    Test that the events value extraction raise an exception when an event of the schema is missing.
+    """
+    schema = EventSchema(['CYCLES', 'INSTRUCTIONS'])
+    with pytest.raises(KeyError):
+        schema.extract_events_value({'0': {'CYCLES': 1}}, out=np.zeros(len(schema)))
+
+
+def test_event_schema_events_matrix_is_reused():
+    """
+    Test that the events matrix is preallocated and only grown when more rows are requested.
+    """
+    schema = EventSchema(['CYCLES', 'INSTRUCTIONS'])
+    matrix = schema.events_matrix(4)
+    assert matrix.shape == (4, 2)
+    assert np.shares_memory(matrix, schema.events_matrix(2))
+    assert schema.events_matrix(16).shape == (16, 2)
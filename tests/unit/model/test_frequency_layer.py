@@ -0,0 +1,130 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pickle
+
+import numpy as np
+
+from smartwatts.model import ElasticNetLearner, FrequencyLayer, RecursiveLeastSquaresLearner
+
+
+def _gen_stored_layer(learner=None) -> FrequencyLayer:
+    """
+    Generate a trained frequency layer, as restored from a model store snapshot.
+    """
+    layer = FrequencyLayer(2000, 2, 10, 10, learner=learner)
+    for i in range(10):
+        layer.store_sample_in_history(10.0 + i, [float(i), float(2 * i)])
+    layer.update_power_model(0.0, 100.0)
+    return pickle.loads(pickle.dumps(layer))
+
+
+def test_frequency_layer_release_history_keeps_power_model():
+    """
+    Test that releasing the history of a frequency layer keeps its learned power model.
+    """
+    layer = FrequencyLayer(2000, 2, 10, 10)
+    for i in range(10):
+        layer.store_sample_in_history(10.0 + i, [float(i), float(2 * i)])
+        layer.store_error_in_history(1.0)
+    layer.update_power_model(0.0, 100.0)
+    model_id = layer.model.id
+
+    layer.release_history()
+
+    assert len(layer.samples_history) == 0
+    assert len(layer.error_history) == 0
+    assert model_id > 0
+    assert layer.model.id == model_id
+    assert layer.model.predict_power_consumption([1.0, 2.0]) > 0.0
+
+
+def test_frequency_layer_asynchronous_learning():
+    """
+    Test that the power model learned asynchronously is only applied once requested, and that concurrent learning
+    requests are coalesced.
+    """
+    layer = FrequencyLayer(2000, 2, 10, 10)
+    for i in range(10):
+        layer.store_sample_in_history(10.0 + i, [float(i), float(2 * i)])
+
+    with ThreadPoolExecutor(1) as executor:
+        layer.update_power_model(0.0, 100.0, executor)
+        pending_power_model = layer.pending_power_model
+        layer.update_power_model(0.0, 100.0, executor)
+        assert layer.pending_power_model is pending_power_model
+        assert layer.model.id == 0
+
+        pending_power_model.result()
+
+    layer.apply_pending_power_model()
+    assert layer.pending_power_model is None
+    assert layer.model.id == 1
+    assert layer.model.hash != 'uninitialized'
+
+
+def test_frequency_layer_restore_uses_the_current_configuration():
+    """
+    Test that a restored frequency layer keeps the samples window and minimum samples of the current configuration.
+    """
+    stored_layer = _gen_stored_layer()
+
+    layer = FrequencyLayer(2000, 20, 4, 10, 'float32')
+    layer.restore(stored_layer.model, stored_layer.samples_history)
+
+    assert layer.model.min_samples == 20
+    assert layer.model.id == stored_layer.model.id
+    assert layer.model.hash == stored_layer.model.hash
+    assert layer.model.predict_power_consumption([1.0, 2.0]) == stored_layer.model.predict_power_consumption([1.0, 2.0])
+    assert layer.samples_history.max_length == 4
+    assert layer.samples_history.events_values.dtype == np.float32
+    assert layer.samples_history.power_values.tolist() == [16.0, 17.0, 18.0, 19.0]
+
+
+def test_frequency_layer_restore_ignores_the_state_of_a_different_learner():
+    """
+    Test that the state of the stored learner is only reused when it has the same configuration as the current one.
+    """
+    stored_layer = _gen_stored_layer(RecursiveLeastSquaresLearner(0.99))
+
+    same_layer = FrequencyLayer(2000, 2, 10, 10, learner=RecursiveLeastSquaresLearner(0.99))
+    same_layer.restore(stored_layer.model, None)
+    assert same_layer.model.learner is stored_layer.model.learner
+
+    other_factor_layer = FrequencyLayer(2000, 2, 10, 10, learner=RecursiveLeastSquaresLearner(0.9))
+    other_factor_layer.restore(stored_layer.model, stored_layer.samples_history)
+    assert other_factor_layer.model.learner.forgetting_factor == 0.9
+    assert other_factor_layer.model.learner.samples_count == len(stored_layer.samples_history)
+
+    other_method_layer = FrequencyLayer(2000, 2, 10, 10, learner=ElasticNetLearner())
+    other_method_layer.restore(stored_layer.model, stored_layer.samples_history)
+    assert isinstance(other_method_layer.model.learner, ElasticNetLearner)
+    assert other_method_layer.model.id == stored_layer.model.id
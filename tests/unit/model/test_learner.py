@@ -0,0 +1,107 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+
+import numpy as np
+
+from smartwatts.model import ElasticNetLearner, RecursiveLeastSquaresLearner, PowerModel, ReportHistory
+
+
+def generate_samples(coefficients, intercept, count, seed=0):
+    """
+    Generate samples of a linear power model with hardware counters like magnitudes.
+    """
+    rng = np.random.default_rng(seed)
+    events_values = rng.uniform(1e8, 1e9, size=(count, len(coefficients)))
+    power_values = events_values @ np.array(coefficients) + intercept
+    return events_values, power_values
+
+
+def test_elasticnet_learner_fit_positive_model():
+    """
+    Test that the ElasticNet learner fits a model with positive coefficients.
+    """
+    events_values, power_values = generate_samples([2e-8, 5e-8], 10.0, 60)
+    model = ElasticNetLearner().fit(events_values, power_values, fit_intercept=True)
+
+    assert all(model.coef_ >= 0.0)
+
+
+def test_recursive_least_squares_learner_recovers_linear_model():
+    """
+    Test that the recursive least squares learner recovers the coefficients of a linear model.
+    """
+    events_values, power_values = generate_samples([2e-8, 5e-8, 1e-8], 10.0, 200)
+    learner = RecursiveLeastSquaresLearner(forgetting_factor=1.0, regularization=1e-9)
+    for events_value, power_reference in zip(events_values, power_values, strict=True):
+        learner.partial_fit(events_value, power_reference)
+
+    model = learner.current_model()
+    assert learner.samples_count == 200
+    assert np.allclose(model.coef_, [2e-8, 5e-8, 1e-8], rtol=1e-3)
+    assert math.isclose(model.intercept_, 10.0, rel_tol=1e-2)
+    assert np.allclose(model.predict(events_values[:5]), power_values[:5], rtol=1e-4)
+
+
+def test_recursive_least_squares_learner_coefficients_are_non_negative():
+    """
+    Test that the coefficients of the recursive least squares learner are constrained to be non-negative.
+    """
+    events_values, power_values = generate_samples([2e-8, -5e-8], 100.0, 100)
+    model = RecursiveLeastSquaresLearner().fit(events_values, power_values, fit_intercept=True)
+
+    assert all(model.coef_ >= 0.0)
+
+
+def test_recursive_least_squares_learner_forgets_old_samples():
+    """
+    Test that the recursive least squares learner follows a change of the power model.
+    """
+    learner = RecursiveLeastSquaresLearner(forgetting_factor=0.9)
+    learner.fit(*generate_samples([2e-8, 5e-8], 10.0, 100, seed=1), fit_intercept=True)
+    model = learner.fit(*generate_samples([4e-8, 1e-8], 20.0, 200, seed=2), fit_intercept=True)
+
+    assert np.allclose(model.coef_, [4e-8, 1e-8], rtol=1e-2)
+
+
+def test_power_model_with_online_learner():
+    """
+    Test that a power model using an online learner publishes the model of the learner.
+    """
+    events_values, power_values = generate_samples([2e-8, 5e-8], 10.0, 20)
+    model = PowerModel(2000, 10, RecursiveLeastSquaresLearner())
+    history = ReportHistory(60)
+    for events_value, power_reference in zip(events_values, power_values, strict=True):
+        history.store_report(power_reference, events_value)
+        model.learner.partial_fit(events_value, power_reference)
+
+    model.learn_power_model(history, 0.0, 100.0)
+    assert model.id == 1
+    assert np.allclose(model.predict_power_consumption_batch(events_values), power_values, rtol=1e-2)
@@ -0,0 +1,115 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+
+import numpy as np
+
+from smartwatts.model import FrequencyLayer, PowerModelStore
+
+
+def _gen_trained_layers() -> dict[int, FrequencyLayer]:
+    """
+    Generate a trained and an untrained frequency layer.
+    """
+    trained_layer = FrequencyLayer(2000, 2, 10, 10)
+    for i in range(10):
+        trained_layer.store_sample_in_history(10.0 + i, [float(i), float(2 * i)])
+    trained_layer.update_power_model(0.0, 100.0)
+
+    untrained_layer = FrequencyLayer(2100, 2, 10, 10)
+    untrained_layer.store_sample_in_history(10.0, [1.0, 2.0])
+    return {2000: trained_layer, 2100: untrained_layer}
+
+
+def test_model_store_load_missing_snapshot_returns_none(tmp_path):
+    """
+    Test that loading a snapshot that have never been saved returns None.
+    """
+    assert PowerModelStore(str(tmp_path)).load('sensor-0-cpu') is None
+
+
+def test_model_store_save_and_load_power_models(tmp_path):
+    """
+    Test that the trained power models are restored from a snapshot, without their samples history.
+    """
+    store = PowerModelStore(str(tmp_path / 'models'))
+    layers = _gen_trained_layers()
+    store.save('sensor-0-cpu', layers, frozenset({'a', 'b'}))
+
+    snapshot = store.load('sensor-0-cpu')
+
+    assert snapshot['events'] == frozenset({'a', 'b'})
+    assert list(snapshot['layers']) == [2000]
+    model, samples_history = snapshot['layers'][2000]
+    assert samples_history is None
+    assert model.id == layers[2000].model.id
+    assert model.hash == layers[2000].model.hash
+    assert model.predict_power_consumption([1.0, 2.0]) == layers[2000].model.predict_power_consumption([1.0, 2.0])
+
+
+def test_model_store_save_and_load_samples_history(tmp_path):
+    """
+    Test that the samples history of every layer is restored from a snapshot when requested.
+    """
+    store = PowerModelStore(str(tmp_path), include_history=True)
+    layers = _gen_trained_layers()
+    store.save('sensor-0-cpu', layers, None)
+
+    snapshot = store.load('sensor-0-cpu')
+
+    assert sorted(snapshot['layers']) == [2000, 2100]
+    _, samples_history = snapshot['layers'][2000]
+    assert samples_history.max_length == 10
+    assert np.array_equal(samples_history.events_values, layers[2000].samples_history.events_values)
+    assert np.array_equal(samples_history.power_values, layers[2000].samples_history.power_values)
+
+
+def test_model_store_save_overwrites_snapshot_atomically(tmp_path):
+    """
+    Test that saving a snapshot replaces the previous one without leaving temporary files behind.
+    """
+    store = PowerModelStore(str(tmp_path))
+    store.save('sensor-0-cpu', {}, None)
+    store.save('sensor-0-cpu', _gen_trained_layers(), None)
+
+    assert os.listdir(tmp_path) == ['sensor-0-cpu.pkl']
+    assert list(store.load('sensor-0-cpu')['layers']) == [2000]
+
+
+def test_model_store_ignores_corrupted_snapshot(tmp_path):
+    """
+    Test that a corrupted snapshot is ignored.
+    """
+    store = PowerModelStore(str(tmp_path))
+    with open(store.get_snapshot_path('sensor-0-cpu'), 'wb') as file:
+        file.write(b'corrupted')
+
+    assert store.load('sensor-0-cpu') is None
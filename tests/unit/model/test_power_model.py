@@ -28,6 +28,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import math
+
+import numpy as np
+import pytest
+from sklearn.exceptions import NotFittedError
+
 from smartwatts.model import PowerModel
 
 
@@ -125,3 +130,53 @@ def test_cap_power_estimation_with_nonzero_intercept():
     power, ratio = model.cap_power_estimation(20.0, 110.0)
     assert math.isclose(power, 10.0 + (ratio * model.clf.intercept_))
     assert math.isclose(ratio, 0.1)
+
+
+def test_cap_power_estimations_matches_scalar_version():
+    """
+    Test that the vectorized capping of the power estimations gives the same results as the scalar version.
+    """
+    model = PowerModel(0, 0)
+    model.clf.intercept_ = 10.0
+
+    raw_targets_power = np.array([-200.0, 0.0, 5.0, 20.0, 110.0, 220.0])
+    powers, ratios = model.cap_power_estimations(raw_targets_power, 110.0)
+    for raw_target_power, power, ratio in zip(raw_targets_power, powers, ratios, strict=True):
+        expected_power, expected_ratio = model.cap_power_estimation(raw_target_power, 110.0)
+        assert math.isclose(power, expected_power)
+        assert math.isclose(ratio, expected_ratio)
+
+
+def test_cap_power_estimations_when_intercept_greater_than_total_power():
+    """
+    Test that the vectorized capping returns 0 for every target when the intercept is greater than the global power.
+    """
+    model = PowerModel(0, 0)
+    model.clf.intercept_ = 200.0
+
+    powers, ratios = model.cap_power_estimations(np.array([50.0, 100.0]), 100.0)
+    assert powers.tolist() == [0.0, 0.0]
+    assert ratios.tolist() == [0.0, 0.0]
+
+
+def test_predict_power_consumption_batch_matches_predict():
+    """
+    Test that the batched power estimation gives the same results as the per-sample power estimation.
+    """
+    model = PowerModel(0, 0)
+    model.clf.fit([[1.0, 2.0], [2.0, 1.0], [3.0, 5.0], [4.0, 2.0]], [10.0, 11.0, 20.0, 18.0])
+
+    events = np.array([[1.0, 1.0], [10.0, 20.0], [0.0, 0.0]])
+    powers = model.predict_power_consumption_batch(events)
+    for row, power in zip(events, powers, strict=True):
+        assert math.isclose(power, model.predict_power_consumption(row.tolist()))
+
+
+def test_predict_power_consumption_batch_raise_when_not_fitted():
+    """
+    Test that the batched power estimation raise an exception when the model haven't been fitted.
+    """
+    model = PowerModel(0, 0)
+
+    with pytest.raises(NotFittedError):
+        model.predict_power_consumption_batch(np.array([[1.0, 2.0]]))
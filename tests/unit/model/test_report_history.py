@@ -27,7 +27,12 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from smartwatts.model import ReportHistory
+import math
+from statistics import median, mean
+
+import numpy as np
+
+from smartwatts.model import ReportHistory, ErrorHistory
 
 
 def test_report_history_max_length_limit():
@@ -42,5 +47,89 @@ def test_report_history_max_length_limit():
     assert len(history) == history.max_length
     assert len(history.events_values) == history.max_length
     assert len(history.power_values) == history.max_length
-    assert list(history.events_values) == [[4, 5, 6], [7, 8, 9]]
-    assert list(history.power_values) == [2, 3]
+    assert history.events_values.tolist() == [[4, 5, 6], [7, 8, 9]]
+    assert history.power_values.tolist() == [2, 3]
+
+
+def test_report_history_keeps_samples_ordered_after_wrap_around():
+    """
+    Test that the samples are returned from the oldest to the newest after overriding the oldest samples several times.
+    """
+    history = ReportHistory(max_length=3)
+    for i in range(10):
+        history.store_report(i, [i, i * 10])
+
+    assert history.events_values.tolist() == [[7, 70], [8, 80], [9, 90]]
+    assert history.power_values.tolist() == [7, 8, 9]
+
+
+def test_report_history_returns_views_of_the_buffer():
+    """
+    Test that the samples are exposed without copying the underlying buffer.
+    """
+    history = ReportHistory(max_length=4)
+    for i in range(6):
+        history.store_report(i, [i, i])
+
+    view = history.events_values
+    assert not view.flags.owndata
+    assert np.shares_memory(view, history.events_values)
+    assert view.tolist() == [[2, 2], [3, 3], [4, 4], [5, 5]]
+
+    # the new sample overwrites the oldest one in the buffer, in place, so the view taken before reflects it
+    history.store_report(6, [6, 6])
+    assert view.tolist() == [[6, 6], [3, 3], [4, 4], [5, 5]]
+    assert history.events_values.tolist() == [[3, 3], [4, 4], [5, 5], [6, 6]]
+    assert np.shares_memory(view, history.events_values)
+
+
+def test_report_history_float32_dtype():
+    """
+    Test that the samples are stored using the requested data type.
+    """
+    history = ReportHistory(max_length=2, dtype=np.float32)
+    history.store_report(1.5, [1, 2, 3])
+
+    assert history.events_values.dtype == np.float32
+    assert history.power_values.dtype == np.float32
+
+
+def test_report_history_clear():
+    """
+    Test that clearing the report history removes all the stored samples.
+    """
+    history = ReportHistory(max_length=2)
+    history.store_report(1, [1, 2, 3])
+    history.clear()
+
+    assert len(history) == 0
+    assert history.events_values.shape[0] == 0
+    assert history.power_values.shape[0] == 0
+
+
+def test_error_history_compute_error_matches_statistics():
+    """
+    Test that the error computed from the history matches the median/mean of the stored errors.
+    """
+    history = ErrorHistory(max_length=5)
+    errors = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+    for error in errors:
+        history.store_error(error)
+
+    assert len(history) == history.max_length
+    assert math.isclose(history.compute_error('median'), median(errors[-5:]))
+    assert math.isclose(history.compute_error('mean'), mean(errors[-5:]))
+
+
+def test_error_history_clear():
+    """
+    Test that clearing the error history removes all the stored errors.
+    """
+    history = ErrorHistory(max_length=3)
+    history.store_error(10.0)
+    history.clear()
+    history.store_error(1.0)
+
+    assert len(history) == 1
+    assert math.isclose(history.compute_error('mean'), 1.0)
+    assert math.isclose(history.compute_error('median'), 1.0)
@@ -0,0 +1,127 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+import random
+from collections import deque
+from statistics import median, mean
+
+import pytest
+
+from smartwatts.model import RollingMean, RollingMedian, ErrorHistory
+
+
+def feed_sliding_window(estimator, values, window_size):
+    """
+    Feed the given values to the estimator using a sliding window, yielding the window after each insertion.
+    """
+    window = deque()
+    for value in values:
+        if len(window) == window_size:
+            estimator.remove_oldest(window.popleft())
+        estimator.add(value)
+        window.append(value)
+        yield window
+
+
+@pytest.mark.parametrize('window_size', [1, 2, 5, 60, 600])
+def test_rolling_median_matches_statistics_median(window_size):
+    """
+    Test that the rolling median matches the median of the sliding window, including with duplicated values.
+    """
+    rng = random.Random(window_size)
+    values = [rng.choice([rng.random(), float(rng.randint(0, 5))]) for _ in range(3 * window_size + 50)]
+    estimator = RollingMedian()
+    for window in feed_sliding_window(estimator, values, window_size):
+        assert len(estimator) == len(window)
+        assert math.isclose(estimator.value(), median(window))
+
+
+def test_rolling_median_with_monotonic_values_stays_bounded():
+    """
+    Test that the values leaving the window are eventually discarded when they never reach the top of their heap.
+    """
+    estimator = RollingMedian()
+    for window in feed_sliding_window(estimator, [float(i) for i in range(10000)], 10):
+        assert estimator.value() == median(window)
+
+    assert estimator.stored_values_count < 100
+
+
+@pytest.mark.parametrize('window_size', [1, 7, 60])
+def test_rolling_mean_matches_statistics_mean(window_size):
+    """
+    Test that the rolling mean matches the mean of the sliding window.
+    """
+    rng = random.Random(window_size)
+    values = [rng.uniform(0.0, 1000.0) for _ in range(10 * window_size)]
+    estimator = RollingMean()
+    for window in feed_sliding_window(estimator, values, window_size):
+        assert math.isclose(estimator.value(), mean(window), rel_tol=1e-12)
+
+
+@pytest.mark.parametrize('estimator_cls', [RollingMean, RollingMedian])
+def test_rolling_estimator_clear(estimator_cls):
+    """
+    Test that clearing the estimator removes all the values of the window.
+    """
+    estimator = estimator_cls()
+    for value in [5.0, 1.0, 3.0]:
+        estimator.add(value)
+    estimator.clear()
+
+    assert len(estimator) == 0
+    assert estimator.value() == 0.0
+
+    estimator.add(2.0)
+    estimator.add(4.0)
+    estimator.remove_oldest(2.0)
+    assert estimator.value() == 4.0
+
+
+@pytest.mark.parametrize('method', ['median', 'mean'])
+def test_error_history_uses_configured_estimator(method):
+    """
+    Test that the error history computes the error of the window using the configured method.
+    """
+    reference = {'median': median, 'mean': mean}[method]
+    history = ErrorHistory(max_length=4, method=method)
+    errors = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0]
+    for error in errors:
+        history.store_error(error)
+
+    assert math.isclose(history.compute_error(), reference(errors[-4:]))
+
+
+def test_error_history_unknown_method():
+    """
+    Test that creating an error history with an unknown method raise an exception.
+    """
+    with pytest.raises(ValueError, match='Unknown method'):
+        ErrorHistory(max_length=4, method='mode')
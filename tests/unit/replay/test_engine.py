@@ -0,0 +1,94 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from datetime import datetime, timedelta
+
+from powerapi.report import HWPCReport, PowerReport, FormulaReport
+
+from smartwatts.actor import SmartWattsFormulaConfig, SmartWattsFormulaScope
+from smartwatts.model import CPUTopology
+from smartwatts.replay import SmartWattsReplayEngine, ReplayPusher
+
+
+class FakeDatabase:
+    """
+    Database storing the saved reports in memory.
+    """
+
+    def __init__(self):
+        self.saved_reports = []
+        self.save_many_calls = 0
+
+    def save_many(self, reports):
+        """
+        Store the given reports.
+        """
+        self.saved_reports.extend(reports)
+        self.save_many_calls += 1
+
+
+def gen_hwpc_reports(ticks_count: int, sockets: list[str]) -> list[HWPCReport]:
+    """
+    Generate the HwPC reports of a sensor monitoring two targets.
+    """
+    reports = []
+    for i in range(ticks_count):
+        timestamp = datetime(2024, 1, 1) + timedelta(seconds=i)
+        rapl = {socket: {'0': {'RAPL_ENERGY_PKG': (20 + i % 7) * 2**32, 'RAPL_ENERGY_DRAM': 5 * 2**32}} for socket in sockets}
+        msr = {socket: {'0': {'APERF': 1000, 'MPERF': 1000, 'TSC': 1}} for socket in sockets}
+        reports.append(HWPCReport(timestamp, 'sensor', 'all', {'rapl': rapl, 'msr': msr}, {}))
+        for target in ['a', 'b']:
+            core = {socket: {'0': {'CYCLES': 1000.0 * (i % 5 + 1), 'INSTRUCTIONS': 500.0 * (i % 3 + 1)}} for socket in sockets}
+            reports.append(HWPCReport(timestamp, 'sensor', target, {'core': core}, {}))
+    return reports
+
+
+def test_replay_engine_processes_each_socket_and_saves_by_chunks():
+    """
+    Test that the replay engine creates a formula per socket and saves the generated reports by chunks.
+    """
+    cpu_topology = CPUTopology(125, 100, 1, 21, 100)
+    config = SmartWattsFormulaConfig(SmartWattsFormulaScope.CPU, 1000, 'RAPL_ENERGY_PKG', 2.0, cpu_topology, 10, 60, False, 60, 'median')
+    power_database = FakeDatabase()
+    formula_database = FakeDatabase()
+    pushers = {'power': ReplayPusher('power', PowerReport, power_database), 'formula': ReplayPusher('formula', FormulaReport, formula_database)}
+    reports = gen_hwpc_reports(30, ['0', '1'])
+
+    engine = SmartWattsReplayEngine({'cpu_dispatcher': config}, pushers, chunk_size=30)
+    engine.process(reports)
+    engine.close()
+
+    assert sorted(engine.handlers) == [('cpu_dispatcher', 'sensor', '0'), ('cpu_dispatcher', 'sensor', '1')]
+    assert engine.processed_reports_count == len(reports)
+    assert power_database.save_many_calls == 3
+    assert all(isinstance(report, PowerReport) for report in power_database.saved_reports)
+    assert all(isinstance(report, FormulaReport) for report in formula_database.saved_reports)
+    # 25 ticks are processed per socket, the last 5 ticks are kept to wait for delayed reports.
+    assert len([report for report in power_database.saved_reports if report.target == 'rapl']) == 2 * 25